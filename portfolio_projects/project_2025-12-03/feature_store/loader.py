@@ -1,22 +1,153 @@
 # feature_store/loader.py
+import csv
+import os
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+# 선언한 dtype 문자열 → Arrow 타입 (CSV 를 읽는 시점에 바로 변환)
+_ARROW_TYPES = {
+    "int32": pa.int32(),
+    "int64": pa.int64(),
+    "float32": pa.float32(),
+    "float64": pa.float64(),
+    "str": pa.string(),
+    "string": pa.string(),
+    "category": pa.dictionary(pa.int32(), pa.string()),
+    "datetime64[ns]": pa.timestamp("ns"),
+}
+
 
 class FeatureLoader:
-    """원천 로그 로더 클래스"""
+    """원천 로그 로더 클래스
+
+    선언된 schema 로 필요한 컬럼만, 처음부터 최종 dtype 으로 읽습니다.
+    - id: int32 (int64 / object 대비 메모리 절반 이하)
+    - event_type: category (Arrow dictionary → pandas category)
+    - ts: datetime64 (문자열로 읽은 뒤 pd.to_datetime 하는 단계 없음)
+    """
+
+    SCHEMA = {
+        'user_id': 'int32',
+        'item_id': 'int32',
+        'event_type': 'category',
+        'ts': 'datetime64[ns]',
+    }
+    REQUIRED_COLS = ('user_id', 'item_id', 'event_type', 'ts')
+
+    def __init__(self, schema=None):
+        """
+        schema: {컬럼: dtype} (기본값 FeatureLoader.SCHEMA).
+            지원 dtype: int32 / int64 / float32 / float64 / str / category / datetime64[ns]
+        """
+        self.schema = dict(self.SCHEMA if schema is None else schema)
+        unknown = {dtype for dtype in self.schema.values() if dtype not in _ARROW_TYPES}
+        if unknown:
+            raise ValueError(f"Unsupported dtypes in schema: {sorted(unknown)}")
+
+    def load_logs(self, path: str, categorical_cols=("event_type",), columns=None,
+                  filters=None, chunksize=None):
+        """CSV 또는 Parquet 파일을 로드하고 기본적인 컬럼 검증을 수행합니다.
 
-    def load_logs(self, path: str):
-        """CSV 파일을 로드하고 기본적인 컬럼 검증을 수행합니다."""
+        categorical_cols: 반복 값이 많은 문자열 컬럼. category(dictionary) 로 읽어
+            행마다 Python 문자열을 두지 않고, 후속 처리를 고유 값 단위로 할 수 있게 합니다.
+        columns: 읽을 컬럼 (기본값: schema 에 선언된 컬럼만)
+        filters: Parquet 전용 [(col, op, value), ...] 조건 (predicate pushdown)
+        chunksize: 지정하면 DataFrame 대신 chunksize 행 단위 DataFrame iterator 반환 (CSV)
+        """
+        schema = dict(self.schema)
+        schema.update({col: 'category' for col in categorical_cols})
+        if columns is None:
+            columns = list(schema)
+
+        if os.path.isdir(path) or path.endswith(".parquet"):
+            if chunksize is not None:
+                raise ValueError("chunksize is only supported for CSV inputs")
+            return self._load_parquet(path, schema, columns, filters)
+        if filters is not None:
+            raise ValueError("filters are only supported for Parquet inputs")
 
         # ======================================
         #             Fill your code
         # ======================================
+        # 본문을 읽기 전에 header 만 먼저 검증
+        header = self.read_header(path)
+        self._check_columns(header, columns)
+
+        convert_options = pa_csv.ConvertOptions(
+            column_types={
+                col: _ARROW_TYPES[dtype]
+                for col, dtype in schema.items() if col in columns
+            },
+            include_columns=columns,
+        )
+
+        if chunksize is not None:
+            return self._iter_csv(path, convert_options, chunksize)
+
+        try:
+            table = pa_csv.read_csv(path, convert_options=convert_options)
+        except Exception as e:
+            raise ValueError(f"Failed to load {path}: {e}")
+
+        return table.to_pandas()
+
+    def read_header(self, path: str) -> list:
+        """CSV 첫 줄(header)만 읽어서 컬럼 목록 반환"""
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                return next(csv.reader(f), [])
+        except Exception as e:
+            raise ValueError(f"Failed to load {path}: {e}")
+
+    def _check_columns(self, available, columns):
+        required_cols = set(self.REQUIRED_COLS) & set(columns)
+        missing = (set(columns) | required_cols) - set(available)
+        if missing:
+            raise ValueError(f"Required columns missing: {sorted(missing)}")
+
+    def _iter_csv(self, path, convert_options, chunksize):
+        """Arrow streaming reader 의 block 을 chunksize 행 DataFrame 으로 다시 묶어서 반환"""
+        try:
+            reader = pa_csv.open_csv(path, convert_options=convert_options)
+        except Exception as e:
+            raise ValueError(f"Failed to load {path}: {e}")
+
+        pending, n_pending = [], 0
+        for batch in reader:
+            pending.append(batch)
+            n_pending += batch.num_rows
+            while n_pending >= chunksize:
+                table = pa.Table.from_batches(pending)
+                yield table.slice(0, chunksize).to_pandas()
+                rest = table.slice(chunksize)
+                pending, n_pending = rest.to_batches(), rest.num_rows
+
+        if n_pending:
+            yield pa.Table.from_batches(pending, schema=reader.schema).to_pandas()
+
+    def _load_parquet(self, path, schema, columns, filters):
+        """Parquet 은 파일 schema 에 dtype 이 있으므로 추론 없이 바로 읽음
+
+        category 컬럼은 Arrow dictionary 로 읽고, 선언된 dtype 과 다른 컬럼만 변환합니다.
+        """
         try:
-            df = pd.read_csv(path)
+            table = pq.read_table(
+                path,
+                columns=columns,
+                filters=filters,
+                read_dictionary=[c for c in columns if schema.get(c) == 'category'],
+            )
         except Exception as e:
             raise ValueError(f"Failed to load {path}: {e}")
 
-        required_cols = {'user_id', 'item_id', 'event_type', 'ts'}
-        if not required_cols.issubset(df.columns):
-            raise ValueError(f"Required columns missing: {required_cols}")
+        self._check_columns(table.column_names, columns)
+        df = table.to_pandas()
 
-        return df
+        casts = {
+            col: dtype for col, dtype in schema.items()
+            if col in df.columns and str(df[col].dtype) != dtype
+        }
+        return df.astype(casts) if casts else df
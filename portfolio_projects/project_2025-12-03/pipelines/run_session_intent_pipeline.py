@@ -6,6 +6,7 @@ sys.path.insert(0, PROJECT_ROOT)
 import logging
 import pandas as pd
 from feature_store.sessionizer import Sessionizer
+from feature_store.doc_builder import SessionDocumentBuilder
 from feature_store.vectorizer import SessionVectorizer
 from feature_store.clusterer import IntentClusterer
 
@@ -31,7 +32,9 @@ if __name__ == "__main__":
     df = sessionizer.assign_sessions(df)
 
     # 3) Session text aggregation
-    session_texts = df.groupby(["user_id", "session_id"])["event_text"].apply(lambda x: " ".join(x))
+    #    sessionizer 출력은 (user_id, event_time) 정렬 → 세션이 연속 구간이므로 한 번에 결합
+    session_docs = SessionDocumentBuilder().build(df, ["user_id", "session_id"], "event_text")
+    session_texts = session_docs.set_index(["user_id", "session_id"])["event_text"]
 
 
     # 4) Vectorize
@@ -0,0 +1,102 @@
+# benchmarks/bench_feature_fusion.py
+"""
+FeatureFusion benchmark: hstack (COO, float64) vs float32 CSR fusion + block 재사용
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_feature_fusion --sessions 200000
+"""
+
+import argparse
+import time
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+from scipy.sparse import hstack
+
+from feature_store.feature_fusion import FeatureFusion
+from feature_store.tfidf_builder import TFIDFBuilder
+
+# intent 별로 자주 나오는 이벤트 문구 (나머지는 공통 문구에서 샘플링)
+INTENT_EVENTS = {
+    0: ["search hybrid suv deals", "compare suv price", "view kona hybrid 2024"],
+    1: ["search ev charging station", "view nearby charger location", "click charger subsidy page"],
+    2: ["add to cart", "apply coupon", "purchase complete"],
+    3: ["view faq page", "contact support chat", "check delivery status"],
+}
+COMMON_EVENTS = [
+    "view main page", "click banner", "scroll product list", "view ioniq 6 battery info",
+    "click car detail page", "view accessory detail page", "search test drive booking",
+]
+
+
+def make_sessions(n_sessions: int, seed: int = 42) -> pd.DataFrame:
+    """session_intents.csv 모양의 합성 데이터 (session_text / 통계 4개 / intent_label)"""
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, len(INTENT_EVENTS), n_sessions)
+    lengths = rng.integers(2, 12, n_sessions)
+
+    texts = []
+    for label, length in zip(labels, lengths):
+        n_intent = rng.binomial(length, 0.4)
+        events = list(rng.choice(INTENT_EVENTS[label], n_intent)) + list(rng.choice(COMMON_EVENTS, length - n_intent))
+        # 긴 꼬리 vocabulary: 상품 id 조회 (zipf 분포)
+        events += [f"view item{item}" for item in rng.zipf(1.3, rng.integers(1, 4)) % 20_000]
+        rng.shuffle(events)
+        texts.append(" ".join(events))
+
+    gaps = rng.gamma(2.0, 30.0 + 20.0 * labels[:, None], (n_sessions, 1)).ravel()
+    return pd.DataFrame({
+        "session_text": texts,
+        "event_count": lengths,
+        "unique_event_count": np.minimum(lengths, rng.integers(2, 8, n_sessions)),
+        "mean_gap": gaps,
+        "max_gap": gaps * rng.uniform(1.0, 4.0, n_sessions),
+        "intent_label": labels,
+    })
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200_000)
+    args = parser.parse_args()
+
+    df = make_sessions(args.sessions)
+    numeric_cols = ["event_count", "unique_event_count", "mean_gap", "max_gap"]
+    tfidf = TFIDFBuilder().fit_transform(df["session_text"])
+    print(f"[{args.sessions:,} sessions, tfidf {tfidf.shape[1]:,} columns, nnz {tfidf.nnz:,}]")
+
+    legacy, legacy_sec = timed(lambda: hstack([tfidf, df[numeric_cols].values]))
+    legacy_report = FeatureFusion.memory_report(legacy)
+    _, legacy_ds_sec = timed(
+        lambda: lgb.Dataset(legacy, df["intent_label"], params={"verbose": -1}).construct()
+    )
+    print(f"  hstack ({legacy.format}, {legacy.dtype})        : combine {legacy_sec:6.3f}s  "
+          f"lgb.Dataset {legacy_ds_sec:6.3f}s  {legacy_report['total_mb']:7.1f} MB (as CSR)")
+
+    fusion = FeatureFusion(scaler="standard")
+    fused, fused_sec = timed(lambda: fusion.combine(tfidf, df[numeric_cols]))
+    report = fusion.memory_report(fused)
+    _, fused_ds_sec = timed(
+        lambda: lgb.Dataset(fused, df["intent_label"], params={"verbose": -1}).construct()
+    )
+    print(f"  FeatureFusion (csr, float32) : combine {fused_sec:6.3f}s  "
+          f"lgb.Dataset {fused_ds_sec:6.3f}s  {report['total_mb']:7.1f} MB")
+
+    # 통계 feature 만 바뀐 경우: text block 재사용
+    new_stats = df[numeric_cols] * 1.1
+    _, reuse_sec = timed(lambda: fusion.combine(numeric_df=new_stats))
+    print(f"  numeric-only recombine       : {reuse_sec:6.3f}s")
+    print(f"  dense float64 equivalent     : {report['dense_float64_mb']:,.1f} MB  (density {report['density']:.4f})")
+
+    assert fused.shape == legacy.shape and fused.nnz == legacy.nnz
+
+
+if __name__ == "__main__":
+    main()
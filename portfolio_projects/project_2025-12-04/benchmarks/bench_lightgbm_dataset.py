@@ -0,0 +1,81 @@
+# benchmarks/bench_lightgbm_dataset.py
+"""
+LightGBM Dataset benchmark: Dataset 구성(binning) 시간 vs 학습 시간, binary cache 재사용
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_lightgbm_dataset --sessions 200000 --rounds 50
+"""
+
+import argparse
+import os
+import shutil
+import time
+
+import lightgbm as lgb
+
+from benchmarks.bench_feature_fusion import make_sessions
+from feature_store.feature_fusion import FeatureFusion
+from feature_store.tfidf_builder import TFIDFBuilder
+from models.lightgbm_trainer import LightGBMTrainer
+
+NUMERIC_COLS = ["event_count", "unique_event_count", "mean_gap", "max_gap"]
+
+
+def make_features(n_sessions: int):
+    """합성 세션 → (fused CSR, label)"""
+    df = make_sessions(n_sessions)
+    tfidf = TFIDFBuilder().fit_transform(df["session_text"])
+    X = FeatureFusion().combine(tfidf, df[NUMERIC_COLS])
+    return X, df["intent_label"].to_numpy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--out", default="/tmp/bench_lightgbm_dataset")
+    args = parser.parse_args()
+
+    shutil.rmtree(args.out, ignore_errors=True)
+    X, y = make_features(args.sessions)
+    print(f"[{X.shape[0]:,} x {X.shape[1]:,} CSR, nnz {X.nnz:,}, {args.rounds} rounds]")
+
+    params = {
+        "objective": "multiclass",
+        "num_class": 4,
+        "learning_rate": 0.05,
+        "n_estimators": args.rounds,
+        "num_leaves": 32,
+        "random_state": 42,
+    }
+
+    # 기존: LGBMClassifier.fit(X) → 매 실행마다 binning + 학습
+    start = time.perf_counter()
+    lgb.LGBMClassifier(**params, n_jobs=args.threads or None, verbose=-1).fit(X, y)
+    legacy_sec = time.perf_counter() - start
+    print(f"  LGBMClassifier.fit (bin + train) : {legacy_sec:7.3f}s")
+
+    # 첫 실행: Dataset 구성 + binary 저장
+    dataset_path = os.path.join(args.out, "lightgbm_train.bin")
+    trainer = LightGBMTrainer(params, num_threads=args.threads, dataset_path=dataset_path)
+    trainer.train(X, y)
+    first = trainer.timings_
+    print(f"  first run  : Dataset build+save {first['dataset_sec']:7.3f}s | train {first['train_sec']:7.3f}s"
+          f"  (binary cache {os.path.getsize(dataset_path) / 1e6:.1f} MB)")
+
+    # 재실행: 같은 X → fingerprint 확인 후 binary cache 로드
+    trainer = LightGBMTrainer(params, num_threads=args.threads, dataset_path=dataset_path)
+    trainer.train(X, y)
+    cached = trainer.timings_
+    print(f"  re-run     : Dataset from cache {cached['dataset_sec']:7.3f}s | train {cached['train_sec']:7.3f}s")
+
+    # X 없이 cache 만으로 재학습 (hyperparameter trial 등)
+    trainer = LightGBMTrainer(params, num_threads=args.threads, dataset_path=dataset_path)
+    trainer.train(None, None)
+    print(f"  cache only : Dataset load       {trainer.timings_['dataset_sec']:7.3f}s "
+          f"(x{first['dataset_sec'] / trainer.timings_['dataset_sec']:.1f} vs build)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_lightgbm_tuning.py
+"""
+Hyperparameter 탐색 benchmark:
+    trial 마다 Dataset 구성 + max_rounds 전체 학습 (순차) vs LightGBMTuner (공유 Dataset + successive halving + early stopping)
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_lightgbm_tuning --sessions 20000 --trials 9
+"""
+
+import argparse
+import os
+import time
+
+import lightgbm as lgb
+import numpy as np
+from sklearn.model_selection import ParameterSampler, train_test_split
+
+from benchmarks.bench_lightgbm_dataset import make_features
+from models.lightgbm_trainer import LightGBMTrainer
+from models.lightgbm_tuner import LightGBMTuner
+
+PARAM_SPACE = {
+    "num_leaves": [15, 31, 63],
+    "min_data_in_leaf": [20, 50, 100],
+    "feature_fraction": [0.5, 0.8, 1.0],
+    "lambda_l2": [0.0, 1.0, 10.0],
+}
+
+
+def naive_search(X, y, base_params, n_trials, max_rounds, random_state=42):
+    """trial 마다 Dataset 을 새로 구성하고 max_rounds 까지 학습한 뒤 valid logloss 비교"""
+    train_idx, valid_idx = train_test_split(
+        np.arange(len(y)), test_size=0.2, random_state=random_state, stratify=y
+    )
+    best = (np.inf, None)
+    for params in ParameterSampler(PARAM_SPACE, n_trials, random_state=random_state):
+        train_set = lgb.Dataset(X[train_idx], y[train_idx], params={"verbose": -1})
+        valid_set = lgb.Dataset(X[valid_idx], y[valid_idx], reference=train_set)
+        evals = {}
+        lgb.train(
+            {**base_params, **params},
+            train_set,
+            num_boost_round=max_rounds,
+            valid_sets=[valid_set],
+            callbacks=[lgb.record_evaluation(evals)],
+        )
+        score = evals["valid_0"]["multi_logloss"][-1]
+        best = min(best, (score, params), key=lambda item: item[0])
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20_000)
+    parser.add_argument("--trials", type=int, default=9)
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=90)
+    args = parser.parse_args()
+
+    X, y = make_features(args.sessions)
+    print(f"[{X.shape[0]:,} x {X.shape[1]:,} CSR, {args.trials} trials, "
+          f"{args.min_rounds}..{args.max_rounds} rounds, {os.cpu_count()} cores]")
+
+    params = {"objective": "multiclass", "learning_rate": 0.1, "n_estimators": args.max_rounds, "random_state": 42}
+    base = {"objective": "multiclass", "num_class": 4, "learning_rate": 0.1, "seed": 42,
+            "metric": "multi_logloss", "verbose": -1}
+
+    start = time.perf_counter()
+    naive_score, naive_params = naive_search(X, y, base, args.trials, args.max_rounds)
+    naive_sec = time.perf_counter() - start
+    print(f"  naive (rebuild Dataset, full rounds) : {naive_sec:7.2f}s  best logloss {naive_score:.4f}  {naive_params}")
+
+    trainer = LightGBMTrainer(params, dataset_path=None)
+    tuner = LightGBMTuner(
+        trainer,
+        PARAM_SPACE,
+        n_trials=args.trials,
+        min_rounds=args.min_rounds,
+        max_rounds=args.max_rounds,
+    )
+    start = time.perf_counter()
+    best_params, report = tuner.search(X, y)
+    tuner_sec = time.perf_counter() - start
+    print(f"  LightGBMTuner ({tuner.n_workers} workers x {tuner.threads_per_trial} threads) : "
+          f"{tuner_sec:7.2f}s  (x{naive_sec / tuner_sec:.1f})  best logloss {report['multi_logloss'].iloc[0]:.4f}")
+    print(f"    shared Dataset build {tuner.dataset_seconds_:.2f}s, "
+          f"{int(tuner.history_['rounds'].sum())} boosting rounds vs {args.trials * args.max_rounds} naive")
+    print(report.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
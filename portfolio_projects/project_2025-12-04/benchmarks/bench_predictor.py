@@ -0,0 +1,93 @@
+# benchmarks/bench_predictor.py
+"""
+모델 저장 / 로드 / online scoring benchmark:
+    joblib pickle vs LightGBM native text, IntentPredictor micro-batch latency (p50 / p99)
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_predictor --sessions 50000 --rounds 100
+"""
+
+import argparse
+import os
+import shutil
+import time
+
+import joblib
+import numpy as np
+
+from benchmarks.bench_feature_fusion import make_sessions
+from benchmarks.bench_lightgbm_dataset import NUMERIC_COLS
+from feature_store.feature_fusion import FeatureFusion
+from feature_store.tfidf_builder import TFIDFBuilder
+from models.intent_predictor import IntentPredictor
+from models.lightgbm_trainer import LightGBMTrainer
+
+
+def timed(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--calls", type=int, default=2_000)
+    parser.add_argument("--out", default="/tmp/bench_predictor")
+    args = parser.parse_args()
+
+    shutil.rmtree(args.out, ignore_errors=True)
+    os.makedirs(args.out)
+
+    df = make_sessions(args.sessions)
+    tfidf_builder = TFIDFBuilder()
+    fusion = FeatureFusion()
+    X = fusion.combine(tfidf_builder.fit_transform(df["session_text"]), df[NUMERIC_COLS])
+
+    params = {"objective": "multiclass", "learning_rate": 0.1, "n_estimators": args.rounds,
+              "num_leaves": 32, "random_state": 42}
+    trainer = LightGBMTrainer(params, dataset_path=None)
+    trainer.train(X, df["intent_label"])
+    print(f"[{X.shape[0]:,} x {X.shape[1]:,}, {trainer.model.num_trees():,} trees]")
+
+    # ---------- 저장 / 로드 ----------
+    pkl_path = os.path.join(args.out, "lightgbm_model.pkl")
+    _, pkl_save = timed(lambda: joblib.dump(trainer.model, pkl_path), repeat=1)
+    _, pkl_load = timed(lambda: joblib.load(pkl_path))
+    print(f"  joblib pickle : save {pkl_save:6.3f}s  load {pkl_load:6.3f}s  {os.path.getsize(pkl_path) / 1e6:6.1f} MB")
+
+    txt_path = os.path.join(args.out, "lightgbm_model.txt")
+    _, txt_save = timed(lambda: trainer.save(txt_path), repeat=1)
+    _, txt_load = timed(lambda: LightGBMTrainer.load(txt_path))
+    print(f"  native text   : save {txt_save:6.3f}s  load {txt_load:6.3f}s  {os.path.getsize(txt_path) / 1e6:6.1f} MB")
+
+    model_dir = os.path.join(args.out, "intent_predictor")
+    IntentPredictor(tfidf_builder, fusion, trainer, NUMERIC_COLS).save(model_dir)
+    predictor, startup = timed(lambda: IntentPredictor.load(model_dir))
+    print(f"  IntentPredictor.load (booster + tfidf + fusion): {startup:6.3f}s")
+
+    # ---------- online micro-batch scoring ----------
+    rng = np.random.default_rng(0)
+    texts = df["session_text"].to_numpy()
+    stats = df[NUMERIC_COLS]
+    for batch_size in (1, 16, 256):
+        predictor = IntentPredictor.load(model_dir)
+        n_calls = max(20, args.calls // batch_size)
+        for _ in range(n_calls):
+            rows = rng.integers(0, len(texts), batch_size)
+            predictor.predict(list(texts[rows]), stats.iloc[rows])
+        report = predictor.latency_report()
+        print(f"  batch {batch_size:4d} : p50 {report['p50_ms']:7.2f} ms  p99 {report['p99_ms']:7.2f} ms  "
+              f"({report['rows'] / (report['mean_ms'] * report['calls'] / 1000):,.0f} rows/s)")
+
+    offline = trainer.predict(X[:1000])
+    online = predictor.predict(list(texts[:1000]), stats.iloc[:1000])
+    assert (offline == online).all()
+
+
+if __name__ == "__main__":
+    main()
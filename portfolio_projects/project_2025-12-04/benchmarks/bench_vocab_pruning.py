@@ -0,0 +1,103 @@
+# benchmarks/bench_vocab_pruning.py
+"""
+Vocabulary pruning benchmark:
+    전체 TF-IDF vocabulary (max_features=5000, bigram) vs gain importance 기준으로 줄인 vocabulary
+    → vocabulary 크기 / 저장 크기 / 변환 행렬 메모리 / online latency (p50 / p99) / held-out accuracy
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_vocab_pruning --sessions 50000 --rounds 100 --coverage 0.99
+"""
+
+import argparse
+import os
+import shutil
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+from benchmarks.bench_feature_fusion import make_sessions
+from benchmarks.bench_lightgbm_dataset import NUMERIC_COLS
+from feature_store.feature_fusion import FeatureFusion
+from feature_store.tfidf_builder import TFIDFBuilder
+from models.intent_predictor import IntentPredictor
+from models.lightgbm_trainer import LightGBMTrainer
+from models.vocab_pruner import VocabularyPruner
+
+
+def measure(predictor, model_dir, test, calls, rng):
+    """저장 크기 / 변환 행렬 메모리 / batch 별 latency / held-out accuracy"""
+    predictor.save(model_dir)
+    sizes = {name: os.path.getsize(os.path.join(model_dir, name)) / 1e6 for name in ("tfidf.joblib", "model.txt")}
+
+    predictor = IntentPredictor.load(model_dir)
+    texts = test["session_text"].to_numpy()
+    stats = test[NUMERIC_COLS]
+    X = predictor.transform(list(texts), stats)
+
+    latency = {}
+    for batch_size in (1, 256):
+        predictor = IntentPredictor.load(model_dir)
+        for _ in range(max(20, calls // batch_size)):
+            rows = rng.integers(0, len(texts), batch_size)
+            predictor.predict(list(texts[rows]), stats.iloc[rows])
+        latency[batch_size] = predictor.latency_report()
+
+    accuracy = float((predictor.predict(list(texts), stats) == test["intent_label"].to_numpy()).mean())
+    return {
+        "n_features": X.shape[1],
+        "tfidf_mb": sizes["tfidf.joblib"],
+        "model_mb": sizes["model.txt"],
+        "matrix_mb": FeatureFusion.memory_report(X)["total_mb"],
+        "latency": latency,
+        "accuracy": accuracy,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--coverage", type=float, default=0.99)
+    parser.add_argument("--calls", type=int, default=2_000)
+    parser.add_argument("--out", default="/tmp/bench_vocab_pruning")
+    args = parser.parse_args()
+
+    shutil.rmtree(args.out, ignore_errors=True)
+    df = make_sessions(args.sessions)
+    train, test = train_test_split(df, test_size=0.2, random_state=42, stratify=df["intent_label"])
+
+    tfidf_builder = TFIDFBuilder()
+    fusion = FeatureFusion()
+    X = fusion.combine(tfidf_builder.fit_transform(train["session_text"]), train[NUMERIC_COLS])
+    params = {"objective": "multiclass", "learning_rate": 0.1, "n_estimators": args.rounds,
+              "num_leaves": 32, "random_state": 42}
+    trainer = LightGBMTrainer(params, dataset_path=None)
+    trainer.train(X, train["intent_label"])
+    fusion.clear_blocks()
+    full = IntentPredictor(tfidf_builder, fusion, trainer, NUMERIC_COLS)
+
+    pruner = VocabularyPruner(coverage=args.coverage)
+    pruned = pruner.prune(full, train["session_text"], train[NUMERIC_COLS], train["intent_label"])
+    report = pruner.report_
+    print(f"[{len(train):,} train / {len(test):,} test sessions, {args.rounds} rounds, "
+          f"gain coverage {args.coverage} → {report['importance_kept']:.1%} kept]")
+
+    rng = np.random.default_rng(0)
+    before = measure(full, os.path.join(args.out, "full"), test, args.calls, rng)
+    after = measure(pruned, os.path.join(args.out, "pruned"), test, args.calls, rng)
+
+    for name, result in (("full", before), ("pruned", after)):
+        print(f"  {name:6s}: {result['n_features']:5,} features | tfidf.joblib {result['tfidf_mb']:6.3f} MB | "
+              f"model.txt {result['model_mb']:5.2f} MB | test matrix {result['matrix_mb']:6.2f} MB | "
+              f"accuracy {result['accuracy']:.4f}")
+        for batch_size, latency in result["latency"].items():
+            print(f"           batch {batch_size:4d}: p50 {latency['p50_ms']:7.2f} ms  p99 {latency['p99_ms']:7.2f} ms")
+
+    print(f"  delta : features x{before['n_features'] / after['n_features']:.1f} smaller, "
+          f"matrix {after['matrix_mb'] - before['matrix_mb']:+.2f} MB, "
+          f"batch-256 p50 x{before['latency'][256]['p50_ms'] / after['latency'][256]['p50_ms']:.2f}, "
+          f"accuracy {after['accuracy'] - before['accuracy']:+.4f}")
+
+
+if __name__ == "__main__":
+    main()
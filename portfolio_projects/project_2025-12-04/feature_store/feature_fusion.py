@@ -3,19 +3,175 @@ Feature Fusion: TF-IDF sparse matrix + numeric statistical features 결합
 """
 
 import numpy as np
-from scipy.sparse import hstack
+import scipy.sparse as sp
+from sklearn.preprocessing import StandardScaler
 
 class FeatureFusion:
     """
     벡터화된 텍스트 + numeric features (통계치)를 하나의 feature matrix로 결합하는 클래스입니다.
+
+    - 출력은 처음부터 float32 CSR (COO 변환 / float64 dense 복사 없음)
+      → LightGBM 에 그대로 넣거나 lgb.Dataset 으로 바로 구성할 수 있습니다.
+    - numeric block 은 partial_fit 으로 chunk 단위 학습한 scaler 로 변환할 수 있습니다.
+    - 마지막으로 만든 text / numeric block 을 보관하므로,
+      한 쪽만 바뀌면 바뀐 block 만 넘겨서 다시 결합합니다.
     """
 
-    def combine(self, tfidf_matrix, numeric_df):
-        numeric_array = numeric_df.values  # shape: (N, K)
+    def __init__(self, scaler=None, dtype=np.float32):
+        """
+        scaler: None (scaling 없음, tree 모델 기본값) / "standard" /
+            partial_fit + transform 을 가진 scaler 객체 (예: sklearn StandardScaler, MaxAbsScaler)
+        dtype: 결합된 행렬의 값 dtype
+        """
+        self.scaler = StandardScaler() if scaler == "standard" else scaler
+        self.dtype = dtype
+        self.scaler_fitted = False
+
+        self.text_block = None
+        self.numeric_block = None
+        self.fused_ = None
+        self.numeric_positions_ = None
+
+    # ============================
+    # numeric scaler (streaming)
+    # ============================
+    def partial_fit(self, numeric_df):
+        """numeric chunk 하나로 scaler 통계(평균/분산 등)를 누적합니다."""
+        if self.scaler is None:
+            raise ValueError("partial_fit requires a scaler")
+
+        self.scaler.partial_fit(self._numeric_values(numeric_df))
+        self.scaler_fitted = True
+        return self
+
+    def fit(self, numeric_chunks):
+        """numeric DataFrame 또는 DataFrame chunk iterable 로 scaler 를 학습합니다."""
+        if hasattr(numeric_chunks, "columns"):
+            numeric_chunks = [numeric_chunks]
+        for chunk in numeric_chunks:
+            self.partial_fit(chunk)
+        return self
+
+    # ============================
+    # block 변환
+    # ============================
+    def transform_text(self, tfidf_matrix):
+        """TF-IDF 행렬 → dtype CSR (이미 같은 dtype CSR 이면 복사 없음)"""
+        return sp.csr_matrix(tfidf_matrix, dtype=self.dtype, copy=False)
+
+    def transform_numeric(self, numeric_df):
+        """numeric DataFrame → (scaling) → dtype CSR
+
+        값이 0 이어도 모든 칸을 저장하는 (n, K) 고정 패턴 CSR 입니다.
+        패턴이 행마다 같으므로 결합 행렬에서 numeric 값의 위치가 고정되고,
+        numeric 만 바뀌면 data 배열의 해당 위치만 덮어쓸 수 있습니다.
+        NaN 은 그대로 저장되어 LightGBM 에서 missing 값으로 처리됩니다.
+        """
+        values = self._numeric_values(numeric_df)
+        if self.scaler is not None:
+            if not self.scaler_fitted:
+                self.partial_fit(numeric_df)
+            values = self.scaler.transform(values)
+
+        n_rows, n_cols = values.shape
+        return sp.csr_matrix(
+            (
+                values.astype(self.dtype, copy=False).ravel(),
+                np.tile(np.arange(n_cols, dtype=np.int32), n_rows),
+                np.arange(0, n_rows * n_cols + 1, n_cols, dtype=np.int64),
+            ),
+            shape=(n_rows, n_cols),
+        )
+
+    def combine(self, tfidf_matrix=None, numeric_df=None):
+        """
+        text block 과 numeric block 을 가로로 결합한 CSR 행렬을 반환합니다.
+
+        tfidf_matrix / numeric_df 중 None 으로 넘긴 쪽은 직전 combine 에서 만든 block 을 재사용합니다.
+        예) 같은 세션에 통계 feature 만 새로 계산한 경우 → fusion.combine(numeric_df=new_stats)
+            이때는 hstack 을 다시 하지 않고 직전 결합 행렬의 indices / indptr 를 공유한 채
+            data 의 numeric 위치만 새 값으로 바꾼 행렬을 반환합니다.
+        """
+        if tfidf_matrix is not None:
+            self.text_block = self.transform_text(tfidf_matrix)
+        if numeric_df is not None:
+            self.numeric_block = self.transform_numeric(numeric_df)
+
+        if self.text_block is None or self.numeric_block is None:
+            raise ValueError("Both text and numeric blocks are required on the first combine")
+        if self.text_block.shape[0] != self.numeric_block.shape[0]:
+            raise ValueError(
+                f"Row mismatch: text {self.text_block.shape[0]} vs numeric {self.numeric_block.shape[0]}"
+            )
+
+        fused = self.fused_
+        if tfidf_matrix is None and fused is not None and fused.shape[1] == (
+            self.text_block.shape[1] + self.numeric_block.shape[1]
+        ):
+            # text block 재사용: numeric 값 위치만 갱신
+            data = fused.data.copy()
+            data[self.numeric_positions_] = self.numeric_block.data
+            return sp.csr_matrix((data, fused.indices, fused.indptr), shape=fused.shape)
+
+        # CSR block 끼리의 hstack 은 COO 변환 없이 행 단위로 이어 붙임
+        fused = sp.hstack([self.text_block, self.numeric_block], format="csr", dtype=self.dtype)
+
+        # 각 행의 마지막 K 칸이 numeric 값
+        n_numeric = self.numeric_block.shape[1]
+        self.numeric_positions_ = (
+            fused.indptr[1:, None] - n_numeric + np.arange(n_numeric)
+        ).ravel()
+        self.fused_ = fused
+        return fused
+
+    def transform(self, tfidf_matrix, numeric_df):
+        """
+        block cache 를 건드리지 않는 결합 (serving 용 micro-batch 변환)
+
+        학습 시 fit 한 scaler 를 그대로 쓰고, combine 의 block 재사용 상태는 바꾸지 않습니다.
+        """
+        if self.scaler is not None and not self.scaler_fitted:
+            raise ValueError("Scaler is not fitted; call fit/partial_fit or combine first")
+
+        return sp.hstack(
+            [self.transform_text(tfidf_matrix), self.transform_numeric(numeric_df)],
+            format="csr",
+            dtype=self.dtype,
+        )
+
+    def clear_blocks(self):
+        """보관 중인 text / numeric / 결합 block 해제 (저장 전, 메모리 반환)"""
+        self.text_block = None
+        self.numeric_block = None
+        self.fused_ = None
+        self.numeric_positions_ = None
+        return self
 
-        # ============================
-        #         Fill your code
-        #  (추가 numeric 전처리, scaling 등을 포함할 수 있음)
-        # ============================
+    # ============================
+    # memory report
+    # ============================
+    @staticmethod
+    def memory_report(X):
+        """
+        CSR 행렬의 실제 메모리와 같은 shape 의 dense float64 대비 크기를 반환합니다.
+        """
+        X = sp.csr_matrix(X, copy=False)
+        n_bytes = X.data.nbytes + X.indices.nbytes + X.indptr.nbytes
+        dense_bytes = X.shape[0] * X.shape[1] * np.dtype(np.float64).itemsize
+        return {
+            "shape": X.shape,
+            "nnz": int(X.nnz),
+            "dtype": str(X.dtype),
+            "data_mb": X.data.nbytes / 1e6,
+            "indices_mb": (X.indices.nbytes + X.indptr.nbytes) / 1e6,
+            "total_mb": n_bytes / 1e6,
+            "dense_float64_mb": dense_bytes / 1e6,
+            "density": X.nnz / max(X.shape[0] * X.shape[1], 1),
+        }
 
-        return hstack([tfidf_matrix, numeric_array])
+    @staticmethod
+    def _numeric_values(numeric_df):
+        """DataFrame / array → float64 2D array (object 배열로 올라오지 않도록 dtype 지정)"""
+        if hasattr(numeric_df, "to_numpy"):
+            return numeric_df.to_numpy(dtype=np.float64)
+        return np.asarray(numeric_df, dtype=np.float64).reshape(len(numeric_df), -1)
@@ -2,18 +2,33 @@
 Intent Feature Loader: Day3에서 사용할 session_intents.csv 불러오기
 """
 
+import os
+
 import pandas as pd
+import pyarrow.parquet as pq
 
 class IntentFeatureLoader:
     """
     session_intents.csv를 읽고 모델 학습에 필요한 column을 반환하는 Loader입니다.
+
+    path 가 Parquet 파일/디렉토리(dataset)이면 pyarrow 로 읽습니다.
+    - columns: 필요한 column 만 읽음 (projection)
+    - filters: [(col, op, value), ...] 조건을 파일/row group 단위로 먼저 적용 (predicate pushdown)
     """
 
     def __init__(self, path="data/session_intents.csv"):
         self.path = path
 
-    def load(self):
-        df = pd.read_csv(self.path)
+    def is_parquet(self) -> bool:
+        return os.path.isdir(self.path) or self.path.endswith(".parquet")
+
+    def load(self, columns=None, filters=None):
+        if self.is_parquet():
+            df = pq.read_table(self.path, columns=columns, filters=filters).to_pandas()
+        else:
+            if filters is not None:
+                raise ValueError("filters are only supported for Parquet inputs")
+            df = pd.read_csv(self.path, usecols=columns)
 
         # session_text 컬럼이 반드시 존재해야 함
         if "session_text" not in df.columns:
@@ -2,19 +2,39 @@
 TF-IDF Builder for session text.
 """
 
+import numpy as np
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+from feature_store.hashing_tfidf import HashingTfidf
+from feature_store.vocabulary_analyzer import VocabularyAnalyzer
+
 class TFIDFBuilder:
     """
     세션 텍스트 데이터를 TF-IDF 벡터로 변환하는 클래스입니다.
     실무에서 가장 많이 사용되는 baseline NLP 벡터 방식입니다.
     """
 
-    def __init__(self, max_features=5000):
-        self.vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            ngram_range=(1, 2)
-        )
+    def __init__(self, max_features=5000, mode="tfidf", n_features=2 ** 18):
+        """
+        mode="hashing" 이면 vocabulary 학습 없이 n_features 크기로 hashing 하고,
+        IDF 는 partial_fit 으로 chunk 단위로 누적합니다. (메모리보다 큰 데이터용)
+        """
+        if mode not in ("tfidf", "hashing"):
+            raise ValueError(f"mode must be 'tfidf' or 'hashing', got {mode!r}")
+
+        self.mode = mode
+
+        if mode == "hashing":
+            self.vectorizer = HashingTfidf(
+                n_features=n_features,
+                ngram_range=(1, 2)
+            )
+        else:
+            self.vectorizer = TfidfVectorizer(
+                max_features=max_features,
+                ngram_range=(1, 2)
+            )
 
     def fit_transform(self, texts):
         """
@@ -22,8 +42,50 @@ class TFIDFBuilder:
         """
         return self.vectorizer.fit_transform(texts)
 
+    def partial_fit(self, texts):
+        """
+        hashing 모드에서 텍스트 chunk 하나의 document frequency 를 누적합니다.
+        """
+        if self.mode != "hashing":
+            raise ValueError("partial_fit is only available in hashing mode.")
+
+        self.vectorizer.partial_fit(texts)
+        return self
+
     def transform(self, texts):
         """
         이미 학습된 TF-IDF vectorizer를 이용하여 새로운 텍스트를 변환합니다.
         """
         return self.vectorizer.transform(texts)
+
+    def get_feature_names_out(self):
+        return self.vectorizer.get_feature_names_out()
+
+    def prune(self, keep):
+        """
+        vocabulary 를 keep (feature index) 에 해당하는 n-gram 으로 줄인 새 TFIDFBuilder 를 반환합니다.
+
+        IDF 는 학습 때 값을 그대로 가져오므로 다시 fit 할 필요가 없고,
+        transform 은 VocabularyAnalyzer 로 남은 n-gram 만 만듭니다.
+        단, l2 정규화가 남은 term 기준으로 바뀌므로 모델은 줄인 vectorizer 출력으로 다시 학습해야 합니다.
+        """
+        if self.mode != "tfidf":
+            raise ValueError("prune is only available in tfidf mode.")
+
+        keep = np.sort(np.asarray(keep, dtype=np.int64))
+        terms = self.vectorizer.get_feature_names_out()[keep]
+
+        params = {"vocabulary": list(terms), "max_features": None}
+        v = self.vectorizer
+        if (v.analyzer == "word" and v.tokenizer is None and v.preprocessor is None
+                and v.strip_accents is None and v.stop_words is None):
+            # n-gram 생성은 analyzer 가 담당 (ngram_range 는 사용되지 않음)
+            params.update(
+                analyzer=VocabularyAnalyzer(terms, v.token_pattern, v.lowercase),
+                ngram_range=(1, 1),
+            )
+
+        pruned = TFIDFBuilder(max_features=len(keep))
+        pruned.vectorizer = clone(self.vectorizer).set_params(**params)
+        pruned.vectorizer.idf_ = self.vectorizer.idf_[keep]
+        return pruned
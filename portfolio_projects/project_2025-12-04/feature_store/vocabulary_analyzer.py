@@ -0,0 +1,39 @@
+# feature_store/vocabulary_analyzer.py
+import re
+
+
+class VocabularyAnalyzer:
+    """
+    고정된 vocabulary 에 있는 n-gram 만 만드는 word analyzer (TfidfVectorizer(analyzer=...) 용)
+
+    기본 word analyzer 는 문서의 모든 n-gram 문자열을 만든 뒤 vocabulary 에서 찾으므로,
+    vocabulary 를 줄여도 변환 비용은 그대로입니다.
+    여기서는 token tuple 로 먼저 걸러서 vocabulary 에 있는 n-gram 만 문자열로 만듭니다.
+    (lowercase + token_pattern 기반 기본 analyzer 와 같은 결과)
+    """
+
+    def __init__(self, terms, token_pattern=r"(?u)\b\w\w+\b", lowercase=True):
+        self.token_pattern = re.compile(token_pattern)
+        self.lowercase = lowercase
+
+        # unigram 은 문자열 set, n >= 2 는 길이별 token tuple set
+        self.unigrams = set()
+        self.ngrams = {}
+        for term in terms:
+            tokens = tuple(term.split(" "))
+            if len(tokens) == 1:
+                self.unigrams.add(term)
+            else:
+                self.ngrams.setdefault(len(tokens), set()).add(tokens)
+
+    def __call__(self, doc):
+        if self.lowercase:
+            doc = doc.lower()
+        tokens = self.token_pattern.findall(doc)
+
+        features = [token for token in tokens if token in self.unigrams]
+        for n, kept in self.ngrams.items():
+            features.extend(
+                " ".join(gram) for gram in zip(*(tokens[i:] for i in range(n))) if gram in kept
+            )
+        return features
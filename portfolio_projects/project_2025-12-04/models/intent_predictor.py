@@ -0,0 +1,125 @@
+"""
+Online Intent Predictor: raw session text (+ numeric stats) → intent
+"""
+
+import copy
+import json
+import os
+import time
+from collections import deque
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from models.lightgbm_trainer import LightGBMTrainer
+
+class IntentPredictor:
+    """
+    학습 때 fit 한 TFIDFBuilder / FeatureFusion 과 LightGBM booster 를 함께 들고
+    raw session text micro-batch 를 바로 scoring 하는 predictor 입니다.
+
+    models/intent_predictor/
+        model.txt        ← LightGBM native text model
+        model.txt.json   ← class label
+        tfidf.joblib     ← fit 된 TFIDFBuilder
+        fusion.joblib    ← fit 된 FeatureFusion (scaler 상태, block cache 제외)
+        manifest.json    ← numeric 컬럼 순서
+
+    호출마다 latency 를 기록하고 latency_report() 로 p50 / p99 를 확인할 수 있습니다.
+    """
+
+    def __init__(self, tfidf_builder, fusion, trainer, numeric_cols, num_threads=1, latency_window=10_000):
+        """
+        num_threads: 예측 thread 수. micro-batch 는 thread 생성 비용이 더 커서 기본 1
+        latency_window: 최근 몇 번의 호출 latency / 행 수를 보관할지
+        """
+        self.tfidf_builder = tfidf_builder
+        self.fusion = fusion
+        self.trainer = trainer
+        self.numeric_cols = list(numeric_cols)
+        self.num_threads = num_threads
+
+        self.latencies_ms = deque(maxlen=latency_window)
+        self.batch_rows = deque(maxlen=latency_window)
+
+    # =========================
+    # 저장 / 로드
+    # =========================
+    def save(self, model_dir="models/intent_predictor"):
+        os.makedirs(model_dir, exist_ok=True)
+        self.trainer.save(os.path.join(model_dir, "model.txt"))
+
+        # combine 에서 보관한 학습 행렬 block 은 저장하지 않음
+        # (shallow copy 에서만 비워서 호출한 쪽 fusion 의 block 재사용 상태는 그대로)
+        fusion = copy.copy(self.fusion).clear_blocks()
+        joblib.dump(self.tfidf_builder, os.path.join(model_dir, "tfidf.joblib"))
+        joblib.dump(fusion, os.path.join(model_dir, "fusion.joblib"))
+
+        with open(os.path.join(model_dir, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump({"numeric_cols": self.numeric_cols}, f, indent=2)
+        return model_dir
+
+    @classmethod
+    def load(cls, model_dir="models/intent_predictor", num_threads=1):
+        with open(os.path.join(model_dir, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        return cls(
+            tfidf_builder=joblib.load(os.path.join(model_dir, "tfidf.joblib")),
+            fusion=joblib.load(os.path.join(model_dir, "fusion.joblib")),
+            trainer=LightGBMTrainer.load(os.path.join(model_dir, "model.txt"), num_threads=num_threads),
+            numeric_cols=manifest["numeric_cols"],
+            num_threads=num_threads,
+        )
+
+    # =========================
+    # 예측
+    # =========================
+    def transform(self, texts, numeric=None):
+        """
+        raw text + numeric stats → 학습 때와 같은 float32 CSR
+
+        numeric: numeric_cols 를 가진 DataFrame 또는 같은 순서의 (n, K) 배열
+            (없으면 NaN → LightGBM missing 으로 처리)
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+        if numeric is None:
+            numeric = np.full((len(texts), len(self.numeric_cols)), np.nan)
+        elif isinstance(numeric, pd.DataFrame):
+            # 컬럼 순서가 이미 같으면 재선택(DataFrame 복사) 없이 바로 배열로
+            if list(numeric.columns) != self.numeric_cols:
+                numeric = numeric[self.numeric_cols]
+            numeric = numeric.to_numpy(dtype=np.float64)
+
+        return self.fusion.transform(self.tfidf_builder.transform(texts), numeric)
+
+    def predict_proba(self, texts, numeric=None):
+        start = time.perf_counter()
+        X = self.transform(texts, numeric)
+        proba = self.trainer.model.predict(X, num_threads=self.num_threads)
+
+        self.latencies_ms.append((time.perf_counter() - start) * 1000)
+        self.batch_rows.append(X.shape[0])
+        return proba
+
+    def predict(self, texts, numeric=None):
+        proba = self.predict_proba(texts, numeric)
+        if proba.ndim == 1:  # binary objective
+            return self.trainer.classes_[(proba > 0.5).astype(int)]
+        return self.trainer.classes_[np.argmax(proba, axis=1)]
+
+    def latency_report(self):
+        """최근 latency_window 번 호출의 latency 통계 (ms) 와 그 호출들의 행 수"""
+        latencies = np.asarray(self.latencies_ms)
+        if latencies.size == 0:
+            return {"calls": 0}
+        return {
+            "calls": int(latencies.size),
+            "rows": int(sum(self.batch_rows)),
+            "p50_ms": float(np.percentile(latencies, 50)),
+            "p99_ms": float(np.percentile(latencies, 99)),
+            "mean_ms": float(latencies.mean()),
+            "max_ms": float(latencies.max()),
+        }
@@ -2,15 +2,33 @@
 LightGBM Trainer for Intent Classification
 """
 
-import joblib
+import hashlib
+import json
+import os
+import time
+
 import lightgbm as lgb
+import numpy as np
+import scipy.sparse as sp
+
+# Dataset (feature binning) 결과에 영향을 주는 파라미터 → binary cache 의 key 에 포함
+DATASET_PARAM_KEYS = ("max_bin", "min_data_in_bin", "bin_construct_sample_cnt", "feature_pre_filter")
 
 class LightGBMTrainer:
     """
     TF-IDF + Numeric Stats 기반 Intent Multi-class Classification 모델
+
+    lgb.Dataset 을 한 번 구성(feature binning)한 뒤 LightGBM binary 형식으로 저장해 두고,
+    같은 데이터로 다시 학습하거나 hyperparameter trial 을 돌릴 때는 저장된 bin 을 그대로 읽습니다.
     """
 
-    def __init__(self, params=None):
+    def __init__(self, params=None, num_threads=0, free_raw_data=True, dataset_path=None):
+        """
+        params: LightGBM 파라미터 (sklearn 이름 n_estimators / random_state 도 허용)
+        num_threads: LightGBM 내부 thread 수 (0 이면 OpenMP 기본값 = 전체 core)
+        free_raw_data: Dataset 구성 후 원본 행렬 참조를 해제 (학습 중 메모리 절약)
+        dataset_path: binary Dataset cache 경로 (기본 None = cache 사용 안 함, 상대 경로는 실행 위치 기준)
+        """
         default_params = {
             "objective": "multiclass",
             "num_class": 4,  # multi-class 클래스 개수
@@ -20,23 +38,189 @@ class LightGBMTrainer:
             "random_state": 42
         }
         self.params = params if params is not None else default_params
-        self.model = lgb.LGBMClassifier(**self.params)
+        self.num_threads = num_threads
+        self.free_raw_data = free_raw_data
+        self.dataset_path = dataset_path
+
+        self.model = None
+        self.classes_ = None
+        self.timings_ = {}
+
+    # =========================
+    # 파라미터
+    # =========================
+    def booster_params(self):
+        """sklearn 스타일 이름을 native 이름으로 바꾼 학습 파라미터와 boosting round 수"""
+        params = dict(self.params)
+        num_boost_round = params.pop("n_estimators", params.pop("num_boost_round", 100))
+        if "random_state" in params:
+            params["seed"] = params.pop("random_state")
+        params.setdefault("verbose", -1)
+        params["num_threads"] = self.num_threads
+        return params, num_boost_round
+
+    def dataset_params(self):
+        """
+        Dataset 구성 파라미터
+
+        feature_pre_filter (기본 True) 는 구성 시점의 min_data_in_leaf 로 split 불가능한 희소 TF-IDF 컬럼을 미리 제외해
+        학습이 빨라집니다. 같은 bin 으로 더 작은 min_data_in_leaf 를 시험하려면 False 로 구성해야 합니다.
+        """
+        params = {key: self.params[key] for key in DATASET_PARAM_KEYS if key in self.params}
+        if "min_data_in_leaf" in self.params:
+            params["min_data_in_leaf"] = self.params["min_data_in_leaf"]
+        params["num_threads"] = self.num_threads
+        params["verbose"] = -1
+        return params
+
+    # =========================
+    # Dataset 구성 / cache
+    # =========================
+    def encode_labels(self, y):
+        """label → 0..K-1 정수 (native API 는 class 번호를 label 로 받음)"""
+        self.classes_, codes = np.unique(np.asarray(y), return_inverse=True)
+        return codes.astype(np.int32)
+
+    def build_dataset(self, X, y, reference=None, params=None):
+        """
+        CSR / dense 행렬로 lgb.Dataset 을 구성(binning)합니다.
+
+        reference 를 주면 그 Dataset 의 bin 경계를 그대로 사용합니다. (validation set)
+        params: Dataset 구성 파라미터 (기본값 dataset_params())
+        """
+        if sp.issparse(X):
+            X = sp.csr_matrix(X, copy=False)
+        dataset = lgb.Dataset(
+            X,
+            label=y,
+            reference=reference,
+            params=self.dataset_params() if params is None else params,
+            free_raw_data=self.free_raw_data,
+        )
+        return dataset.construct()
+
+    def dataset(self, X=None, y=None):
+        """
+        학습용 Dataset 반환
+
+        - dataset_path 에 같은 데이터 / 같은 구성 파라미터로 만든 binary cache 가 있으면 읽기만 합니다.
+        - 없으면 구성 후 binary cache 로 저장합니다.
+        - X 없이 호출하면 cache 를 그대로 읽습니다. (이전 실행에서 만든 bin 으로 재학습)
+        - metadata (.json) 가 없는 cache 는 classes 를 알 수 없으므로 쓰지 않습니다.
+        """
+        fingerprint = None if X is None else self.fingerprint(X, y)
 
+        if self.dataset_path is not None and os.path.exists(self.dataset_path):
+            meta = self._read_cache_meta()
+            if "classes" in meta and (X is None or meta.get("fingerprint") == fingerprint):
+                self.classes_ = np.asarray(meta["classes"])
+                return lgb.Dataset(self.dataset_path, params=self.dataset_params()).construct()
+
+        if X is None:
+            raise ValueError(f"No cached dataset at {self.dataset_path}; X and y are required")
+
+        codes = self.encode_labels(y)
+        dataset = self.build_dataset(X, codes)
+
+        if self.dataset_path is not None:
+            os.makedirs(os.path.dirname(self.dataset_path) or ".", exist_ok=True)
+            if os.path.exists(self.dataset_path):
+                os.remove(self.dataset_path)  # save_binary 는 기존 파일을 덮어쓰지 않음
+            dataset.save_binary(self.dataset_path)
+            with open(self.dataset_path + ".json", "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "classes": self.classes_.tolist()}, f)
+
+        return dataset
+
+    def fingerprint(self, X, y):
+        """데이터 + Dataset 구성 파라미터 hash (cache 가 같은 입력으로 만들어졌는지 확인)"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(self.dataset_params(), sort_keys=True).encode())
+        digest.update(str(X.shape).encode())
+
+        if sp.issparse(X):
+            X = sp.csr_matrix(X, copy=False)
+            arrays = [X.data, X.indices, X.indptr]
+        else:
+            arrays = [np.asarray(X)]
+        for array in arrays + [np.asarray(y)]:
+            digest.update(np.ascontiguousarray(array).data)
+        return digest.hexdigest()
+
+    def _read_cache_meta(self):
+        try:
+            with open(self.dataset_path + ".json", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    # =========================
+    # 학습 / 예측
+    # =========================
     def train(self, X, y):
         """
         LightGBM 모델을 학습시킵니다.
+
+        X 가 None 이면 dataset_path 의 cache 로 학습합니다.
         """
-        self.model.fit(X, y)
+        start = time.perf_counter()
+        train_set = self.dataset(X, y)
+        self.timings_["dataset_sec"] = time.perf_counter() - start
+
+        params, num_boost_round = self.booster_params()
+        if str(params.get("objective", "")).startswith("multiclass"):
+            params["num_class"] = len(self.classes_)
+
+        start = time.perf_counter()
+        self.model = lgb.train(params, train_set, num_boost_round=num_boost_round)
+        self.timings_["train_sec"] = time.perf_counter() - start
         return self.model
 
+    def tune(self, X, y, param_space=None, **tuner_kwargs):
+        """
+        hyperparameter 탐색 후 best params 를 self.params 로 설정합니다. (학습은 train 으로 따로)
+
+        tuner_kwargs 는 LightGBMTuner 인자 (n_trials, n_workers, min_rounds, max_rounds, eta, ...)
+        Returns: trial 별 결과 DataFrame
+        """
+        from models.lightgbm_tuner import DEFAULT_PARAM_SPACE, LightGBMTuner
+
+        tuner = LightGBMTuner(self, param_space or DEFAULT_PARAM_SPACE, **tuner_kwargs)
+        self.params, report = tuner.search(X, y)
+        return report
+
+    def predict_proba(self, X):
+        """클래스별 확률 (n, K)"""
+        return self.model.predict(X, num_threads=self.num_threads)
+
     def predict(self, X):
         """
         학습된 모델을 사용하여 예측합니다.
         """
-        return self.model.predict(X)
+        proba = self.predict_proba(X)
+        if proba.ndim == 1:  # binary objective
+            return self.classes_[(proba > 0.5).astype(int)]
+        return self.classes_[np.argmax(proba, axis=1)]
 
-    def save(self, path="models/lightgbm_model.pkl"):
+    def save(self, path="models/lightgbm_model.txt"):
         """
-        모델을 디스크에 저장합니다.
+        모델을 LightGBM native text 형식으로 저장합니다. (class label 은 path + ".json")
+
+        pickle 과 달리 Python / LightGBM 버전에 덜 묶이고, load 시 unpickle 없이 C++ parser 로 바로 읽습니다.
         """
-        joblib.dump(self.model, path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.model.save_model(path)
+        with open(path + ".json", "w", encoding="utf-8") as f:
+            json.dump({"classes": self.classes_.tolist(), "num_threads": self.num_threads}, f)
+        return path
+
+    @classmethod
+    def load(cls, path="models/lightgbm_model.txt", num_threads=None):
+        """save 로 저장한 모델을 불러온 trainer (predict / predict_proba 용)"""
+        with open(path + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        trainer = cls(num_threads=meta["num_threads"] if num_threads is None else num_threads, dataset_path=None)
+        trainer.model = lgb.Booster(model_file=path)
+        trainer.classes_ = np.asarray(meta["classes"])
+        return trainer
@@ -0,0 +1,289 @@
+"""
+Parallel hyperparameter search for LightGBMTrainer (successive halving + early stopping)
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import ParameterGrid, ParameterSampler, train_test_split
+
+from models.lightgbm_trainer import DATASET_PARAM_KEYS
+
+# LightGBMTrainer.tune 기본 탐색 공간
+DEFAULT_PARAM_SPACE = {
+    "num_leaves": [15, 31, 63, 127],
+    "min_data_in_leaf": [20, 50, 100],
+    "feature_fraction": [0.5, 0.7, 0.9, 1.0],
+    "bagging_fraction": [0.7, 0.9, 1.0],
+    "bagging_freq": [1],
+    "lambda_l2": [0.0, 1.0, 10.0],
+}
+
+def _run_trial(task):
+    """
+    worker process 에서 trial 하나를 rounds 까지 학습
+
+    Dataset 은 공유 binary 파일에서 읽기만 하므로 binning 을 반복하지 않습니다.
+    (binary Dataset 에는 원본 값이 없어 init_model 로 이어서 학습할 수 없으므로 rung 마다 처음부터 학습)
+    """
+    start = time.perf_counter()
+    train_set = lgb.Dataset(task["train_path"], params=task["dataset_params"])
+    valid_set = lgb.Dataset(task["valid_path"], reference=train_set, params=task["dataset_params"])
+
+    evals = {}
+    booster = lgb.train(
+        task["params"],
+        train_set,
+        num_boost_round=task["rounds"],
+        valid_sets=[valid_set],
+        valid_names=["valid"],
+        callbacks=[
+            lgb.early_stopping(task["early_stopping_rounds"], verbose=False),
+            lgb.record_evaluation(evals),
+        ],
+    )
+
+    scores = evals["valid"][task["params"]["metric"]]
+    best_iteration = booster.best_iteration or booster.current_iteration()
+    return {
+        "trial": task["trial"],
+        "model_str": booster.model_to_string(),
+        "rounds": len(scores),
+        "best_iteration": best_iteration,
+        "score": min(scores),
+        # early stopping 으로 budget 전에 멈추면 더 학습해도 좋아지지 않음
+        "converged": len(scores) < task["rounds"],
+        "seconds": time.perf_counter() - start,
+    }
+
+
+class LightGBMTuner:
+    """
+    LightGBMTrainer 용 hyperparameter 탐색
+
+    - 학습 데이터를 train / valid fold 로 나눠 lgb.Dataset 을 한 번만 구성하고
+      binary 파일로 저장 → 모든 trial 이 같은 bin 을 공유
+    - process pool 에서 trial 을 병렬 실행, core 는 (동시 trial 수 x trial 당 thread 수) 로 분배
+    - successive halving: 작은 round budget 으로 전체 trial 을 돌리고 valid score 상위 1/eta 만
+      eta 배 budget 으로 다시 학습 (rung 당 총 round 수가 비슷하게 유지됨)
+    - 각 rung 안에서는 valid metric early stopping
+    """
+
+    def __init__(
+        self,
+        trainer,
+        param_space: dict,
+        n_trials: int = 16,
+        n_workers: int = None,
+        threads_per_trial: int = None,
+        min_rounds: int = 25,
+        max_rounds: int = 400,
+        eta: int = 3,
+        early_stopping_rounds: int = 20,
+        valid_size: float = 0.2,
+        random_state: int = 42,
+        work_dir: str = None,
+    ):
+        """
+        trainer: 기본 params / num_threads 를 가진 LightGBMTrainer
+        param_space: {param: 값 리스트 또는 scipy.stats 분포}. n_trials=None 이면 전체 grid
+        n_workers / threads_per_trial: None 이면 core 수에서 자동 분배
+        """
+        bin_params = set(param_space) & set(DATASET_PARAM_KEYS)
+        if bin_params:
+            raise ValueError(f"Dataset (binning) params cannot be tuned on a shared Dataset: {sorted(bin_params)}")
+
+        self.trainer = trainer
+        self.param_space = param_space
+        self.n_trials = n_trials
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+        self.eta = eta
+        self.early_stopping_rounds = early_stopping_rounds
+        self.valid_size = valid_size
+        self.random_state = random_state
+        self.work_dir = work_dir
+
+        self.n_workers, self.threads_per_trial = self.split_cores(
+            n_trials or len(ParameterGrid(param_space)), n_workers, threads_per_trial
+        )
+
+        self.report_ = None
+        self.best_params_ = None
+
+    @staticmethod
+    def split_cores(n_trials, n_workers=None, threads_per_trial=None):
+        """
+        동시 trial 수 x trial 당 LightGBM thread 수 <= core 수
+
+        작은 데이터에서는 LightGBM 내부 병렬화 효율이 낮으므로
+        trial 당 thread 를 적게 (기본 2) 주고 동시 trial 을 늘립니다.
+        """
+        n_cores = os.cpu_count() or 1
+        if threads_per_trial is None:
+            threads_per_trial = max(1, n_cores // n_workers) if n_workers else min(2, n_cores)
+        if n_workers is None:
+            n_workers = max(1, n_cores // threads_per_trial)
+        return min(n_workers, max(n_trials, 1)), threads_per_trial
+
+    def sample_params(self):
+        if self.n_trials is None:
+            return list(ParameterGrid(self.param_space))
+        return list(ParameterSampler(self.param_space, self.n_trials, random_state=self.random_state))
+
+    def rungs(self):
+        """successive halving 단계별 round budget (min_rounds * eta^r, 마지막은 max_rounds)"""
+        budgets = []
+        rounds = self.min_rounds
+        while rounds < self.max_rounds:
+            budgets.append(rounds)
+            rounds *= self.eta
+        return budgets + [self.max_rounds]
+
+    # =========================
+    # 실행
+    # =========================
+    def search(self, X, y):
+        """
+        Returns:
+            best_params: trainer.params 에 그대로 넣을 수 있는 dict (n_estimators = best iteration)
+            report: trial 별 params / 마지막 rung / rounds / best_iteration / valid score /
+                누적 학습 시간 / 상태(finished, early_stopped, pruned) DataFrame (score 순)
+                rung 별 기록은 self.history_
+        """
+        work_dir = self.work_dir or tempfile.mkdtemp(prefix="lgb_tune_")
+        os.makedirs(work_dir, exist_ok=True)
+        try:
+            train_path, valid_path = self._build_shared_datasets(X, y, work_dir)
+            return self._successive_halving(train_path, valid_path)
+        finally:
+            if self.work_dir is None:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _build_shared_datasets(self, X, y, work_dir):
+        """train / valid fold Dataset 을 한 번 구성해서 binary 로 저장"""
+        codes = self.trainer.encode_labels(y)
+        train_idx, valid_idx = train_test_split(
+            np.arange(len(codes)),
+            test_size=self.valid_size,
+            random_state=self.random_state,
+            stratify=codes,
+        )
+
+        params = self.dataset_params()
+        start = time.perf_counter()
+        train_set = self.trainer.build_dataset(X[train_idx], codes[train_idx], params=params)
+        valid_set = self.trainer.build_dataset(X[valid_idx], codes[valid_idx], reference=train_set, params=params)
+        self.dataset_seconds_ = time.perf_counter() - start
+
+        paths = os.path.join(work_dir, "train.bin"), os.path.join(work_dir, "valid.bin")
+        for dataset, path in zip((train_set, valid_set), paths):
+            dataset.save_binary(path)
+        return paths
+
+    def dataset_params(self):
+        """
+        공유 Dataset 구성 파라미터
+
+        feature_pre_filter 는 구성 시점의 min_data_in_leaf 로 feature 를 걸러내므로,
+        min_data_in_leaf 를 탐색하면 후보 중 최솟값으로 구성합니다. (분포로 주면 pre-filter 끔)
+        """
+        params = self.trainer.dataset_params()
+        values = self.param_space.get("min_data_in_leaf")
+        if values is None:
+            return params
+        if hasattr(values, "rvs"):
+            params["feature_pre_filter"] = False
+        else:
+            params["min_data_in_leaf"] = min(values)
+        return params
+
+    def _base_params(self):
+        params, _ = self.trainer.booster_params()
+        params["num_threads"] = self.threads_per_trial
+        if str(params.get("objective", "")).startswith("multiclass"):
+            params["num_class"] = len(self.trainer.classes_)
+            params.setdefault("metric", "multi_logloss")
+        else:
+            params.setdefault("metric", "binary_logloss")
+        return params
+
+    def _successive_halving(self, train_path, valid_path):
+        base = self._base_params()
+        dataset_params = self.dataset_params()
+        candidates = self.sample_params()
+
+        state = {
+            trial: {"model_str": None, "score": np.inf, "converged": False, "seconds": 0.0}
+            for trial in range(len(candidates))
+        }
+        rows = []
+        alive = list(state)
+        budgets = self.rungs()
+
+        with ProcessPoolExecutor(max_workers=self.n_workers) as pool:
+            for rung, rounds in enumerate(budgets):
+                tasks = [
+                    {
+                        "trial": trial,
+                        "params": {**base, **candidates[trial]},
+                        "dataset_params": dataset_params,
+                        "train_path": train_path,
+                        "valid_path": valid_path,
+                        "rounds": rounds,
+                        "early_stopping_rounds": self.early_stopping_rounds,
+                    }
+                    for trial in alive if not state[trial]["converged"]
+                ]
+                for result in pool.map(_run_trial, tasks):
+                    trial = result["trial"]
+                    state[trial].update(
+                        model_str=result["model_str"],
+                        score=result["score"],
+                        converged=result["converged"],
+                        seconds=state[trial]["seconds"] + result["seconds"],
+                    )
+                    rows.append({
+                        "trial": trial,
+                        "rung": rung,
+                        "budget": rounds,
+                        "rounds": result["rounds"],
+                        "best_iteration": result["best_iteration"],
+                        base["metric"]: result["score"],
+                        "seconds": result["seconds"],
+                        **candidates[trial],
+                    })
+
+                # 상위 1/eta 만 다음 rung 으로 (마지막 rung 이면 종료)
+                if rung < len(budgets) - 1:
+                    n_keep = max(1, len(alive) // self.eta)
+                    alive = sorted(alive, key=lambda t: state[t]["score"])[:n_keep]
+
+        # rung 별 기록 → trial 별 최종 결과 (마지막 rung 행 + 누적 시간 + 상태)
+        self.history_ = pd.DataFrame(rows)
+        report = self.history_.groupby("trial").tail(1).set_index("trial").sort_index()
+        report["seconds"] = [state[t]["seconds"] for t in report.index]
+        # early stopping 후 다음 rung 에서 탈락한 trial 도 pruned
+        report["status"] = [
+            "pruned" if t not in alive else "early_stopped" if state[t]["converged"] else "finished"
+            for t in report.index
+        ]
+        report = report.sort_values(base["metric"]).reset_index()
+
+        best_trial = min(alive, key=lambda t: state[t]["score"])
+        self.best_model_ = lgb.Booster(model_str=state[best_trial]["model_str"])
+
+        best_params = dict(self.trainer.params)
+        best_params.update(candidates[best_trial])
+        best_params.pop("num_boost_round", None)
+        best_params["n_estimators"] = int(report.loc[report["trial"] == best_trial, "best_iteration"].iloc[0])
+
+        self.best_params_ = best_params
+        self.report_ = report
+        return best_params, report
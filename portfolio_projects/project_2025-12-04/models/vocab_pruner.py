@@ -0,0 +1,95 @@
+"""
+Importance-driven TF-IDF vocabulary pruning for IntentPredictor
+"""
+
+import numpy as np
+
+from models.intent_predictor import IntentPredictor
+from models.lightgbm_trainer import LightGBMTrainer
+
+class VocabularyPruner:
+    """
+    학습된 LightGBM booster 의 feature importance (기본 gain) 로 TF-IDF vocabulary 를 줄이고,
+    줄인 vectorizer 출력으로 모델을 다시 학습해 더 작은 (vectorizer, model) 쌍을 만듭니다.
+
+    - text feature 는 gain 내림차순 누적 비율이 coverage 에 닿을 때까지 유지 (split 이 없던 n-gram 은 제거)
+    - numeric feature 는 항상 유지
+    - term 을 빼면 행의 l2 norm 이 바뀌어 기존 tree threshold 가 맞지 않으므로 booster 는 재사용하지 않고 재학습
+    """
+
+    def __init__(self, coverage=0.99, max_features=None, min_features=1, importance_type="gain"):
+        """
+        coverage: 유지할 text feature importance 누적 비율 (0 < coverage <= 1)
+        max_features: 유지할 text feature 수 상한 (None 이면 coverage 로만 결정)
+        importance_type: "gain" 또는 "split"
+        """
+        if not 0 < coverage <= 1:
+            raise ValueError(f"coverage must be in (0, 1], got {coverage}")
+
+        self.coverage = coverage
+        self.max_features = max_features
+        self.min_features = min_features
+        self.importance_type = importance_type
+
+        self.importance_ = None
+        self.keep_ = None
+        self.report_ = None
+
+    def select(self, booster, n_text):
+        """
+        booster 의 앞 n_text 개 (TF-IDF) feature 중 유지할 column index (오름차순)
+        """
+        importance = booster.feature_importance(importance_type=self.importance_type)[:n_text]
+        self.importance_ = importance
+        order = np.argsort(-importance, kind="stable")
+        total = importance.sum()
+
+        if total > 0:
+            cumulative = np.cumsum(importance[order]) / total
+            n_keep = int(np.searchsorted(cumulative, self.coverage - 1e-12)) + 1
+        else:
+            n_keep = 0
+        if self.max_features is not None:
+            n_keep = min(n_keep, self.max_features)
+        n_keep = min(max(n_keep, self.min_features), n_text)
+
+        return np.sort(order[:n_keep])
+
+    def prune(self, predictor, texts, numeric, y, params=None):
+        """
+        predictor 의 vocabulary 를 줄이고 (texts, numeric, y) 로 재학습한 새 IntentPredictor 를 반환합니다.
+
+        params: 재학습 LightGBM 파라미터 (None 이면 기존 trainer.params)
+        """
+        trainer = predictor.trainer
+        n_text = len(predictor.tfidf_builder.get_feature_names_out())
+
+        keep = self.select(trainer.model, n_text)
+        tfidf_builder = predictor.tfidf_builder.prune(keep)
+
+        # 학습 때 fit 한 scaler 를 그대로 쓰는 stateless 결합
+        X = predictor.fusion.transform(tfidf_builder.transform(texts), numeric)
+
+        pruned_trainer = LightGBMTrainer(
+            dict(params or trainer.params),
+            num_threads=trainer.num_threads,
+            free_raw_data=trainer.free_raw_data,
+            dataset_path=None,
+        )
+        pruned_trainer.train(X, y)
+
+        self.keep_ = keep
+        self.report_ = {
+            "n_text_before": n_text,
+            "n_text_after": len(keep),
+            "n_features_before": trainer.model.num_feature(),
+            "n_features_after": X.shape[1],
+            "importance_kept": float(self.importance_[keep].sum() / max(self.importance_.sum(), 1e-12)),
+        }
+        return IntentPredictor(
+            tfidf_builder,
+            predictor.fusion,
+            pruned_trainer,
+            predictor.numeric_cols,
+            num_threads=predictor.num_threads,
+        )
@@ -2,20 +2,27 @@
 Day3 Main Training Pipeline
 """
 
+import argparse
+
 import pandas as pd
 from feature_store.intent_feature_loader import IntentFeatureLoader
 from feature_store.tfidf_builder import TFIDFBuilder
 from feature_store.feature_fusion import FeatureFusion
+from models.intent_predictor import IntentPredictor
 from models.lightgbm_trainer import LightGBMTrainer
+from models.vocab_pruner import VocabularyPruner
 
 
-def run():
+def run(tune=False, n_trials=16, prune_coverage=None, dataset_cache=None):
     """
     Day3 전체 파이프라인 실행:
     1) Load session features
     2) TF-IDF vectorize
     3) numeric stats 결합
-    4) LightGBM 모델 학습
+    4) (tune=True 이면 hyperparameter 탐색 후) LightGBM 모델 학습
+    5) (prune_coverage 가 있으면) gain importance 기준으로 TF-IDF vocabulary 를 줄이고 재학습
+
+    dataset_cache: LightGBM binary Dataset cache 경로 (None 이면 매번 새로 구성)
     """
     print("[INFO] Loading session features...")
     loader = IntentFeatureLoader()
@@ -31,14 +38,44 @@ def run():
     print("[INFO] Combining sparse text features + numeric stats...")
     fusion = FeatureFusion()
     X = fusion.combine(tfidf_matrix, stats_df)
+    report = fusion.memory_report(X)
+    print(f"[INFO] Fused matrix {report['shape']} {report['dtype']} CSR: "
+          f"{report['total_mb']:.1f} MB (dense float64 {report['dense_float64_mb']:.1f} MB)")
 
     print("[INFO] Training LightGBM model...")
-    trainer = LightGBMTrainer()
+    trainer = LightGBMTrainer(dataset_path=dataset_cache)
+    if tune:
+        print(f"[INFO] Tuning hyperparameters ({n_trials} trials, successive halving)...")
+        report = trainer.tune(X, df["intent_label"], n_trials=n_trials)
+        print(report.to_string(index=False))
+        print(f"[INFO] Best params: {trainer.params}")
     model = trainer.train(X, df["intent_label"])
-    trainer.save()
+    print(f"[INFO] Dataset {trainer.timings_['dataset_sec']:.2f}s "
+          f"(binary cache: {trainer.dataset_path}), train {trainer.timings_['train_sec']:.2f}s")
 
-    print("[INFO] Training completed. Model saved to models/lightgbm_model.pkl")
+    # booster + fit 된 TF-IDF / fusion 을 함께 저장 → IntentPredictor.load 로 online scoring
+    predictor = IntentPredictor(tfidf_builder, fusion, trainer, numeric_cols)
+    if prune_coverage is not None:
+        print(f"[INFO] Pruning TF-IDF vocabulary (gain coverage {prune_coverage})...")
+        pruner = VocabularyPruner(coverage=prune_coverage)
+        predictor = pruner.prune(predictor, df["session_text"], stats_df, df["intent_label"])
+        report = pruner.report_
+        print(f"[INFO] Vocabulary {report['n_text_before']:,} -> {report['n_text_after']:,} n-grams "
+              f"({report['importance_kept']:.1%} of gain kept)")
+    model_dir = predictor.save("models/intent_predictor")
+
+    print(f"[INFO] Training completed. Model saved to {model_dir}/model.txt")
 
 
 if __name__ == "__main__":
-    run()
+    parser = argparse.ArgumentParser(description="Day3 Training Pipeline")
+    parser.add_argument("--tune", action="store_true", help="hyperparameter 탐색 후 best params 로 학습")
+    parser.add_argument("--n-trials", type=int, default=16)
+    parser.add_argument("--prune-coverage", type=float, default=None,
+                        help="gain importance 누적 비율 기준 TF-IDF vocabulary pruning (예: 0.99)")
+    parser.add_argument("--dataset-cache", default=None,
+                        help="LightGBM binary Dataset cache 경로 (예: models/lightgbm_train.bin)")
+    args = parser.parse_args()
+
+    run(tune=args.tune, n_trials=args.n_trials, prune_coverage=args.prune_coverage,
+        dataset_cache=args.dataset_cache)
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.preprocessing import StandardScaler
+
+from feature_store.feature_fusion import FeatureFusion
+from feature_store.tfidf_builder import TFIDFBuilder
+
+
+def test_feature_fusion_csr_float32_and_block_reuse():
+    texts = pd.Series(["search suv deals", "view charger page", "add to cart purchase", "view suv page"])
+    stats = pd.DataFrame({
+        "event_count": [3, 5, 2, 0],
+        "unique_event_count": [2, 4, 2, 0],
+        "mean_gap": [10.0, 0.0, np.nan, 3.5],
+        "max_gap": [20.0, 0.0, 1.0, 7.0],
+    })
+    tfidf = TFIDFBuilder().fit_transform(texts)
+
+    fusion = FeatureFusion()
+    X = fusion.combine(tfidf, stats)
+
+    assert sp.isspmatrix_csr(X) and X.dtype == np.float32
+    assert X.shape == (4, tfidf.shape[1] + 4)
+    expected = np.hstack([tfidf.toarray(), stats.to_numpy()]).astype(np.float32)
+    np.testing.assert_array_equal(X.toarray(), expected)
+
+    # numeric 만 바뀐 경우: text block 재사용 결과가 전체 재결합과 같아야 함
+    new_stats = stats * 2
+    reused = fusion.combine(numeric_df=new_stats)
+    np.testing.assert_array_equal(reused.toarray(), FeatureFusion().combine(tfidf, new_stats).toarray())
+    assert np.shares_memory(reused.indices, X.indices)
+
+    report = fusion.memory_report(X)
+    assert report["nnz"] == X.nnz and report["total_mb"] > 0
+
+
+def test_feature_fusion_streaming_scaler_matches_full_fit():
+    rng = np.random.default_rng(0)
+    stats = pd.DataFrame(rng.normal(50, 10, (1_000, 4)), columns=["a", "b", "c", "d"])
+
+    fusion = FeatureFusion(scaler="standard").fit(np.array_split(stats, 7))
+    scaled = fusion.transform_numeric(stats).toarray()
+
+    expected = StandardScaler().fit_transform(stats).astype(np.float32)
+    np.testing.assert_allclose(scaled, expected, rtol=1e-4, atol=1e-5)
@@ -0,0 +1,96 @@
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.base import clone
+
+from feature_store.feature_fusion import FeatureFusion
+from feature_store.tfidf_builder import TFIDFBuilder
+from models.intent_predictor import IntentPredictor
+from models.lightgbm_trainer import LightGBMTrainer
+from models.vocab_pruner import VocabularyPruner
+
+
+@pytest.fixture
+def sessions():
+    # 모든 세션에 있는 "home" 은 intent 구분에 쓰이지 않는 n-gram
+    texts = pd.Series(
+        ["search suv deals compare suv price home", "view charger page charger subsidy home",
+         "add to cart purchase complete home", "contact support chat faq home"] * 30
+    )
+    labels = np.array(["suv", "ev", "buy", "support"] * 30)
+    stats = pd.DataFrame({"event_count": np.arange(120) % 7, "mean_gap": np.arange(120) % 5 * 10.0})
+    return texts, labels, stats
+
+
+@pytest.fixture
+def fitted(sessions):
+    """학습된 IntentPredictor 와 학습 행렬 X"""
+    texts, labels, stats = sessions
+    tfidf_builder = TFIDFBuilder()
+    fusion = FeatureFusion()
+    X = fusion.combine(tfidf_builder.fit_transform(texts), stats)
+    trainer = LightGBMTrainer(
+        {"objective": "multiclass", "n_estimators": 10, "min_data_in_leaf": 5, "random_state": 42},
+        dataset_path=None,
+    )
+    trainer.train(X, labels)
+    return IntentPredictor(tfidf_builder, fusion, trainer, list(stats.columns)), X
+
+
+def test_intent_predictor_native_roundtrip(sessions, fitted, tmp_path):
+    texts, _, stats = sessions
+    predictor, X = fitted
+
+    predictor.save(str(tmp_path))
+    assert (tmp_path / "model.txt").read_text().startswith("tree")
+
+    # 저장해도 호출한 쪽 fusion 의 block cache 는 유지, 저장된 fusion 에는 block 없음
+    np.testing.assert_array_equal(predictor.fusion.combine(numeric_df=stats).toarray(), X.toarray())
+    assert joblib.load(tmp_path / "fusion.joblib").fused_ is None
+
+    loaded = IntentPredictor.load(str(tmp_path))
+    np.testing.assert_allclose(loaded.predict_proba(texts[:8], stats[:8]), predictor.trainer.predict_proba(X[:8]))
+    assert loaded.predict("add to cart purchase complete")[0] == "buy"
+
+    report = loaded.latency_report()
+    assert report["calls"] == 2 and report["rows"] == 9 and report["p99_ms"] >= report["p50_ms"]
+
+    # rows 도 calls / p50 / p99 와 같은 최근 window 기준
+    windowed = IntentPredictor(
+        predictor.tfidf_builder, predictor.fusion, predictor.trainer, predictor.numeric_cols, latency_window=1
+    )
+    windowed.predict_proba(texts[:8], stats[:8])
+    windowed.predict_proba(texts[:3], stats[:3])
+    assert windowed.latency_report()["calls"] == 1 and windowed.latency_report()["rows"] == 3
+
+
+def test_vocab_pruner_keeps_important_ngrams(sessions, fitted):
+    texts, labels, stats = sessions
+    predictor, _ = fitted
+    tfidf_builder = predictor.tfidf_builder
+
+    pruner = VocabularyPruner(coverage=0.99)
+    pruned = pruner.prune(predictor, texts, stats, labels)
+
+    n_text = len(tfidf_builder.get_feature_names_out())
+    assert 0 < pruner.report_["n_text_after"] < n_text
+    # 모든 세션에 있는 "home" 은 split 에 쓰이지 않으므로 제거
+    assert "home" not in pruned.tfidf_builder.get_feature_names_out()
+    # 남은 n-gram 의 IDF 는 원래 vectorizer 값 그대로
+    np.testing.assert_allclose(
+        pruned.tfidf_builder.vectorizer.idf_, tfidf_builder.vectorizer.idf_[pruner.keep_]
+    )
+    # 남은 n-gram 만 만드는 analyzer 도 기본 word analyzer 와 같은 행렬
+    reference = clone(tfidf_builder.vectorizer).set_params(
+        vocabulary=list(pruned.tfidf_builder.get_feature_names_out()), max_features=None
+    )
+    reference.idf_ = tfidf_builder.vectorizer.idf_[pruner.keep_]
+    np.testing.assert_allclose(
+        pruned.tfidf_builder.transform(texts.str.upper()).toarray(), reference.transform(texts).toarray()
+    )
+    assert pruned.transform(texts[:4], stats[:4]).shape[1] == pruner.report_["n_features_after"]
+    assert (pruned.predict(texts, stats) == labels).all()
+
+    with pytest.raises(ValueError):
+        TFIDFBuilder(mode="hashing").prune([0])
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pytest
+
+from models.lightgbm_trainer import LightGBMTrainer
+from models.lightgbm_tuner import LightGBMTuner
+
+
+def test_trainer_reuses_binary_dataset_cache(tmp_path):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(400, 6)).astype(np.float32)
+    y = np.array(["browse", "buy", "support"])[np.argmax(X[:, :3], axis=1)]
+    params = {"objective": "multiclass", "n_estimators": 20, "num_leaves": 8, "random_state": 42}
+    dataset_path = str(tmp_path / "train.bin")
+
+    trainer = LightGBMTrainer(params, num_threads=1, dataset_path=dataset_path)
+    trainer.train(X, y)
+    assert (trainer.predict(X) == y).mean() > 0.9
+
+    # X 없이 cache 만으로 재학습해도 같은 모델
+    cached = LightGBMTrainer(params, num_threads=1, dataset_path=dataset_path)
+    cached.train(None, None)
+    assert list(cached.classes_) == ["browse", "buy", "support"]
+    np.testing.assert_allclose(cached.predict_proba(X), trainer.predict_proba(X))
+
+    # 데이터가 바뀌면 cache 를 다시 구성
+    rebuilt = LightGBMTrainer(params, num_threads=1, dataset_path=dataset_path)
+    rebuilt.train(X[:200], y[:200])
+    assert rebuilt.model.num_trees() == 20 * 3
+    assert cached.dataset().num_data() == 200
+
+    # metadata (.json) 가 없는 cache 는 쓰지 않음: X 없이는 명확한 에러, X 가 있으면 다시 구성
+    os.remove(dataset_path + ".json")
+    with pytest.raises(ValueError, match="No cached dataset"):
+        LightGBMTrainer(params, num_threads=1, dataset_path=dataset_path).dataset()
+    assert LightGBMTrainer(params, num_threads=1, dataset_path=dataset_path).dataset(X, y).num_data() == 400
+    assert os.path.exists(dataset_path + ".json")
+
+
+def test_trainer_dataset_cache_is_opt_in():
+    assert LightGBMTrainer().dataset_path is None
+
+
+def test_tuner_successive_halving_report():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(600, 6)).astype(np.float32)
+    y = np.argmax(X[:, :3] + rng.normal(scale=0.5, size=(600, 3)), axis=1)
+
+    # learning_rate 가 커서 일부 trial 은 budget 전에 early stopping 됨
+    trainer = LightGBMTrainer(
+        {"objective": "multiclass", "n_estimators": 50, "learning_rate": 0.5, "random_state": 42},
+        dataset_path=None,
+    )
+    tuner = LightGBMTuner(
+        trainer,
+        {"num_leaves": [4, 8, 16], "min_data_in_leaf": [5, 20, 40]},
+        n_trials=6,
+        n_workers=2,
+        threads_per_trial=1,
+        min_rounds=5,
+        max_rounds=45,
+        early_stopping_rounds=3,
+    )
+    best_params, report = tuner.search(X, y)
+
+    assert tuner.rungs() == [5, 15, 45]
+    assert len(report) == 6 and set(report["status"]) <= {"finished", "early_stopped", "pruned"}
+    assert (report["status"] == "pruned").sum() == 5
+
+    # early stopping 된 뒤 다음 rung 에서 탈락한 trial 은 pruned, 끝까지 남은 trial 만 early_stopped / finished
+    history = tuner.history_
+    stopped = set(history.loc[history["rounds"] < history["budget"], "trial"])
+    status = report.set_index("trial")["status"]
+    best_trial = report["trial"].iloc[0]
+    stopped_then_pruned = stopped - {best_trial}
+    assert stopped_then_pruned
+    assert (status[sorted(stopped_then_pruned)] == "pruned").all()
+    assert status[best_trial] == ("early_stopped" if best_trial in stopped else "finished")
+    assert report["multi_logloss"].is_monotonic_increasing
+    assert best_params["num_leaves"] == report["num_leaves"].iloc[0]
+    assert 1 <= best_params["n_estimators"] <= 45
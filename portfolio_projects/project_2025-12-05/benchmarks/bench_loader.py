@@ -0,0 +1,72 @@
+# benchmarks/bench_loader.py
+"""
+원천 로그 로딩 benchmark: pd.read_csv(path) (dtype 추론) vs schema 기반 FeatureLoader
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_loader --rows 5000000 --out /tmp/bench_logs.csv
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from feature_store.loader import FeatureLoader
+
+EVENT_TYPES = np.array(["view", "click", "add_to_cart", "purchase", "search"])
+
+
+def make_logs(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """user_id / item_id / event_type / ts + 로더가 쓰지 않는 컬럼 하나"""
+    rng = np.random.default_rng(seed)
+    ts = np.datetime64("2025-01-01T00:00:00") + np.sort(rng.integers(0, 86_400 * 30, n_rows)).astype("timedelta64[s]")
+    return pd.DataFrame({
+        "user_id": rng.integers(0, 1_000_000, n_rows),
+        "item_id": rng.integers(0, 200_000, n_rows),
+        "event_type": EVENT_TYPES[rng.integers(0, len(EVENT_TYPES), n_rows)],
+        "ts": pd.to_datetime(ts).strftime("%Y-%m-%d %H:%M:%S"),
+        "referrer": rng.choice(["google", "direct", "email", "ads"], n_rows),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--out", default="/tmp/bench_logs.csv")
+    parser.add_argument("--chunksize", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    make_logs(args.rows).to_csv(args.out, index=False)
+    print(f"[{args.rows:,} rows → {args.out}]")
+
+    start = time.perf_counter()
+    legacy = pd.read_csv(args.out)
+    legacy["ts"] = pd.to_datetime(legacy["ts"])
+    legacy_sec = time.perf_counter() - start
+    legacy_mb = legacy.memory_usage(deep=True).sum() / 1e6
+    print(f"  pd.read_csv + to_datetime : {legacy_sec:7.3f}s  {legacy_mb:8.1f} MB")
+
+    loader = FeatureLoader()
+    start = time.perf_counter()
+    typed = loader.load_logs(args.out)
+    typed_sec = time.perf_counter() - start
+    typed_mb = typed.memory_usage(deep=True).sum() / 1e6
+    print(f"  FeatureLoader (schema)    : {typed_sec:7.3f}s  {typed_mb:8.1f} MB"
+          f"  (x{legacy_sec / typed_sec:.1f} faster, x{legacy_mb / typed_mb:.1f} less memory)")
+
+    start = time.perf_counter()
+    peak_mb = 0.0
+    n_rows = 0
+    for chunk in loader.load_logs(args.out, chunksize=args.chunksize):
+        peak_mb = max(peak_mb, chunk.memory_usage(deep=True).sum() / 1e6)
+        n_rows += len(chunk)
+    chunk_sec = time.perf_counter() - start
+    print(f"  FeatureLoader (chunks)    : {chunk_sec:7.3f}s  {peak_mb:8.1f} MB per chunk")
+
+    assert n_rows == len(typed) == len(legacy)
+    assert (typed["ts"].to_numpy() == legacy["ts"].to_numpy()).all()
+
+
+if __name__ == "__main__":
+    main()
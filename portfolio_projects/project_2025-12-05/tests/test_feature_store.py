@@ -1,4 +1,6 @@
 # tests/test_feature_store.py
+import os
+import tempfile
 import unittest
 import pandas as pd
 from feature_store.loader import FeatureLoader
@@ -24,6 +26,64 @@ class TestFeatureStore(unittest.TestCase):
 
         assert len(loaded) == 2
 
+    def test_loader_parquet_projection_and_filter(self):
+        sample = pd.DataFrame({
+            'user_id': [1, 2, 3],
+            'item_id': [10, 20, 30],
+            'event_type': ['view', 'click', 'view'],
+            'ts': ['2025-01-01 10:00', '2025-01-01 10:02', '2025-01-01 10:05']
+        })
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'sample.parquet')
+            sample.to_parquet(path, index=False)
+
+            loader = FeatureLoader()
+            loaded = loader.load_logs(path)
+            assert str(loaded['event_type'].dtype) == 'category'
+            assert len(loaded) == 3
+
+            views = loader.load_logs(
+                path,
+                columns=['user_id', 'event_type'],
+                filters=[('event_type', '=', 'view')],
+            )
+            assert list(views.columns) == ['user_id', 'event_type']
+            assert views['user_id'].tolist() == [1, 3]
+
+    def test_loader_declared_schema_and_chunks(self):
+        sample = pd.DataFrame({
+            'user_id': [1, 2, 3, 4, 5],
+            'item_id': [10, 20, 30, 40, 50],
+            'event_type': ['view', 'click', 'view', 'view', 'click'],
+            'ts': ['2025-01-01 10:00', '2025-01-01 10:02', '2025-01-01 10:05',
+                   '2025-01-01 10:07', '2025-01-01 10:09'],
+            'debug': ['a', 'b', 'c', 'd', 'e'],
+        })
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'sample.csv')
+            sample.to_csv(path, index=False)
+
+            loader = FeatureLoader()
+            loaded = loader.load_logs(path)
+            assert list(loaded.columns) == ['user_id', 'item_id', 'event_type', 'ts']
+            assert str(loaded['user_id'].dtype) == 'int32'
+            assert str(loaded['event_type'].dtype) == 'category'
+            assert str(loaded['ts'].dtype) == 'datetime64[ns]'
+
+            chunks = list(loader.load_logs(path, chunksize=2))
+            assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+            pd.testing.assert_frame_equal(
+                pd.concat(chunks, ignore_index=True).astype({'event_type': 'str'}),
+                loaded.astype({'event_type': 'str'}),
+            )
+
+            # body 를 읽기 전에 header 에서 누락 컬럼 검출
+            sample.drop(columns=['item_id']).to_csv(path, index=False)
+            with self.assertRaises(ValueError):
+                loader.load_logs(path)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,84 @@
+# benchmarks/bench_user_features.py
+"""
+UserFeatures benchmark: groupby 3회 + concat (기존) vs GroupAggregator 단일 group index
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_user_features --events 5000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from feature_store.user_features import UserFeatures
+
+EVENTS = np.array(["view", "click", "add_to_cart", "purchase"])
+
+
+def make_events(n_events: int, n_users: int, n_items: int, seed: int = 42) -> pd.DataFrame:
+    """data/events.csv 와 같은 컬럼 (user_id, item_id, event, timestamp, is_click)"""
+    rng = np.random.default_rng(seed)
+    event = EVENTS[rng.integers(0, len(EVENTS), n_events)]
+    ts = np.datetime64("2025-01-01T00:00:00") + rng.integers(0, 86_400 * 30, n_events).astype("timedelta64[s]")
+    return pd.DataFrame({
+        "user_id": rng.integers(0, n_users, n_events),
+        "item_id": rng.integers(0, n_items, n_events),
+        "event": event,
+        "timestamp": ts,
+        "is_click": (event == "click").astype(np.int64),
+    })
+
+
+def legacy_user_features(df: pd.DataFrame) -> pd.DataFrame:
+    """변경 전 UserFeatures.transform"""
+    total_events = df.groupby("user_id").size().rename("user_total_events")
+    unique_items = df.groupby("user_id")["item_id"].nunique().rename("user_unique_items")
+    click_count = df[df["is_click"] == 1].groupby("user_id").size().rename("user_clicks")
+
+    user_features = pd.concat([total_events, unique_items, click_count], axis=1).fillna(0)
+    user_features.reset_index(inplace=True)
+    return user_features.astype(UserFeatures().schema())
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5_000_000)
+    parser.add_argument("--users", type=int, default=500_000)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_events(args.events, args.users, args.items)
+    print(f"[{args.events:,} events, {args.users:,} users, {args.items:,} items]")
+
+    features = UserFeatures()
+    legacy_sec = best_of(lambda: legacy_user_features(df), args.repeat)
+    print(f"  groupby x3 + concat      : {legacy_sec:7.3f}s")
+
+    engine_sec = best_of(lambda: features.transform(df), args.repeat)
+    print(f"  GroupAggregator (1 index): {engine_sec:7.3f}s  (x{legacy_sec / engine_sec:.1f})")
+
+    # feature 하나를 더 등록해도 group index 는 한 번만 생성
+    features.register("user_purchases", "count", where=lambda d: d["event"] == "purchase")
+    extra_sec = best_of(lambda: features.transform(df), args.repeat)
+    print(f"  + user_purchases         : {extra_sec:7.3f}s")
+
+    pd.testing.assert_frame_equal(
+        legacy_user_features(df),
+        UserFeatures().transform(df),
+    )
+
+
+if __name__ == "__main__":
+    main()
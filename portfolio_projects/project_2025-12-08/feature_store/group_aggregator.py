@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+
+
+class GroupIndex:
+    """group key 를 한 번만 factorize 해 두고 여러 집계에서 공유하는 인덱스
+
+    groupby 를 집계마다 새로 만들면 그때마다 key 를 다시 hash 하지만,
+    GroupIndex 는 codes (행 → 그룹 번호) 를 한 번 만든 뒤
+    np.bincount 기반으로 모든 집계를 계산합니다.
+    """
+
+    def __init__(self, keys):
+        keys = np.asarray(keys)
+        if self._is_dense_ids(keys):
+            # 0 이상의 촘촘한 정수 id 는 hash 없이 bincount 로 존재 여부 → 번호 매핑
+            present = np.bincount(keys) > 0
+            self.keys = np.flatnonzero(present).astype(keys.dtype)
+            self.codes = (np.cumsum(present) - 1)[keys]
+        else:
+            # sort=True: groupby 와 같은 key 오름차순 출력
+            self.codes, self.keys = pd.factorize(keys, sort=True)
+        self.n_groups = len(self.keys)
+
+    @staticmethod
+    def _is_dense_ids(keys: np.ndarray) -> bool:
+        """key 범위가 행 수의 몇 배 이내인 0 이상 정수인지 (bincount 배열이 작을 때만)"""
+        if len(keys) == 0 or keys.dtype.kind not in "iu":
+            return False
+        return keys.min() >= 0 and keys.max() < 4 * len(keys) + 1024
+
+    def count(self, mask=None) -> np.ndarray:
+        """그룹별 행 수 (mask 가 있으면 mask 가 True 인 행만)"""
+        if mask is None:
+            return np.bincount(self.codes, minlength=self.n_groups)
+        return np.bincount(self.codes, weights=mask, minlength=self.n_groups).astype(np.int64)
+
+    def sum(self, values, mask=None) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        if mask is not None:
+            values = np.where(mask, values, 0.0)
+        return np.bincount(self.codes, weights=values, minlength=self.n_groups)
+
+    def mean(self, values, mask=None) -> np.ndarray:
+        counts = self.count(mask)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.sum(values, mask) / counts
+
+    def count_by(self, values, categories=None):
+        """그룹 x 값 별 행 수를 bincount 한 번으로 계산 (pivot)
+
+        categories 를 주면 그 값들만 그 순서대로 세고, 나머지 값은 무시합니다.
+
+        Returns:
+            counts: (n_groups, n_categories) int64 배열
+            categories: counts 의 열에 해당하는 값 (pd.Index)
+        """
+        if categories is None:
+            value_codes, categories = pd.factorize(values, sort=True)
+        else:
+            # 행 단위 조회 대신 factorize 후 고유 값 단위로만 categories 에 매핑
+            categories = pd.Index(categories)
+            codes, uniques = pd.factorize(values)
+            lookup = np.append(categories.get_indexer(uniques), -1)
+            value_codes = lookup[codes]
+
+        keep = value_codes >= 0
+        flat = self.codes[keep].astype(np.int64) * len(categories) + value_codes[keep]
+        counts = np.bincount(flat, minlength=self.n_groups * len(categories))
+        return counts.reshape(self.n_groups, len(categories)), pd.Index(categories)
+
+    def nunique(self, values, mask=None) -> np.ndarray:
+        """그룹별 고유 값 수 (NaN 제외)
+
+        (그룹 번호, 값 번호) 쌍을 int64 하나로 묶어 정렬한 뒤 바뀌는 지점만 셉니다.
+        고유 쌍이 많을 때 hash 기반 unique 보다 정렬 한 번이 훨씬 빠릅니다.
+        """
+        value_codes, uniques = pd.factorize(values)
+        keep = value_codes >= 0
+        if mask is not None:
+            keep &= np.asarray(mask, dtype=bool)
+
+        pairs = np.sort(self.codes[keep].astype(np.int64) * len(uniques) + value_codes[keep])
+        first = np.ones(len(pairs), dtype=bool)
+        np.not_equal(pairs[1:], pairs[:-1], out=first[1:])
+
+        groups = pairs[first] // max(len(uniques), 1)
+        return np.bincount(groups, minlength=self.n_groups)
+
+
+class GroupAggregator:
+    """이름을 붙여 등록한 집계를 GroupIndex 하나로 한 번에 계산
+
+    예)
+        agg = GroupAggregator("user_id")
+        agg.register("user_total_events", "count")
+        agg.register("user_unique_items", "nunique", column="item_id")
+        agg.register("user_clicks", "count", where=lambda df: df["is_click"] == 1)
+        features = agg.aggregate(df)
+
+    - how: "count" / "sum" / "mean" / "nunique" 또는 callable(index, df) -> 그룹별 배열
+    - where: callable(df) -> bool mask. 필터링한 DataFrame 복사본 대신
+      mask 가중치로 계산합니다 (masked sum).
+    """
+
+    HOWS = ("count", "sum", "mean", "nunique")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.aggregates = {}
+
+    def register(self, name: str, how, column: str = None, where=None):
+        if not callable(how) and how not in self.HOWS:
+            raise ValueError(f"Unknown aggregate {how!r}; expected one of {self.HOWS} or a callable")
+        if how in ("sum", "mean", "nunique") and column is None:
+            raise ValueError(f"Aggregate {how!r} requires a column")
+
+        self.aggregates[name] = (how, column, where)
+        return self
+
+    def aggregate(self, df: pd.DataFrame) -> pd.DataFrame:
+        index = GroupIndex(df[self.key])
+
+        result = {self.key: index.keys}
+        for name, (how, column, where) in self.aggregates.items():
+            mask = None if where is None else np.asarray(where(df), dtype=bool)
+
+            if callable(how):
+                result[name] = how(index, df)
+            elif how == "count":
+                result[name] = index.count(mask)
+            else:
+                result[name] = getattr(index, how)(df[column].to_numpy(), mask)
+
+        return pd.DataFrame(result)
@@ -1,23 +1,54 @@
+import numpy as np
 import pandas as pd
 
+from feature_store.group_aggregator import GroupIndex
+
+
 class ItemFeatures:
-    """아이템 단위 Feature 생성"""
+    """아이템 단위 Feature 생성
+
+    이벤트 종류별 횟수를 (item_id, event) 한 번의 bincount 로 pivot 해서 계산합니다.
+    events 에 이벤트 종류를 추가해도 데이터는 한 번만 훑습니다.
+    """
 
-    def __init__(self):
-        pass
+    EVENTS = {"view": "item_views", "click": "item_clicks"}
+
+    def __init__(self, events: dict = None, ctr=("click", "view")):
+        """
+        events: {이벤트 이름: 출력 컬럼} (기본값 ItemFeatures.EVENTS)
+        ctr: (분자 이벤트, 분모 이벤트). None 이면 item_ctr 을 만들지 않음
+        """
+        self.events = dict(self.EVENTS if events is None else events)
+        self.ctr = ctr
+        if ctr is not None and not set(ctr) <= set(self.events):
+            raise ValueError(f"CTR events {ctr} must be listed in events")
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """item-level aggregation features"""
 
-        # 전체 조회 횟수
-        total_views = df[df["event"] == "view"].groupby("item_id").size().rename("item_views")
+        # (item, event) 별 횟수: 선택한 이벤트 외의 행은 무시
+        index = GroupIndex(df["item_id"])
+        counts, events = index.count_by(df["event"], categories=list(self.events))
+
+        # 선택한 이벤트가 하나라도 있는 아이템만
+        has_events = counts.any(axis=1)
+        counts = counts[has_events]
+
+        item_features = pd.DataFrame(counts, columns=[self.events[e] for e in events])
+        item_features.insert(0, "item_id", index.keys[has_events])
 
-        # 클릭 횟수
-        total_clicks = df[df["event"] == "click"].groupby("item_id").size().rename("item_clicks")
+        # CTR 계산 (분모가 0 이면 1 로 나눔)
+        if self.ctr is not None:
+            clicks = counts[:, events.get_loc(self.ctr[0])]
+            views = counts[:, events.get_loc(self.ctr[1])]
+            item_features["item_ctr"] = clicks / np.maximum(views, 1)
 
-        # CTR 계산
-        item_features = pd.concat([total_views, total_clicks], axis=1).fillna(0)
-        item_features["item_ctr"] = item_features["item_clicks"] / item_features["item_views"].replace(0, 1)
+        return item_features.astype(self.schema())
 
-        item_features.reset_index(inplace=True)
-        return item_features
+    def schema(self) -> dict:
+        """출력 컬럼과 dtype (저장 시 schema 로 사용)"""
+        schema = {"item_id": "int64"}
+        schema.update({column: "int64" for column in self.events.values()})
+        if self.ctr is not None:
+            schema["item_ctr"] = "float64"
+        return schema
@@ -1,29 +1,40 @@
 import pandas as pd
 
+from feature_store.group_aggregator import GroupAggregator
+
+
 class UserFeatures:
-    """사용자 단위 Feature 생성"""
+    """사용자 단위 Feature 생성
 
-    def __init__(self):
-        pass
+    모든 feature 는 GroupAggregator 에 이름을 붙여 등록되고,
+    user_id 를 한 번 factorize 한 그룹 인덱스로 한 번에 계산됩니다.
+    새 feature 는 register 로 추가하면 되고 groupby 가 늘어나지 않습니다.
+    """
 
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        """user-level aggregation features"""
+    def __init__(self):
+        self.aggregator = GroupAggregator("user_id")
+        self.dtypes = {}
 
         # 전체 이벤트 수
-        total_events = df.groupby("user_id").size().rename("user_total_events")
+        self.register("user_total_events", "count")
 
         # 고유 아이템 수
-        unique_items = df.groupby("user_id")["item_id"].nunique().rename("user_unique_items")
-
-        # 클릭 수
-        click_count = (
-            df[df["is_click"] == 1]
-            .groupby("user_id")
-            .size()
-            .rename("user_clicks")
-        )
-
-        # merge
-        user_features = pd.concat([total_events, unique_items, click_count], axis=1).fillna(0)
-        user_features.reset_index(inplace=True)
-        return user_features
+        self.register("user_unique_items", "nunique", column="item_id")
+
+        # 클릭 수 (필터링한 복사본 대신 is_click mask 로 count)
+        self.register("user_clicks", "count", where=lambda df: df["is_click"] == 1)
+
+    def register(self, name: str, how, column: str = None, where=None, dtype: str = "int64"):
+        """named aggregate 추가 (GroupAggregator.register 참고)"""
+        self.aggregator.register(name, how, column=column, where=where)
+        self.dtypes[name] = dtype
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """user-level aggregation features"""
+        user_features = self.aggregator.aggregate(df)
+        return user_features.astype(self.schema())
+
+    def schema(self) -> dict:
+        """출력 컬럼과 dtype (저장 시 schema 로 사용)"""
+        return {"user_id": "int64", **self.dtypes}
@@ -1,15 +1,45 @@
 import sys, os
 sys.path.append(os.getcwd())
 
+import argparse
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from feature_store.event_store import EventStore
+from feature_store.parquet_store import ParquetStore
 from feature_store.user_features import UserFeatures
 from feature_store.item_features import ItemFeatures
 
+
+def to_arrow_schema(schema: dict) -> pa.Schema:
+    """Feature 클래스의 {컬럼: dtype} → pyarrow schema"""
+    return pa.schema([(col, pa.from_numpy_dtype(np.dtype(dtype))) for col, dtype in schema.items()])
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Day3 Feature Store Pipeline")
+    parser.add_argument(
+        "--export-csv",
+        action = "store_true",
+        help = "also write data/user_features.csv / data/item_features.csv",
+    )
+    parser.add_argument(
+        "--event-store",
+        help = "ingest data/events.csv once into this memory-mapped store and reuse it",
+    )
+    args = parser.parse_args()
+
     print("🔵 Day3 Feature Store Pipeline started...")
 
-    # 1) Load data
-    df = pd.read_csv("data/events.csv", parse_dates=["timestamp"])
+    # 1) Load data (--event-store: CSV 는 처음 한 번만 파싱, 이후 memory-map open)
+    if args.event_store:
+        store = EventStore(args.event_store)
+        if not store.is_fresh("data/events.csv"):
+            store.ingest("data/events.csv", time_cols=["timestamp"], text_cols=["event"])
+        df = store.open()
+    else:
+        df = pd.read_csv("data/events.csv", parse_dates=["timestamp"])
 
     # 2) Feature creators
     uf = UserFeatures()
@@ -19,11 +49,19 @@ if __name__ == "__main__":
     user_df = uf.transform(df)
     item_df = ife.transform(df)
 
-    # 4) Save
-    user_df.to_csv("data/user_features.csv", index = False)
-    item_df.to_csv("data/item_features.csv", index = False)
+    # 4) Save (Parquet dataset, schema 고정 / zstd 압축, CSV 는 선택)
+    ParquetStore(
+        "data/user_features",
+        schema = to_arrow_schema(uf.schema()),
+        export_csv = "data/user_features.csv" if args.export_csv else None,
+    ).write(user_df)
+    ParquetStore(
+        "data/item_features",
+        schema = to_arrow_schema(ife.schema()),
+        export_csv = "data/item_features.csv" if args.export_csv else None,
+    ).write(item_df)
 
     print("Feature Store build completed!")
     print("Saved files:")
-    print("- data/user_features.csv")
-    print("- data/item_features.csv")
+    print("- data/user_features/ (parquet)")
+    print("- data/item_features/ (parquet)")
@@ -0,0 +1,68 @@
+# tests/test_features.py
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from feature_store.item_features import ItemFeatures
+from feature_store.user_features import UserFeatures
+
+
+class TestUserFeatures(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.read_csv("data/events.csv")
+
+    def test_matches_groupby(self):
+        df = self.df
+        expected = pd.DataFrame({
+            "user_total_events": df.groupby("user_id").size(),
+            "user_unique_items": df.groupby("user_id")["item_id"].nunique(),
+            "user_clicks": df[df["is_click"] == 1].groupby("user_id").size(),
+        }).fillna(0).reset_index().astype("int64")
+
+        pd.testing.assert_frame_equal(UserFeatures().transform(df), expected)
+
+    def test_register_named_aggregate(self):
+        features = UserFeatures()
+        features.register("user_views", "count", where=lambda df: df["event"] == "view")
+        features.register("user_click_rate", "mean", column="is_click", dtype="float64")
+
+        result = features.transform(self.df).set_index("user_id")
+        views = (self.df["event"] == "view").groupby(self.df["user_id"]).sum()
+        rate = self.df.groupby("user_id")["is_click"].mean()
+
+        self.assertEqual(list(result.columns)[-2:], ["user_views", "user_click_rate"])
+        np.testing.assert_array_equal(result["user_views"], views)
+        np.testing.assert_allclose(result["user_click_rate"], rate)
+
+
+class TestItemFeatures(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.read_csv("data/events.csv")
+
+    def test_matches_filtered_groupby(self):
+        df = self.df
+        views = df[df["event"] == "view"].groupby("item_id").size()
+        clicks = df[df["event"] == "click"].groupby("item_id").size()
+        expected = pd.DataFrame({"item_views": views, "item_clicks": clicks}).fillna(0).astype("int64")
+        expected["item_ctr"] = expected["item_clicks"] / expected["item_views"].replace(0, 1)
+        expected = expected.sort_index().reset_index(names="item_id")
+
+        pd.testing.assert_frame_equal(ItemFeatures().transform(df), expected)
+
+    def test_arbitrary_event_types(self):
+        df = self.df.assign(event=self.df["event"].astype("category"))
+        features = ItemFeatures(events={"click": "item_clicks", "purchase": "item_purchases"}, ctr=None)
+
+        result = features.transform(df).set_index("item_id")
+        purchases = df[df["event"] == "purchase"].groupby("item_id", observed=True).size()
+
+        self.assertEqual(list(result.columns), ["item_clicks", "item_purchases"])
+        np.testing.assert_array_equal(result["item_purchases"].reindex(purchases.index), purchases)
+        self.assertEqual(result["item_purchases"].sum(), len(df[df["event"] == "purchase"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
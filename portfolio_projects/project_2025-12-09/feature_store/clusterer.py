@@ -1,24 +1,193 @@
-from sklearn.cluster import KMeans
+import time
+
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import silhouette_score
 import numpy as np
+import scipy.sparse as sp
 
 class IntentClusterer:
     """KMeans 기반 세션 intent clusterer"""
 
-    def __init__(self, n_clusters=3, random_state=42):
-        self.model = KMeans(n_clusters=n_clusters, random_state=random_state)
+    def __init__(self, n_clusters=3, random_state=42, backend="kmeans",
+                 batch_size=1024, init_centroids=None):
+        """
+        Args:
+            backend: "kmeans" (full-batch, 기본값) 또는 "minibatch" (MiniBatchKMeans)
+            batch_size: minibatch backend 의 mini-batch 크기
+            init_centroids: 이전 실행의 centroid 로 warm start (n_init=1)
+        """
+        if backend not in ("kmeans", "minibatch"):
+            raise ValueError(f"Unknown backend: {backend!r}")
 
-    def fit_predict(self, X: np.ndarray):
-        """세션 임베딩 X에 대해 클러스터 예측"""
-        return self.model.fit_predict(X)
+        self.backend = backend
+        self.random_state = random_state
+        self.fit_seconds_ = None
+        self._names_cache = None
 
-    def get_top_keywords(self, vectorizer, n_top=5):
-        """TF-IDF vocabulary에서 클러스터별 주요 단어 추출"""
-        feature_names = vectorizer.get_feature_names_out()
-        centers = self.model.cluster_centers_
+        kwargs = {"n_clusters": n_clusters, "random_state": random_state}
+        if init_centroids is not None:
+            kwargs.update(init=np.asarray(init_centroids, dtype=np.float64), n_init=1)
+
+        if backend == "kmeans":
+            self.model = KMeans(**kwargs)
+        else:
+            self.model = MiniBatchKMeans(batch_size=batch_size, **kwargs)
+
+    def fit_predict(self, X):
+        """세션 임베딩 X에 대해 클러스터 예측
+
+        X 는 CSR sparse 행렬(TextVectorizer 기본 출력) 또는 numpy array.
+        sparse 입력은 densify 하지 않고 KMeans 에 그대로 전달합니다.
+        """
+        if sp.issparse(X):
+            X = X.tocsr()
+        start = time.perf_counter()
+        labels = self.model.fit_predict(X)
+        self.fit_seconds_ = time.perf_counter() - start
+        return labels
+
+    def fit_stream(self, chunks):
+        """TF-IDF chunk generator 로 centroid 를 incremental 학습 (minibatch backend)
+
+        Args:
+            chunks: (n_rows, n_features) 행렬의 iterable. 모든 chunk 는
+                같은 feature 공간(같은 vectorizer)이어야 합니다.
+
+        Returns:
+            self — 라벨은 predict(chunk) 로 계산합니다.
+        """
+        if self.backend != "minibatch":
+            raise ValueError("fit_stream requires backend='minibatch'.")
+
+        self.fit_seconds_ = 0.0
+        for X in chunks:
+            start = time.perf_counter()
+            self.model.partial_fit(X)
+            self.fit_seconds_ += time.perf_counter() - start
+        return self
+
+    def predict(self, X):
+        """학습된 centroid 기준 가장 가까운 클러스터"""
+        return self.model.predict(X)
+
+    def evaluate(self, X, labels=None, sample_size=10000):
+        """inertia / 샘플 silhouette / 학습 시간 — backend 비교용
+
+        Args:
+            sample_size: silhouette 는 O(n^2) 이므로 샘플에서만 계산합니다.
+
+        Returns:
+            {"inertia", "silhouette", "fit_seconds"}
+        """
+        labels = self.predict(X) if labels is None else np.asarray(labels)
+        # score(X) 는 -inertia (X 기준으로 다시 계산)
+        inertia = -float(self.model.score(X))
+
+        silhouette = None
+        if 1 < len(np.unique(labels)) < X.shape[0]:
+            silhouette = float(silhouette_score(
+                X, labels,
+                sample_size=min(sample_size, X.shape[0]),
+                random_state=self.random_state,
+            ))
+
+        return {"inertia": inertia, "silhouette": silhouette,
+                "fit_seconds": self.fit_seconds_}
+
+    def get_top_keywords(self, vectorizer, n_top=5, distinctive=False, return_weights=False):
+        """TF-IDF vocabulary에서 클러스터별 주요 단어 추출
+
+        cluster_centers_ 전체에 argpartition 을 한 번 적용해 모든 클러스터의
+        top-n 을 함께 구합니다 (클러스터별 full argsort 없음).
+
+        Args:
+            vectorizer: get_feature_names_out() 을 가진 학습된 vectorizer.
+            n_top: 클러스터별 단어 수.
+            distinctive: True 이면 centroid - 전체 평균 으로 점수를 매겨
+                모든 클러스터에 공통인 단어 대신 해당 클러스터에 특징적인 단어를 고릅니다.
+            return_weights: True 이면 [(단어, 점수), ...] 를 반환합니다.
+
+        Returns:
+            {cluster_id: [단어, ...]} 또는 {cluster_id: [(단어, 점수), ...]}
+        """
+        scores = self.keyword_scores(distinctive)
+        idx = self._top_indices(scores, n_top)
+        weights = np.take_along_axis(scores, idx, axis=1)
+        words = self._feature_names(vectorizer)[idx]
 
         top_keywords = {}
-        for i, center in enumerate(centers):
-            idx = center.argsort()[-n_top:][::-1]
-            top_keywords[i] = feature_names[idx].tolist()
+        for i in range(len(idx)):
+            if return_weights:
+                top_keywords[i] = list(zip(words[i].tolist(), weights[i].tolist()))
+            else:
+                top_keywords[i] = words[i].tolist()
 
         return top_keywords
+
+    def keyword_scores(self, distinctive=False):
+        """클러스터 x feature 점수 행렬
+
+        distinctive=True 이면 클러스터 크기로 가중한 centroid 평균(= 전체 세션의
+        TF-IDF 평균)을 빼므로 X 를 다시 읽거나 dense 로 만들 필요가 없습니다.
+        """
+        centers = self.model.cluster_centers_
+        if not distinctive:
+            return centers
+
+        labels = getattr(self.model, "labels_", None)
+        if labels is not None:
+            sizes = np.bincount(labels, minlength=len(centers))
+            global_mean = sizes @ centers / sizes.sum()
+        else:  # partial_fit 만 한 경우 labels_ 가 없음 → 단순 평균
+            global_mean = centers.mean(axis=0)
+        return centers - global_mean
+
+    def nearest_sessions(self, X, n=5, labels=None):
+        """클러스터마다 centroid 에 가장 가까운 (소속) 세션의 행 번호
+
+        ||x - c||^2 = ||x||^2 - 2 x·c + ||c||^2 를 sparse 행렬곱 한 번
+        (n_sessions x n_clusters) 으로 계산하므로 X 를 densify 하지 않습니다.
+
+        Args:
+            X: fit 에 사용한 것과 같은 feature 공간의 TF-IDF 행렬.
+            n: 클러스터별 세션 수.
+            labels: X 의 클러스터 라벨 (없으면 predict).
+
+        Returns:
+            {cluster_id: 가까운 순서의 행 번호 배열}
+        """
+        centers = self.model.cluster_centers_
+        labels = self.predict(X) if labels is None else np.asarray(labels)
+
+        if sp.issparse(X):
+            x_sq = np.asarray(X.multiply(X).sum(axis=1)).ravel()
+        else:
+            x_sq = np.einsum("ij,ij->i", X, X)
+        dist = (x_sq[:, None] - 2 * np.asarray(X @ centers.T)
+                + np.einsum("ij,ij->i", centers, centers))
+
+        # 다른 클러스터 소속 세션은 제외
+        dist = np.where(labels[:, None] == np.arange(len(centers)), dist, np.inf)
+        idx = self._top_indices(-dist.T, n)
+        counts = np.bincount(labels, minlength=len(centers))
+
+        return {i: idx[i, :min(n, counts[i])] for i in range(len(centers))}
+
+    @staticmethod
+    def _top_indices(scores, n_top):
+        """행별 상위 n_top 열 index (점수 내림차순)"""
+        n_top = min(n_top, scores.shape[1])
+        if n_top < scores.shape[1]:
+            idx = np.argpartition(-scores, n_top - 1, axis=1)[:, :n_top]
+        else:
+            idx = np.tile(np.arange(scores.shape[1]), (scores.shape[0], 1))
+        order = np.argsort(-np.take_along_axis(scores, idx, axis=1), axis=1, kind="stable")
+        return np.take_along_axis(idx, order, axis=1)
+
+    def _feature_names(self, vectorizer):
+        """get_feature_names_out() 결과를 vectorizer / vocabulary 단위로 캐시"""
+        key = (vectorizer, getattr(vectorizer, "vocabulary_", None))
+        cached = self._names_cache
+        if cached is None or cached[0][0] is not key[0] or cached[0][1] is not key[1]:
+            self._names_cache = (key, np.asarray(vectorizer.get_feature_names_out()))
+        return self._names_cache[1]
@@ -1,5 +1,7 @@
 import pandas as pd
-import re
+
+from feature_store.doc_builder import SessionDocumentBuilder
+from feature_store.text_cleaner import TextCleaner
 
 
 class FeatureEngineering:
@@ -10,7 +12,8 @@ class FeatureEngineering:
     """
 
     def __init__(self):
-        pass
+        self.doc_builder = SessionDocumentBuilder(sep=" ")
+        self.cleaner = TextCleaner(pattern=r"[^a-z0-9 ]")
 
     def aggregate_session_texts(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -28,21 +31,16 @@ class FeatureEngineering:
         # raw_text를 합치기
         df["raw_text"] = df["event_text"]
 
-        # cleaned_text 생성
-        df["cleaned_text"] = (
-            df["raw_text"]
-            .str.lower()
-            .str.replace(r"[^a-z0-9 ]", "", regex=True)
-        )
+        # cleaned_text 생성 (반복되는 이벤트 문자열은 unique 값 단위로 한 번만 정제)
+        df["cleaned_text"] = self.cleaner.clean_batch(df["raw_text"])
 
         # session_id 기준으로 aggregation
-        fe_out = (
-            df.groupby("session_id")
-            .agg({
-                "raw_text": lambda x: " ".join(x),
-                "cleaned_text": lambda x: " ".join(x),
-            })
-            .reset_index()
-        )
+        # - stable 정렬로 세션 내부의 이벤트 순서를 유지한 채 세션을 연속 구간으로 모음
+        # - 세션별 lambda join 대신 offsets 기반 문서 builder 사용
+        ordered = df.sort_values("session_id", kind="stable")
+        fe_out = self.doc_builder.build(ordered, ["session_id"], "raw_text")
+        fe_out["cleaned_text"] = self.doc_builder.build(
+            ordered, ["session_id"], "cleaned_text"
+        )["cleaned_text"]
 
         return fe_out
@@ -0,0 +1,128 @@
+# feature_store/hashing_tfidf.py
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+
+class HashingTfidf:
+    """
+    vocabulary 없이 동작하는 TF-IDF (hashing trick + streaming IDF)
+
+    - feature 공간은 n_features 로 고정 → vocabulary fit 단계와 큰 Python dict 가 없음
+    - partial_fit 으로 chunk 단위 document frequency 를 누적 (메모리보다 큰 데이터)
+    - transform 은 chunk 끼리 독립적이므로 병렬 처리 가능
+    - 출력은 TfidfVectorizer 와 같은 CSR 행렬 → 기존 clusterer 에 그대로 입력 가능
+    """
+
+    def __init__(
+        self,
+        n_features=2 ** 18,
+        ngram_range=(1, 1),
+        stop_words=None,
+        norm="l2",
+        smooth_idf=True,
+        sublinear_tf=False,
+        dtype=np.float64,
+    ):
+        self.n_features = n_features
+        self.norm = norm
+        self.smooth_idf = smooth_idf
+        self.sublinear_tf = sublinear_tf
+        self.dtype = dtype
+
+        # alternate_sign=False, norm=None → 순수 term count
+        self.hasher = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=ngram_range,
+            stop_words=stop_words,
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float64,
+        )
+
+        self._reset()
+
+    def _reset(self):
+        self.n_docs_ = 0
+        self.doc_freq_ = np.zeros(self.n_features, dtype=np.int64)
+
+    # =========================
+    # IDF 누적 (streaming)
+    # =========================
+    def partial_fit(self, texts):
+        """chunk 하나의 document frequency 를 누적 (누적은 이 메서드로만)"""
+        counts = self.hasher.transform(texts)
+        counts.sum_duplicates()
+
+        self.doc_freq_ += np.bincount(counts.indices, minlength=self.n_features)
+        self.n_docs_ += counts.shape[0]
+        return self
+
+    def fit(self, texts):
+        """texts 로 처음부터 다시 학습 (sklearn fit 과 같이 문서 목록을 받고, 기존 document frequency 는 버림)"""
+        return self.fit_chunks([texts])
+
+    def fit_chunks(self, chunks):
+        """
+        chunk 단위로 처음부터 다시 학습 (기존 document frequency 는 버림)
+
+        Input:
+            chunks: 텍스트 chunk 들의 iterable (예: 제너레이터)
+        """
+        self._reset()
+        for texts in chunks:
+            self.partial_fit(texts)
+        return self
+
+    @property
+    def idf_(self) -> np.ndarray:
+        """TfidfTransformer 와 같은 식: ln((1 + n) / (1 + df)) + 1"""
+        smooth = int(self.smooth_idf)
+        return np.log((self.n_docs_ + smooth) / (self.doc_freq_ + smooth)) + 1
+
+    # =========================
+    # 변환
+    # =========================
+    def transform(self, texts, idf=None):
+        """
+        Output:
+            X: (n_docs, n_features) CSR TF-IDF 행렬
+        """
+        if self.n_docs_ == 0:
+            raise ValueError("HashingTfidf is not fitted. Call partial_fit first.")
+
+        idf = self.idf_ if idf is None else idf
+
+        X = self.hasher.transform(texts)
+        X.sum_duplicates()
+
+        if self.sublinear_tf:
+            np.log(X.data, X.data)
+            X.data += 1
+
+        X.data *= idf[X.indices]
+        if self.norm is not None:
+            X = normalize(X, norm=self.norm, copy=False)
+
+        return X.astype(self.dtype, copy=False)
+
+    def transform_chunks(self, chunks, n_jobs=1):
+        """
+        chunk 별로 독립 변환 (n_jobs > 1 이면 병렬)
+
+        IDF 는 호출 시점 값으로 고정해 모든 chunk 에 같은 가중치를 사용한다.
+        """
+        idf = self.idf_
+        return Parallel(n_jobs=n_jobs)(
+            delayed(self.transform)(texts, idf) for texts in chunks
+        )
+
+    def fit_transform(self, texts):
+        """texts 만으로 IDF 를 다시 학습하고 변환 (sklearn fit_transform 과 같이 재호출해도 누적되지 않음)"""
+        self._reset()
+        return self.partial_fit(texts).transform(texts)
+
+    def get_feature_names_out(self):
+        """hash bucket 이름 (hashing 모드에는 단어 vocabulary 가 없음)"""
+        return np.char.add("hash_", np.arange(self.n_features).astype(str)).astype(object)
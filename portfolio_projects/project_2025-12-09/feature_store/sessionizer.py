@@ -1,5 +1,31 @@
+import numpy as np
 import pandas as pd
 
+
+def session_ids(user_ids: np.ndarray, event_times: np.ndarray, gap, dtype=np.int64):
+    """
+    정렬된 (user_id, event_time) 배열만으로 사용자별 session_id 계산
+    - diff/compare 한 번으로 세션 경계를 찾고, 임시 컬럼을 만들지 않는다.
+    - gap 은 event_times 와 같은 단위 (datetime64 이면 np.timedelta64)
+    """
+    n = len(user_ids)
+    new_session = np.ones(n, dtype=bool)
+    new_user = np.ones(n, dtype=bool)
+
+    if n > 1:
+        np.not_equal(user_ids[1:], user_ids[:-1], out=new_user[1:])
+        np.greater(event_times[1:] - event_times[:-1], gap, out=new_session[1:])
+        new_session[1:] |= new_user[1:]
+
+    # 전체 cumsum 에서 사용자 시작 시점 값을 빼서 사용자별로 1부터 번호 부여
+    counter = np.cumsum(new_session, dtype=np.int64)
+    user_start = np.flatnonzero(new_user)
+    user_len = np.diff(np.append(user_start, n))
+    ids = counter - np.repeat(counter[user_start] - 1, user_len)
+
+    return ids.astype(dtype, copy=False)
+
+
 class Sessionizer:
     """
     Sessionizer class
@@ -9,22 +35,47 @@ class Sessionizer:
     def __init__(self, inactivity_minutes=30):
         self.gap = inactivity_minutes * 60  # seconds
 
-    def assign_sessions(self, df: pd.DataFrame) -> pd.DataFrame:
+    def assign_sessions(
+        self,
+        df: pd.DataFrame,
+        debug_columns: bool = True,
+        compact: bool = False,
+    ) -> pd.DataFrame:
         """
         사용자 이벤트 로그 df에 session_id 를 부여합니다.
         df columns:
             - user_id (int)
             - event_time (datetime)
             - event_text (str)
+        debug_columns: True 이면 prev_time, time_gap, new_session 도 추가
+        compact: True 이면 session_id 를 int32 로 저장
         """
-        df = df.sort_values(by=["user_id", "event_time"]).copy()
-        df["prev_time"] = df.groupby("user_id")["event_time"].shift(1)
-        df["time_gap"] = (df["event_time"] - df["prev_time"]).dt.total_seconds()
+        # sort_values 가 이미 새 DataFrame 을 반환하므로 .copy() 는 필요 없음
+        df = df.sort_values(by=["user_id", "event_time"])
+
+        user_ids = df["user_id"].to_numpy()
+        event_times = df["event_time"].to_numpy()
+        dtype = np.int32 if compact else np.int64
+
+        ids = session_ids(
+            user_ids, event_times, np.timedelta64(self.gap, "s"), dtype=dtype
+        )
+
+        if debug_columns:
+            # 같은 사용자의 직전 이벤트 시각 (사용자 첫 이벤트는 NaT)
+            first_event = np.ones(len(df), dtype=bool)
+            first_event[1:] = user_ids[1:] != user_ids[:-1]
+
+            prev_time = np.empty_like(event_times)
+            prev_time[1:] = event_times[:-1]
+            prev_time[first_event] = np.datetime64("NaT")
+
+            df["prev_time"] = prev_time
+            df["time_gap"] = (df["event_time"] - df["prev_time"]).dt.total_seconds()
 
-        # 새로운 세션 조건
-        df["new_session"] = (df["time_gap"] > self.gap) | (df["prev_time"].isna())
+            # 새로운 세션 조건: 이전 이벤트가 없거나 gap 초과
+            df["new_session"] = (df["time_gap"] > self.gap) | (df["prev_time"].isna())
 
-        # session_id 생성
-        df["session_id"] = df.groupby("user_id")["new_session"].cumsum()
+        df["session_id"] = ids
 
         return df
@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+from feature_store.hashing_tfidf import HashingTfidf
+
 
 class TextVectorizer:
     """TextVectorizer.
@@ -9,19 +12,48 @@ class TextVectorizer:
     TF-IDF 기반의 embedding 행렬을 생성하는 클래스입니다.
     """
 
-    def __init__(self, max_features: int = 300) -> None:
+    def __init__(
+        self,
+        max_features: int = 300,
+        mode: str = "tfidf",
+        n_features: int = 2 ** 18,
+        dtype=np.float64,
+        dense: bool = False,
+        max_dense_bytes: int = 1 << 30,
+    ) -> None:
         """Initializer.
 
         Args:
             max_features: TF-IDF에서 사용할 최대 vocabulary 크기.
+            mode: "tfidf" (vocabulary 학습) 또는 "hashing" (vocabulary 없이 hashing,
+                IDF 는 partial_fit 으로 chunk 단위 누적).
+            n_features: hashing 모드의 고정 feature 공간 크기.
+            dtype: 출력 행렬 dtype (np.float32 이면 메모리 절반).
+            dense: True 이면 numpy array 로 변환해서 반환 (기본은 CSR sparse 행렬).
+            max_dense_bytes: dense 변환 시 허용하는 최대 메모리 (초과하면 MemoryError).
         """
+        if mode not in ("tfidf", "hashing"):
+            raise ValueError(f"mode must be 'tfidf' or 'hashing', got {mode!r}")
+
+        self.mode = mode
+        self.dense = dense
+        self.max_dense_bytes = max_dense_bytes
+
         # TF-IDF 벡터라이저 생성
         # - max_features: 상위 N개 단어만 사용 (과적합 방지 및 차원 축소)
         # - stop_words: 의미가 약한 영어 불용어 제거
-        self.vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            stop_words="english",
-        )
+        if mode == "hashing":
+            self.vectorizer = HashingTfidf(
+                n_features=n_features,
+                stop_words="english",
+                dtype=dtype,
+            )
+        else:
+            self.vectorizer = TfidfVectorizer(
+                max_features=max_features,
+                stop_words="english",
+                dtype=dtype,
+            )
 
     def fit_transform(self, df: pd.DataFrame):
         """텍스트 데이터를 TF-IDF 행렬로 변환합니다.
@@ -30,7 +62,7 @@ class TextVectorizer:
             df: 'cleaned_text' 컬럼을 포함한 DataFrame.
 
         Returns:
-            X: (n_sessions, n_features) 형태의 numpy array.
+            X: (n_sessions, n_features) 형태의 CSR sparse 행렬 (dense=True 이면 numpy array).
             vectorizer: 학습된 TfidfVectorizer 객체.
         """
         # 여기서 df는 함수 인자로 전달되는 지역 변수입니다.
@@ -38,8 +70,38 @@ class TextVectorizer:
         if "cleaned_text" not in df.columns:
             raise ValueError("DataFrame must contain 'cleaned_text' column.")
 
-        # TF-IDF 행렬 생성 (scipy sparse matrix → numpy array 변환)
-        X_sparse = self.vectorizer.fit_transform(df["cleaned_text"])
-        X = X_sparse.toarray()
+        # TF-IDF 행렬 생성 (scipy sparse matrix 그대로 사용)
+        X = self.vectorizer.fit_transform(df["cleaned_text"]).tocsr()
+
+        if self.dense:
+            X = self._to_dense(X)
 
         return X, self.vectorizer
+
+    def _to_dense(self, X):
+        """메모리 추정치가 max_dense_bytes 이하일 때만 dense 로 변환합니다."""
+        n_bytes = X.shape[0] * X.shape[1] * X.dtype.itemsize
+        if n_bytes > self.max_dense_bytes:
+            raise MemoryError(
+                f"Dense TF-IDF matrix {X.shape} would need {n_bytes / 1e9:.2f} GB "
+                f"(max_dense_bytes={self.max_dense_bytes / 1e9:.2f} GB). "
+                "Use the sparse output instead."
+            )
+        return X.toarray()
+
+    def partial_fit(self, df: pd.DataFrame):
+        """hashing 모드: cleaned_text chunk 하나로 IDF 통계를 누적합니다.
+
+        Args:
+            df: 'cleaned_text' 컬럼을 포함한 DataFrame chunk.
+        """
+        if self.mode != "hashing":
+            raise ValueError("partial_fit is only available in hashing mode.")
+
+        self.vectorizer.partial_fit(df["cleaned_text"])
+        return self
+
+    def transform(self, df: pd.DataFrame):
+        """학습된 vectorizer 로 새 cleaned_text chunk 를 변환합니다."""
+        X = self.vectorizer.transform(df["cleaned_text"]).tocsr()
+        return self._to_dense(X) if self.dense else X
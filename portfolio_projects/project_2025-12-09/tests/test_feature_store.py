@@ -1,5 +1,40 @@
-# Template not found for tests/test_feature_store.py
+import numpy as np
+import pandas as pd
 
-# ====================
-#   Fill your code
-# ====================
+from feature_store.sessionizer import Sessionizer
+
+
+def _events():
+    df = pd.read_csv("data/raw/raw_events.csv")
+    df["event_time"] = pd.to_datetime(df["event_time"])
+    return df
+
+
+def test_assign_sessions():
+    out = Sessionizer(inactivity_minutes=30).assign_sessions(_events())
+
+    assert {"prev_time", "time_gap", "new_session", "session_id"} <= set(out.columns)
+    assert (out.groupby("user_id")["session_id"].min() == 1).all()
+    assert out["new_session"].sum() == out.groupby(["user_id", "session_id"]).ngroups
+
+
+def test_assign_sessions_compact_without_debug_columns():
+    df = _events()
+    full = Sessionizer().assign_sessions(df)
+    compact = Sessionizer().assign_sessions(df, debug_columns=False, compact=True)
+
+    assert "time_gap" not in compact.columns
+    assert compact["session_id"].dtype == np.int32
+    np.testing.assert_array_equal(compact["session_id"], full["session_id"])
+
+
+def test_aggregate_session_texts():
+    from feature_store.feat_eng import FeatureEngineering
+
+    sessions = Sessionizer().assign_sessions(_events())
+    out = FeatureEngineering().aggregate_session_texts(sessions)
+
+    expected = sessions.groupby("session_id")["raw_text"].apply(" ".join)
+    assert out["session_id"].tolist() == expected.index.tolist()
+    assert out["raw_text"].tolist() == expected.tolist()
+    assert out["cleaned_text"].str.match(r"^[a-z0-9 ]*$").all()
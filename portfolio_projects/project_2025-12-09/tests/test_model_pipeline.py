@@ -1,5 +1,106 @@
-# Template not found for tests/test_model_pipeline.py
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse as sp
 
-# ====================
-#   Fill your code
-# ====================
+from feature_store.clusterer import IntentClusterer
+from feature_store.vectorizer import TextVectorizer
+
+
+@pytest.fixture
+def session_docs():
+    return pd.DataFrame({
+        "cleaned_text": [
+            "search hybrid suv deals view kona hybrid",
+            "view kona hybrid specs click suv comparison",
+            "search ev charging station near home",
+            "view ev charger map charging station",
+            "search running shoes discount add to cart",
+            "view running shoes size purchase complete",
+        ]
+    })
+
+
+def test_vectorizer_returns_sparse_float32(session_docs):
+    X, vectorizer = TextVectorizer(dtype=np.float32).fit_transform(session_docs)
+
+    assert sp.isspmatrix_csr(X) or isinstance(X, sp.csr_array)
+    assert X.dtype == np.float32
+    assert X.shape == (6, len(vectorizer.get_feature_names_out()))
+
+
+def test_dense_output_is_guarded(session_docs):
+    X, _ = TextVectorizer(dense=True).fit_transform(session_docs)
+    assert isinstance(X, np.ndarray)
+
+    with pytest.raises(MemoryError):
+        TextVectorizer(dense=True, max_dense_bytes=16).fit_transform(session_docs)
+
+
+def test_clusterer_on_sparse_input(session_docs):
+    X, vectorizer = TextVectorizer().fit_transform(session_docs)
+
+    clusterer = IntentClusterer(n_clusters=3)
+    labels = clusterer.fit_predict(X)
+    keywords = clusterer.get_top_keywords(vectorizer, n_top=3)
+
+    assert len(labels) == 6
+    assert set(keywords) == {0, 1, 2}
+    assert all(len(words) == 3 for words in keywords.values())
+
+
+def test_minibatch_stream_with_warm_start(session_docs):
+    X, _ = TextVectorizer().fit_transform(session_docs)
+
+    full = IntentClusterer(n_clusters=3)
+    labels = full.fit_predict(X)
+
+    # 전날 centroid 에서 출발해 chunk 단위로 업데이트
+    streamed = IntentClusterer(
+        n_clusters=3, backend="minibatch", batch_size=3,
+        init_centroids=full.model.cluster_centers_,
+    )
+    streamed.fit_stream(X[i:i + 3] for i in range(0, X.shape[0], 3))
+
+    assert streamed.model.cluster_centers_.shape == full.model.cluster_centers_.shape
+    assert len(streamed.predict(X)) == 6
+
+    report = full.evaluate(X, labels)
+    assert report["inertia"] == pytest.approx(full.model.inertia_)
+    assert -1.0 <= report["silhouette"] <= 1.0
+    assert report["fit_seconds"] > 0
+
+    with pytest.raises(ValueError):
+        full.fit_stream([X])
+
+
+def test_top_keywords_batched(session_docs):
+    X, vectorizer = TextVectorizer().fit_transform(session_docs)
+    clusterer = IntentClusterer(n_clusters=3)
+    labels = clusterer.fit_predict(X)
+
+    # 기존 구현 (클러스터별 full argsort) 과 같은 단어 집합
+    names = vectorizer.get_feature_names_out()
+    weighted = clusterer.get_top_keywords(vectorizer, n_top=4, return_weights=True)
+    for i, center in enumerate(clusterer.model.cluster_centers_):
+        expected = np.sort(center)[::-1][:4]
+        np.testing.assert_allclose([w for _, w in weighted[i]], expected)
+        assert all(center[list(names).index(word)] == w for word, w in weighted[i])
+
+    # distinctive: centroid - 전체 평균 (= X 평균)
+    scores = clusterer.keyword_scores(distinctive=True)
+    np.testing.assert_allclose(
+        scores, clusterer.model.cluster_centers_ - np.asarray(X.mean(axis=0)), atol=1e-12
+    )
+    assert set(clusterer.get_top_keywords(vectorizer, n_top=2, distinctive=True)) == {0, 1, 2}
+
+    # feature names 는 vectorizer 가 같으면 재계산하지 않음
+    cached = clusterer._feature_names(vectorizer)
+    assert clusterer._feature_names(vectorizer) is cached
+
+    nearest = clusterer.nearest_sessions(X, n=2, labels=labels)
+    for i, rows in nearest.items():
+        assert 1 <= len(rows) <= 2
+        assert (labels[rows] == i).all()
+        dist = ((X[rows].toarray() - clusterer.model.cluster_centers_[i]) ** 2).sum(axis=1)
+        assert list(dist) == sorted(dist)
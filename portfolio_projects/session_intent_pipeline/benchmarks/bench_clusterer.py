@@ -0,0 +1,92 @@
+# benchmarks/bench_clusterer.py
+"""
+SessionClusterer backend benchmark: full-batch KMeans vs MiniBatchKMeans (in-memory / streaming)
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_clusterer --sessions 200000 --clusters 8 --chunk-size 20000
+"""
+
+import argparse
+
+import numpy as np
+
+from feature_store.clusterer import SessionClusterer
+from feature_store.hashing_tfidf import HashingTfidf
+
+INTENT_TERMS = [
+    ["search", "hybrid", "suv", "deals", "kona", "compare"],
+    ["search", "ev", "charging", "station", "ioniq", "battery"],
+    ["view", "running", "shoes", "discount", "nike", "size"],
+    ["view", "iphone", "case", "clear", "cart", "purchase"],
+    ["vehicle", "start", "stop", "signal", "door", "lock"],
+]
+
+
+def make_session_docs(n_sessions: int, words_per_doc: int = 12, seed: int = 42) -> list:
+    """intent 별 단어 분포에서 뽑은 합성 세션 문서 (약간의 노이즈 포함)"""
+    rng = np.random.default_rng(seed)
+    vocab = np.array(sorted({w for terms in INTENT_TERMS for w in terms}))
+    intent_vocab = [np.array(terms) for terms in INTENT_TERMS]
+
+    intents = rng.integers(0, len(INTENT_TERMS), n_sessions)
+    docs = []
+    for intent in intents:
+        words = rng.choice(intent_vocab[intent], words_per_doc)
+        noise = rng.random(words_per_doc) < 0.2
+        words[noise] = rng.choice(vocab, noise.sum())
+        docs.append(" ".join(words))
+    return docs
+
+
+def report(name: str, clusterer: SessionClusterer, X, sample_size: int):
+    metrics = clusterer.evaluate(X, sample_size = sample_size)
+    print(
+        f"  {name:<22}: fit {metrics['fit_seconds']:8.3f}s"
+        f"  inertia {metrics['inertia']:12.1f}"
+        f"  silhouette {metrics['silhouette']:.4f}"
+    )
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200_000)
+    parser.add_argument("--clusters", type=int, default=8)
+    parser.add_argument("--chunk-size", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=4096)
+    parser.add_argument("--silhouette-sample", type=int, default=5_000)
+    args = parser.parse_args()
+
+    docs = make_session_docs(args.sessions)
+    tfidf = HashingTfidf(n_features = 2 ** 16, ngram_range = (1, 2), dtype = np.float32)
+    X = tfidf.fit_transform(docs)
+    print(f"[{X.shape[0]:,} sessions x {X.shape[1]:,} features, nnz={X.nnz:,}, k={args.clusters}]")
+
+    full = SessionClusterer(n_clusters = args.clusters)
+    full.fit_predict(X)
+    baseline = report("KMeans (n_init=10)", full, X, args.silhouette_sample)
+
+    minibatch = SessionClusterer(n_clusters = args.clusters, backend = "minibatch", batch_size = args.batch_size)
+    minibatch.fit_predict(X)
+    report("MiniBatchKMeans", minibatch, X, args.silhouette_sample)
+
+    # chunk generator → partial_fit (전체 행렬을 한 번에 올리지 않는 경로)
+    chunks = (X[start:start + args.chunk_size] for start in range(0, X.shape[0], args.chunk_size))
+    streamed = SessionClusterer(n_clusters = args.clusters, backend = "minibatch", batch_size = args.batch_size)
+    streamed.fit_stream(chunks)
+    report("MiniBatch streaming", streamed, X, args.silhouette_sample)
+
+    # 전날 centroid 로 warm start: 새 데이터 하루치에 대해 1회 streaming pass
+    warm = SessionClusterer(
+        n_clusters = args.clusters,
+        backend = "minibatch",
+        batch_size = args.batch_size,
+        init_centroids = full.cluster_centers_,
+    )
+    warm.fit_stream(X[start:start + args.chunk_size] for start in range(0, X.shape[0], args.chunk_size))
+    metrics = report("MiniBatch warm start", warm, X, args.silhouette_sample)
+    print(f"  (warm start inertia / full-batch: {metrics['inertia'] / baseline['inertia']:.3f})")
+
+
+if __name__ == "__main__":
+    main()
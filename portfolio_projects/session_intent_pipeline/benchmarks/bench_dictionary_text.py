@@ -0,0 +1,71 @@
+# benchmarks/bench_dictionary_text.py
+"""
+event_text 를 문자열(str) vs category(dictionary) 로 유지할 때의 메모리 / 시간 비교
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_dictionary_text --events 5000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.bench_parallel import make_events
+from feature_store.aggregator import SessionTextAggregator
+from feature_store.sessionizer import Sessionizer
+from feature_store.text_cleaner import TextCleaner
+from feature_store.token_docs import TokenVocabulary
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run(path: str, dtype) -> dict:
+    df, load_sec = timed(lambda: pd.read_csv(path, dtype=dtype, parse_dates=["event_time"]))
+    memory_mb = df["event_text"].memory_usage(deep=True) / 1e6
+
+    # cache 효과를 빼고 비교하기 위해 cache 없는 cleaner 사용
+    cleaner = TextCleaner(cache_size=0)
+    _, clean_sec = timed(lambda: cleaner.clean_batch(df["event_text"]))
+    _, token_sec = timed(lambda: TokenVocabulary().encode_rows(df["event_text"], cleaner.clean))
+
+    sessions = Sessionizer().assign_sessions(df, debug_columns=False)
+    _, agg_sec = timed(lambda: SessionTextAggregator("event_text", cleaner).aggregate(sessions))
+
+    return {
+        "event_text MB": memory_mb,
+        "load s": load_sec,
+        "clean s": clean_sec,
+        "tokenize s": token_sec,
+        "aggregate s": agg_sec,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5_000_000)
+    parser.add_argument("--users", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "raw_events.csv")
+        make_events(args.events, args.users).to_csv(path, index=False)
+
+        results = pd.DataFrame({
+            "str": run(path, None),
+            "category": run(path, {"event_text": "category"}),
+        })
+
+    results["saving"] = 1 - results["category"] / results["str"]
+    print(f"[{args.events:,} events]")
+    print(results.round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
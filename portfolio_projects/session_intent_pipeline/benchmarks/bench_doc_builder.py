@@ -0,0 +1,65 @@
+# benchmarks/bench_doc_builder.py
+"""
+Session 문서 생성 benchmark: groupby + lambda join vs SessionDocumentBuilder
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_doc_builder --events 5000000 --events-per-session 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from feature_store.doc_builder import SessionDocumentBuilder
+
+EVENT_TEMPLATES = np.array([
+    "search hybrid suv deals",
+    "view kona hybrid 2024",
+    "click car detail page",
+    "search ev charging station",
+    "view ioniq 6 battery info",
+    "add to cart",
+    "purchase complete",
+])
+
+
+def make_sessionized(n_events: int, events_per_session: int, seed: int = 42) -> pd.DataFrame:
+    """(user_id, session_id) 로 정렬된 세션화 결과 모양의 합성 데이터"""
+    rng = np.random.default_rng(seed)
+    n_sessions = max(1, n_events // events_per_session)
+    session_key = np.sort(rng.integers(0, n_sessions, n_events))
+
+    return pd.DataFrame({
+        "user_id": session_key // 4,
+        "session_id": session_key % 4 + 1,
+        "event_text": EVENT_TEMPLATES[rng.integers(0, len(EVENT_TEMPLATES), n_events)],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5_000_000)
+    parser.add_argument("--events-per-session", type=int, default=5)
+    args = parser.parse_args()
+
+    df = make_sessionized(args.events, args.events_per_session)
+    keys = ["user_id", "session_id"]
+    print(f"[{len(df):,} events / {df.groupby(keys).ngroups:,} sessions]")
+
+    start = time.perf_counter()
+    legacy = df.groupby(keys)["event_text"].apply(lambda x: " ".join(x)).reset_index()
+    legacy_sec = time.perf_counter() - start
+    print(f"  groupby + lambda join : {legacy_sec:8.3f}s")
+
+    start = time.perf_counter()
+    docs = SessionDocumentBuilder().build(df, keys, "event_text")
+    builder_sec = time.perf_counter() - start
+    print(f"  SessionDocumentBuilder: {builder_sec:8.3f}s  (x{legacy_sec / builder_sec:.1f})")
+
+    assert docs["event_text"].tolist() == legacy["event_text"].tolist()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# benchmarks/bench_event_store.py
+"""
+반복 실행 cold start benchmark: 매번 CSV 파싱 vs EventStore (1회 ingest + memory-map open)
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_event_store --events 5000000 --out /tmp/bench_event_store
+"""
+
+import argparse
+import os
+import shutil
+import time
+
+import pandas as pd
+
+from benchmarks.bench_parallel import make_events
+from feature_store.event_store import EventStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5_000_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--out", default="/tmp/bench_event_store")
+    args = parser.parse_args()
+
+    shutil.rmtree(args.out, ignore_errors=True)
+    os.makedirs(args.out)
+    csv_path = os.path.join(args.out, "raw_events.csv")
+    make_events(args.events, args.users).to_csv(csv_path, index=False)
+    print(f"[{args.events:,} events, CSV {os.path.getsize(csv_path) / 1e6:.1f} MB]")
+
+    # run_pipeline 기본 경로: 실행할 때마다 CSV 파싱
+    start = time.perf_counter()
+    df_csv = pd.read_csv(csv_path, dtype={"event_text": "category"})
+    df_csv["event_time"] = pd.to_datetime(df_csv["event_time"])
+    csv_sec = time.perf_counter() - start
+    print(f"  CSV parse (every run)   : {csv_sec:8.3f}s")
+
+    store = EventStore(os.path.join(args.out, "events"))
+    start = time.perf_counter()
+    store.ingest(csv_path, time_cols=["event_time"], text_cols=["event_text"])
+    ingest_sec = time.perf_counter() - start
+    print(f"  EventStore ingest (once): {ingest_sec:8.3f}s")
+
+    start = time.perf_counter()
+    df_store = store.open()
+    open_sec = time.perf_counter() - start
+    print(f"  EventStore open         : {open_sec:8.3f}s  (x{csv_sec / open_sec:,.0f} vs CSV parse)")
+
+    # open 은 lazy 이므로 실제로 전체 컬럼을 한 번 훑는 시간도 함께 측정
+    start = time.perf_counter()
+    int(df_store["user_id"].sum())
+    df_store["event_time"].max()
+    df_store["event_text"].cat.codes.max()
+    scan_sec = time.perf_counter() - start
+    print(f"  EventStore first scan   : {scan_sec:8.3f}s")
+
+    pd.testing.assert_series_equal(df_store["user_id"], df_csv["user_id"])
+    assert (df_store["event_time"].to_numpy() == df_csv["event_time"].to_numpy()).all()
+    assert (df_store["event_text"].astype(str).to_numpy() == df_csv["event_text"].astype(str).to_numpy()).all()
+
+
+if __name__ == "__main__":
+    main()
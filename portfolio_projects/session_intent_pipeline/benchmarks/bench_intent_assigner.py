@@ -0,0 +1,131 @@
+# benchmarks/bench_intent_assigner.py
+"""
+IntentAssigner latency / throughput benchmark: exact vs IVF 근사 인덱스
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_intent_assigner --sessions 50000 --clusters 5000 --lists 128 --probe 2
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+
+from benchmarks.bench_clusterer import make_session_docs
+from feature_store.clusterer import SessionClusterer
+from feature_store.intent_assigner import IntentAssigner
+from feature_store.vectorizer import SessionVectorizer
+
+
+def make_clustered_tfidf(
+    n_rows: int,
+    n_features: int,
+    n_clusters: int,
+    nnz_per_row: int,
+    n_topics: int = 64,
+    seed: int = 42,
+):
+    """
+    topic → cluster → session 계층 구조를 가진 L2 정규화 sparse 행렬과 centroid
+
+    실제 intent centroid 처럼 같은 topic 의 cluster 끼리 feature 를 공유하므로
+    centroid 를 다시 묶는 IVF coarse 단계가 의미를 가진다.
+    """
+    rng = np.random.default_rng(seed)
+    topic_pool = rng.integers(0, n_features, (n_topics, 2000))
+    cluster_topic = rng.integers(0, n_topics, n_clusters)
+    cluster_pool = topic_pool[cluster_topic[:, None], rng.integers(0, 2000, (n_clusters, 50))]
+
+    groups = rng.integers(0, n_clusters, n_rows)
+    own = rng.random((n_rows, nnz_per_row)) < 0.7
+    indices = np.where(
+        own,
+        cluster_pool[groups[:, None], rng.integers(0, 50, (n_rows, nnz_per_row))],
+        topic_pool[cluster_topic[groups][:, None], rng.integers(0, 2000, (n_rows, nnz_per_row))],
+    ).ravel()
+    indptr = np.arange(0, n_rows * nnz_per_row + 1, nnz_per_row)
+    data = rng.random(n_rows * nnz_per_row).astype(np.float32)
+    X = sp.csr_matrix((data, indices, indptr), shape = (n_rows, n_features))
+    X.sum_duplicates()
+    X = normalize(X)
+
+    # centroid: cluster 별 세션 평균 (실제 centroid 처럼 dense 하고 norm < 1)
+    indicator = sp.csr_matrix(
+        (np.ones(n_rows), (groups, np.arange(n_rows))),
+        shape = (n_clusters, n_rows),
+    )
+    centroids = np.asarray((normalize(indicator, norm = "l1") @ X).todense())
+    return X, centroids
+
+
+def latency_ms(assign, X, batch: int, n_batches: int = 200):
+    """online 요청 크기(batch) 별 p50 / p99 지연"""
+    rng = np.random.default_rng(0)
+    starts = rng.integers(0, X.shape[0] - batch, n_batches)
+    timings = []
+    for start in starts:
+        t0 = time.perf_counter()
+        assign(X[start:start + batch])
+        timings.append((time.perf_counter() - t0) * 1e3)
+    return np.percentile(timings, 50), np.percentile(timings, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=50_000)
+    parser.add_argument("--features", type=int, default=2 ** 14)
+    parser.add_argument("--nnz", type=int, default=20)
+    parser.add_argument("--clusters", type=int, default=5000)
+    parser.add_argument("--lists", type=int, default=128)
+    parser.add_argument("--probe", type=int, default=2)
+    parser.add_argument("--online-batch", type=int, default=64)
+    args = parser.parse_args()
+
+    X, centroids = make_clustered_tfidf(args.sessions, args.features, args.clusters, args.nnz)
+    print(f"[{X.shape[0]:,} sessions x {X.shape[1]:,} features, k={args.clusters}]")
+
+    baseline = SessionClusterer.from_centroids(centroids)
+    t0 = time.perf_counter()
+    expected = baseline.predict(X)
+    base_sec = time.perf_counter() - t0
+    print(f"  SessionClusterer.predict : {args.sessions / base_sec:12,.0f} sessions/s")
+
+    exact = IntentAssigner(None, centroids)
+    t0 = time.perf_counter()
+    labels = exact.assign(X)
+    exact_sec = time.perf_counter() - t0
+    assert (labels == expected).mean() > 0.999  # float32 반올림 차이만 허용
+    p50, p99 = latency_ms(exact.assign, X, args.online_batch)
+    print(f"  IntentAssigner (exact)   : {args.sessions / exact_sec:12,.0f} sessions/s"
+          f"  batch={args.online_batch} p50 {p50:.2f}ms p99 {p99:.2f}ms")
+
+    t0 = time.perf_counter()
+    approx = IntentAssigner(None, centroids, n_lists = args.lists, n_probe = args.probe)
+    build_sec = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    approx_labels = approx.assign(X)
+    approx_sec = time.perf_counter() - t0
+    p50, p99 = latency_ms(approx.assign, X, args.online_batch)
+    print(f"  IntentAssigner (IVF {args.lists}/{args.probe}) : {args.sessions / approx_sec:12,.0f} sessions/s"
+          f"  batch={args.online_batch} p50 {p50:.2f}ms p99 {p99:.2f}ms"
+          f"  recall@1 {(approx_labels == labels).mean():.3f}  (index build {build_sec:.2f}s)")
+
+    # 텍스트 → intent end-to-end (vectorize 포함)
+    docs = pd.DataFrame({"cleaned_text": make_session_docs(min(args.sessions, 50_000))})
+    vectorizer = SessionVectorizer(mode = "hashing", n_features = 2 ** 16)
+    X_text, _ = vectorizer.fit_transform(docs)
+    clusterer = SessionClusterer(n_clusters = 8, backend = "minibatch")
+    clusterer.fit_predict(X_text)
+
+    service = IntentAssigner(vectorizer, clusterer.cluster_centers_)
+    t0 = time.perf_counter()
+    service.assign(docs)
+    text_sec = time.perf_counter() - t0
+    print(f"  end-to-end text (k=8)    : {len(docs) / text_sec:12,.0f} sessions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_parallel.py
+"""
+PartitionedSessionExecutor scaling benchmark (1 → N cores)
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_parallel --events 5000000 --max-workers 8
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from feature_store.parallel import PartitionedSessionExecutor
+
+EVENT_TEMPLATES = np.array([
+    "search hybrid suv deals",
+    "view kona hybrid 2024",
+    "click car detail page",
+    "search ev charging station",
+    "view ioniq 6 battery info",
+    "add to cart",
+    "purchase complete",
+])
+
+
+def make_events(n_events: int, n_users: int, seed: int = 42) -> pd.DataFrame:
+    """사용자별로 시간순인 이벤트를 만든 뒤 행 순서를 섞은 합성 로그"""
+    rng = np.random.default_rng(seed)
+    gaps = rng.exponential(600, n_events).astype(np.int64)
+
+    df = pd.DataFrame({
+        "user_id": np.sort(rng.integers(0, n_users, n_events)),
+        "event_time": np.datetime64("2025-12-01", "s") + np.cumsum(gaps),
+        "event_text": EVENT_TEMPLATES[rng.integers(0, len(EVENT_TEMPLATES), n_events)],
+    })
+    return df.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5_000_000)
+    parser.add_argument("--users", type=int, default=200_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    df = make_events(args.events, args.users)
+    print(f"[{args.events:,} events / {args.users:,} users]")
+
+    baseline = None
+    for n_workers in range(1, args.max_workers + 1):
+        executor = PartitionedSessionExecutor(n_workers=n_workers)
+
+        start = time.perf_counter()
+        _, docs = executor.run(df)
+        sec = time.perf_counter() - start
+
+        baseline = baseline or sec
+        print(
+            f"  workers={n_workers:2d} : {sec:8.3f}s  "
+            f"speedup x{baseline / sec:5.2f}  sessions={len(docs):,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
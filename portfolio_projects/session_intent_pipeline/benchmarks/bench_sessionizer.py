@@ -0,0 +1,92 @@
+# benchmarks/bench_sessionizer.py
+"""
+Sessionizer benchmark: 기존 groupby/shift/cumsum 구현 vs NumPy kernel
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_sessionizer --sizes 10000000 100000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from feature_store.sessionizer import Sessionizer, session_ids
+
+
+def make_events(n_events: int, n_users: int, seed: int = 42) -> pd.DataFrame:
+    """user_id, event_time 으로 정렬된 합성 이벤트 로그 생성"""
+    rng = np.random.default_rng(seed)
+
+    user_ids = np.sort(rng.integers(0, n_users, n_events))
+    # 사용자 내 이벤트 간격: 대부분 수 분, 가끔 30분 이상
+    gaps = rng.exponential(600, n_events).astype(np.int64)
+    event_times = np.datetime64("2025-12-01", "s") + np.cumsum(gaps)
+
+    return pd.DataFrame({"user_id": user_ids, "event_time": event_times})
+
+
+def legacy_assign_sessions(df: pd.DataFrame, gap: int) -> pd.DataFrame:
+    """기존 구현 (helper 컬럼 3개 + groupby 2회)"""
+    df = df.sort_values(["user_id", "event_time"])
+    df["prev_time"] = df.groupby("user_id")["event_time"].shift(1)
+    df["time_gap"] = (df["event_time"] - df["prev_time"]).dt.total_seconds()
+    df["new_session"] = (df["prev_time"].isna()) | (df["time_gap"] > gap)
+    df["session_id"] = df.groupby("user_id")["new_session"].cumsum()
+    return df
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run(n_events: int, n_users: int, skip_legacy: bool) -> None:
+    df = make_events(n_events, n_users)
+    sessionizer = Sessionizer(inactivity_minutes=30)
+
+    print(f"\n[{n_events:,} events / {n_users:,} users]")
+
+    if not skip_legacy:
+        legacy, sec = timed(legacy_assign_sessions, df, sessionizer.gap)
+        print(f"  legacy groupby       : {sec:8.3f}s")
+        expected = legacy["session_id"].to_numpy()
+        del legacy
+
+    _, sec = timed(sessionizer.assign_sessions, df)
+    print(f"  kernel (debug cols)  : {sec:8.3f}s")
+
+    fast, sec = timed(
+        sessionizer.assign_sessions, df, debug_columns=False, compact=True
+    )
+    print(f"  kernel (int32 only)  : {sec:8.3f}s")
+
+    ids, sec = timed(
+        session_ids,
+        df["user_id"].to_numpy(),
+        df["event_time"].to_numpy(),
+        np.timedelta64(sessionizer.gap, "s"),
+        np.int32,
+    )
+    print(f"  session_ids (arrays) : {sec:8.3f}s")
+
+    if not skip_legacy:
+        assert np.array_equal(fast["session_id"].to_numpy(), expected)
+        assert np.array_equal(ids, expected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000_000, 100_000_000])
+    parser.add_argument("--users-ratio", type=float, default=0.01)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    for n_events in args.sizes:
+        run(n_events, max(1, int(n_events * args.users_ratio)), args.skip_legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/bench_storage.py
+"""
+session_docs 저장 포맷 benchmark: CSV vs 파티션 Parquet (ParquetStore)
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_storage --events 2000000 --out /tmp/bench_storage
+"""
+
+import argparse
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_doc_builder import make_sessionized
+from feature_store.doc_builder import SessionDocumentBuilder
+from feature_store.parquet_store import ParquetStore, user_bucket
+from pipelines.run_pipeline import SESSION_DOCS_BUCKETS, SESSION_DOCS_SCHEMA
+
+
+def make_session_docs(n_events: int) -> pd.DataFrame:
+    """run_pipeline 출력과 같은 column 의 합성 session_docs"""
+    events = make_sessionized(n_events, events_per_session = 5)
+    docs = SessionDocumentBuilder().build(events, ["user_id", "session_id"], "event_text", out_col = "raw_text")
+    docs["global_session_id"] = docs["user_id"].astype(str) + "_" + docs["session_id"].astype(str)
+    docs["cleaned_text"] = docs["raw_text"]
+    docs["cluster_id"] = np.random.default_rng(0).integers(0, 8, len(docs))
+    return docs[SESSION_DOCS_SCHEMA.names]
+
+
+def dir_size(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, files in os.walk(path)
+        for name in files
+    )
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2_000_000)
+    parser.add_argument("--out", default="/tmp/bench_storage")
+    args = parser.parse_args()
+
+    docs = make_session_docs(args.events)
+    shutil.rmtree(args.out, ignore_errors=True)
+    os.makedirs(args.out)
+    print(f"[{len(docs):,} session docs]")
+
+    csv_path = os.path.join(args.out, "session_docs.csv")
+    _, csv_write = timed(lambda: docs.to_csv(csv_path, index=False))
+    _, csv_read = timed(lambda: pd.read_csv(csv_path))
+    _, csv_proj = timed(lambda: pd.read_csv(csv_path, usecols=["global_session_id", "cluster_id"]))
+    print(f"  CSV            : write {csv_write:7.3f}s  read {csv_read:7.3f}s"
+          f"  read 2 cols {csv_proj:7.3f}s  size {dir_size(csv_path) / 1e6:8.1f} MB")
+
+    store = ParquetStore(
+        os.path.join(args.out, "session_docs"),
+        schema = SESSION_DOCS_SCHEMA,
+        partitioning = {"user_bucket": lambda df: user_bucket(df["user_id"], SESSION_DOCS_BUCKETS)},
+    )
+    _, pq_write = timed(lambda: store.write(docs))
+    _, pq_read = timed(lambda: store.read())
+    _, pq_proj = timed(lambda: store.read(columns=["global_session_id", "cluster_id"]))
+    _, pq_filter = timed(lambda: store.read(filters=[("user_bucket", "=", 0)]))
+    print(f"  Parquet (zstd) : write {pq_write:7.3f}s  read {pq_read:7.3f}s"
+          f"  read 2 cols {pq_proj:7.3f}s  size {dir_size(store.root) / 1e6:8.1f} MB"
+          f"  (1/{SESSION_DOCS_BUCKETS} bucket {pq_filter:.3f}s)")
+
+    print(f"  → read x{csv_read / pq_read:.1f}, 2-col read x{csv_proj / pq_proj:.1f},"
+          f" size x{dir_size(csv_path) / dir_size(store.root):.1f} smaller")
+
+
+if __name__ == "__main__":
+    main()
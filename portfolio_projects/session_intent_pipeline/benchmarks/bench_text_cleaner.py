@@ -0,0 +1,69 @@
+# benchmarks/bench_text_cleaner.py
+"""
+TextCleaner throughput benchmark
+
+Run (프로젝트 루트에서):
+    python -m benchmarks.bench_text_cleaner --rows 5000000 --unique 500
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from feature_store.text_cleaner import TextCleaner
+
+WORDS = np.array([
+    "Search", "view", "click", "Kona", "hybrid", "2024", "EV", "charging",
+    "station!", "IONIQ-6", "battery", "info", "add", "to", "cart", "(promo)",
+])
+
+
+def make_texts(n_rows: int, n_unique: int, seed: int = 42) -> pd.Series:
+    """소수의 템플릿 이벤트 문자열이 반복되는 합성 컬럼"""
+    rng = np.random.default_rng(seed)
+    templates = np.array([
+        " ".join(rng.choice(WORDS, rng.integers(2, 6))) for _ in range(n_unique)
+    ], dtype=object)
+    return pd.Series(templates[rng.integers(0, n_unique, n_rows)], name="event_text")
+
+
+def report(label: str, func, n_rows: int):
+    start = time.perf_counter()
+    result = func()
+    sec = time.perf_counter() - start
+    print(f"  {label:<28}: {sec:8.3f}s  {n_rows / sec / 1e6:8.2f}M rows/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--unique", type=int, default=500)
+    args = parser.parse_args()
+
+    texts = make_texts(args.rows, args.unique)
+    arrow_texts = pa.array(texts)
+    cleaner = TextCleaner()
+    print(f"[{args.rows:,} rows / {args.unique:,} unique strings]")
+
+    expected = report(
+        "str.lower + str.replace",
+        lambda: texts.str.lower().str.replace(cleaner.pattern, "", regex=True),
+        args.rows,
+    )
+    batch = report("clean_batch (Series)", lambda: cleaner.clean_batch(texts), args.rows)
+    report("clean_batch (Arrow)", lambda: cleaner.clean_batch(arrow_texts), args.rows)
+    report(
+        "clean_batch (Arrow dict)",
+        lambda: cleaner.clean_batch(arrow_texts.dictionary_encode()),
+        args.rows,
+    )
+
+    assert batch.tolist() == expected.tolist()
+
+
+if __name__ == "__main__":
+    main()
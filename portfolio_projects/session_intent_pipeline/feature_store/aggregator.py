@@ -1,13 +1,20 @@
+import numpy as np
 import pandas as pd
 
+from feature_store.doc_builder import SessionDocumentBuilder, group_starts
+from feature_store.text_cleaner import TextCleaner
+from feature_store.token_docs import TokenDocs, TokenVocabulary
+
 # class 뼈대
 class SessionTextAggregator:
     """
     Aggregates event-level texts into session-level documents.
     """
 
-    def __init__(self, text_col: "event_text"):
+    def __init__(self, text_col: "event_text", cleaner: TextCleaner = None):
         self.text_col = text_col
+        self.doc_builder = SessionDocumentBuilder(sep=" ")
+        self.cleaner = cleaner if cleaner is not None else TextCleaner()
 
     def aggregate(self, df: pd.DataFrame) -> pd.DataFrame:
         # 핵심 매서드 정의
@@ -31,16 +38,13 @@ class SessionTextAggregator:
         # Session별 텍스트 결합(핵심 로직)
         # groupby(session_id)
         # 이벤트 텍스트들을 시간 순서 그대로 하나의 문장으로
+        # 정렬된 그룹을 offsets 기반으로 한 번에 결합 (세션별 lambda 호출 없음)
         # ===============================
-        session_text = (
-            df.groupby(["user_id", "session_id"])[self.text_col]
-            .apply(lambda x: " ".join(x))
-            .reset_index()
-        )
-        
-        # Rename aggregated text column
-        session_text = session_text.rename(
-            columns = {self.text_col: "raw_text"}
+        session_text = self.doc_builder.build(
+            df,
+            group_cols = ["user_id", "session_id"],
+            text_col = self.text_col,
+            out_col = "raw_text",
         )
 
         # ==============================
@@ -56,12 +60,53 @@ class SessionTextAggregator:
         # 텍스트 정제(cleaned_text)
         # Vectorizer / Embedding 입력은 정규화된 텍스트
         # 불필요한 특수문자 제거, 소문자화 등
+        # 반복되는 이벤트 문자열 단위로 정제한 뒤 세션 단위로 결합
+        # (문자 단위 정제이므로 결합 후 정제한 결과와 같다)
         # ==============================
-        session_text["cleaned_text"] = (
-            session_text["raw_text"]
-            .str.lower()                                    # 소문자화
-            .str.replace(r"[^a-z0-0\s]", "", regex = True)  # 특수문자 제거
+        cleaned_events = df[["user_id", "session_id"]].assign(
+            cleaned_text = self.cleaner.clean_batch(df[self.text_col])
         )
+        session_text["cleaned_text"] = self.doc_builder.build(
+            cleaned_events,
+            group_cols = ["user_id", "session_id"],
+            text_col = "cleaned_text",
+        )["cleaned_text"]
 
         return session_text
+
+    def aggregate_tokens(self, df: pd.DataFrame, vocab: TokenVocabulary = None):
+        """
+        세션 문서를 문자열 대신 token id 배열로 생성
+
+        raw_text join → 정제 → vectorizer 재-tokenize 과정을 건너뛰고,
+        고유 이벤트 텍스트만 한 번씩 정제/tokenize 한 뒤 세션 단위로 이어 붙인다.
+
+        Input:
+            df: sessionized DataFrame
+                columns: [user_id, session_id, event_time, event_text]
+            vocab: 공유 vocabulary (없으면 새로 생성)
+
+        Output:
+            (session_keys, token_docs)
+                session_keys columns: [user_id, session_id, global_session_id]
+                token_docs: session_keys 와 같은 순서의 TokenDocs
+        """
+        vocab = vocab if vocab is not None else TokenVocabulary()
+        df = df.sort_values(by=["user_id", "session_id", "event_time"])
+
+        row_offsets, token_ids = vocab.encode_rows(
+            df[self.text_col],
+            preprocess = self.cleaner.clean,
+        )
+
+        starts = group_starts(df, ["user_id", "session_id"])
+        session_keys = df[["user_id", "session_id"]].iloc[starts].reset_index(drop = True)
+        session_keys["global_session_id"] = (
+            session_keys["user_id"].astype(str)
+            + "_"
+            + session_keys["session_id"].astype(str)
+        )
+
+        indptr = row_offsets[np.append(starts, len(df))]
+        return session_keys, TokenDocs(indptr, token_ids, vocab)
     
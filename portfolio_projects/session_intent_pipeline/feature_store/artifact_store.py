@@ -0,0 +1,200 @@
+# feature_store/artifact_store.py
+import json
+import os
+import shutil
+from datetime import datetime
+
+import numpy as np
+
+from feature_store.clusterer import SessionClusterer
+from feature_store.vectorizer import SessionVectorizer
+
+
+class ArtifactStore:
+    """
+    fitted SessionVectorizer / SessionClusterer 를 버전별 디렉토리에 저장
+
+    models/artifacts/
+        LATEST                 ← 최신 버전 이름
+        20251201-093000-123456/
+            manifest.json      ← 버전, 생성 시각, 파라미터
+            vocabulary.npy     ← column 순서의 term 배열 (tfidf 모드)
+            idf.npy            ← IDF 가중치 (tfidf 모드)
+            doc_freq.npy       ← hash bucket 별 document frequency (hashing 모드)
+            centroids.npy      ← KMeans centroid
+
+    모든 배열은 .npy 로 저장하고 np.load(mmap_mode="r") 로 바로 연다.
+    (pickle 된 Python dict / 모델 객체 없음)
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, root: str = "models/artifacts"):
+        self.root = root
+
+    def versions(self) -> list:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if os.path.isfile(os.path.join(self.root, name, "manifest.json"))
+        )
+
+    def latest(self) -> str:
+        pointer = os.path.join(self.root, "LATEST")
+        if not os.path.exists(pointer):
+            raise FileNotFoundError(f"No saved artifacts under {self.root}")
+        with open(pointer, encoding = "utf-8") as f:
+            return f.read().strip()
+
+    def _new_version(self) -> str:
+        """
+        마이크로초 단위 timestamp 버전 이름 (정렬 순서 = 생성 순서)
+
+        같은 시각의 버전이 이미 있으면 "-1", "-2" ... suffix 를 붙인다.
+        """
+        base = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        version, suffix = base, 0
+        while os.path.exists(os.path.join(self.root, version)):
+            suffix += 1
+            version = f"{base}-{suffix}"
+        return version
+
+    # ==============================
+    # 저장
+    # ==============================
+    def save(
+        self,
+        vectorizer: SessionVectorizer,
+        clusterer: SessionClusterer,
+        version: str = None,
+    ) -> str:
+        version = version or self._new_version()
+        final_dir = os.path.join(self.root, version)
+        if os.path.exists(final_dir):
+            raise FileExistsError(f"Artifact version already exists: {final_dir}")
+
+        tmp_dir = final_dir + ".tmp"
+        shutil.rmtree(tmp_dir, ignore_errors = True)
+        os.makedirs(tmp_dir)
+
+        model = vectorizer.vectorizer
+        manifest = {
+            "format_version": self.FORMAT_VERSION,
+            "version": version,
+            "created_at": datetime.now().isoformat(timespec = "seconds"),
+            "vectorizer": {"mode": vectorizer.mode},
+            "clusterer": {
+                "n_clusters": int(clusterer.cluster_centers_.shape[0]),
+                "random_state": clusterer.random_state,
+                "backend": clusterer.backend,
+            },
+        }
+
+        if vectorizer.mode == "hashing":
+            manifest["vectorizer"].update({
+                "n_features": model.n_features,
+                "ngram_range": list(model.hasher.ngram_range),
+                "n_docs": int(model.n_docs_),
+            })
+            np.save(os.path.join(tmp_dir, "doc_freq.npy"), model.doc_freq_)
+        else:
+            params = model.get_params()
+            manifest["vectorizer"].update({
+                "max_features": params["max_features"],
+                "ngram_range": list(params["ngram_range"]),
+                "min_df": params["min_df"],
+            })
+            np.save(os.path.join(tmp_dir, "vocabulary.npy"), model.get_feature_names_out().astype(str))
+            np.save(os.path.join(tmp_dir, "idf.npy"), model.idf_)
+
+        np.save(os.path.join(tmp_dir, "centroids.npy"), np.asarray(clusterer.cluster_centers_))
+
+        with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding = "utf-8") as f:
+            json.dump(manifest, f, indent = 2)
+
+        os.replace(tmp_dir, final_dir)
+        with open(os.path.join(self.root, "LATEST"), "w", encoding = "utf-8") as f:
+            f.write(version)
+
+        return version
+
+    # ==============================
+    # 로드
+    # ==============================
+    def load_manifest(self, version: str = "latest") -> dict:
+        version = self.latest() if version == "latest" else version
+        with open(os.path.join(self.root, version, "manifest.json"), encoding = "utf-8") as f:
+            return json.load(f)
+
+    def load_centroids(self, feature_names, version: str = "latest") -> np.ndarray:
+        """
+        warm start 용 centroid 를 새 feature 공간에 맞춰 로드
+
+        tfidf 모드는 refit 마다 vocabulary 가 바뀌므로 term 기준으로 column 을
+        재배치하고, 새로 생긴 term 은 0 으로 채운다.
+        hashing 모드는 bucket 공간이 고정이므로 차원만 확인한다.
+        """
+        manifest = self.load_manifest(version)
+        path = os.path.join(self.root, manifest["version"])
+        centroids = np.load(os.path.join(path, "centroids.npy"))
+        feature_names = np.asarray(feature_names).astype(str)
+
+        if manifest["vectorizer"]["mode"] == "hashing":
+            if centroids.shape[1] != len(feature_names):
+                raise ValueError(
+                    f"centroid dim {centroids.shape[1]} != n_features {len(feature_names)}"
+                )
+            return centroids
+
+        old_terms = np.load(os.path.join(path, "vocabulary.npy"))
+        old_index = {term: i for i, term in enumerate(old_terms.tolist())}
+        new_cols, old_cols = [], []
+        for j, term in enumerate(feature_names.tolist()):
+            i = old_index.get(term)
+            if i is not None:
+                new_cols.append(j)
+                old_cols.append(i)
+
+        aligned = np.zeros((centroids.shape[0], len(feature_names)), dtype = centroids.dtype)
+        aligned[:, new_cols] = centroids[:, old_cols]
+        return aligned
+
+    def load(self, version: str = "latest"):
+        """
+        Output:
+            (vectorizer, clusterer) — transform / predict 전용
+        """
+        manifest = self.load_manifest(version)
+        path = os.path.join(self.root, manifest["version"])
+        params = manifest["vectorizer"]
+
+        def load_array(name):
+            return np.load(os.path.join(path, name), mmap_mode = "r")
+
+        if params["mode"] == "hashing":
+            vectorizer = SessionVectorizer(
+                ngram_range = tuple(params["ngram_range"]),
+                mode = "hashing",
+                n_features = params["n_features"],
+            )
+            vectorizer.vectorizer.doc_freq_ = load_array("doc_freq.npy")
+            vectorizer.vectorizer.n_docs_ = params["n_docs"]
+        else:
+            vectorizer = SessionVectorizer(
+                max_features = params["max_features"],
+                ngram_range = tuple(params["ngram_range"]),
+                min_df = params["min_df"],
+            )
+            terms = load_array("vocabulary.npy")
+            model = vectorizer.vectorizer
+            model.vocabulary_ = {term: i for i, term in enumerate(terms.tolist())}
+            model.fixed_vocabulary_ = True
+            model.idf_ = load_array("idf.npy")
+
+        clusterer = SessionClusterer.from_centroids(
+            load_array("centroids.npy"),
+            random_state = manifest["clusterer"]["random_state"],
+        )
+
+        return vectorizer, clusterer
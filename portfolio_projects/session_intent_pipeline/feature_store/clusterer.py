@@ -1,4 +1,9 @@
-from sklearn.cluster import KMeans
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import silhouette_score
 
 class SessionClusterer:
     """
@@ -10,13 +15,60 @@ class SessionClusterer:
     # n_cluster: 비즈니스에서 조절 가능
     # random_state: 재현성
     # n_init = 10: 안정적인 수렴
+    # backend:
+    #   "kmeans"    - full-batch Lloyd (기본값, 기존 동작)
+    #   "minibatch" - MiniBatchKMeans, chunk 단위 partial_fit 가능
+    # init_centroids: 전날 centroid 로 warm start (n_init = 1)
+    # copy_x: False 이면 KMeans 가 입력 X 를 복사하지 않음 (kmeans backend)
+    #         → memory-map 으로 공유한 행렬을 그대로 사용 (k sweep worker)
     #===============================
-    def __init__(self, n_clusters = 3, random_state = 42):
-        self.model = KMeans(
-            n_clusters = n_clusters,
-            random_state = random_state,
-            n_init = 10,
-        )
+    BACKENDS = ("kmeans", "minibatch")
+
+    def __init__(
+        self,
+        n_clusters = 3,
+        random_state = 42,
+        backend = "kmeans",
+        batch_size = 1024,
+        init_centroids = None,
+        copy_x = True,
+    ):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"backend must be one of {self.BACKENDS}, got {backend!r}")
+
+        self.n_clusters = n_clusters
+        self.random_state = random_state
+        self.backend = backend
+        self.batch_size = batch_size
+
+        if init_centroids is not None:
+            init_centroids = np.asarray(init_centroids, dtype = np.float64)
+            if init_centroids.shape[0] != n_clusters:
+                raise ValueError(
+                    f"init_centroids has {init_centroids.shape[0]} rows, expected {n_clusters}"
+                )
+            init, n_init = init_centroids, 1
+        else:
+            init, n_init = "k-means++", (10 if backend == "kmeans" else 3)
+
+        if backend == "kmeans":
+            self.model = KMeans(
+                n_clusters = n_clusters,
+                init = init,
+                random_state = random_state,
+                n_init = n_init,
+                copy_x = copy_x,
+            )
+        else:
+            self.model = MiniBatchKMeans(
+                n_clusters = n_clusters,
+                init = init,
+                random_state = random_state,
+                n_init = n_init,
+                batch_size = batch_size,
+            )
+        self._centers = None
+        self.fit_seconds_ = None
 
     # ==============================
     # fit_predict 메서드
@@ -29,7 +81,148 @@ class SessionClusterer:
         Output:
             labels: cluster assignment per session
         """
+        start = time.perf_counter()
         labels = self.model.fit_predict(X)
+        self.fit_seconds_ = time.perf_counter() - start
+        self._centers = self.model.cluster_centers_
         return labels
-    
-    
\ No newline at end of file
+
+    # ==============================
+    # streaming 학습 (minibatch backend)
+    # ==============================
+    def partial_fit(self, X):
+        """TF-IDF chunk 하나로 centroid 를 incremental 업데이트"""
+        if self.backend != "minibatch":
+            raise ValueError("partial_fit requires backend='minibatch'.")
+
+        start = time.perf_counter()
+        self.model.partial_fit(X)
+        self.fit_seconds_ = (self.fit_seconds_ or 0.0) + time.perf_counter() - start
+        self._centers = self.model.cluster_centers_
+        return self
+
+    def fit_stream(self, chunks):
+        """
+        Input:
+            chunks: TF-IDF 행렬 chunk 들의 iterable (generator 가능)
+
+        Output:
+            self — 라벨은 predict 로 chunk 별 계산
+        """
+        self.fit_seconds_ = 0.0
+        for X in chunks:
+            # 첫 chunk 가 n_clusters 보다 작으면 k-means++ 초기화가 불가능
+            if self._centers is None and X.shape[0] < self.n_clusters:
+                raise ValueError(
+                    f"first chunk has {X.shape[0]} rows, need at least {self.n_clusters}"
+                )
+            self.partial_fit(X)
+
+        if self._centers is None:
+            raise ValueError("fit_stream received no chunks.")
+        return self
+
+    # ==============================
+    # 품질 지표 (backend 비교용)
+    # ==============================
+    def evaluate(self, X, labels = None, sample_size = 10_000):
+        """
+        Input:
+            X: TF-IDF matrix
+            labels: 미리 계산한 라벨 (없으면 predict)
+            sample_size: silhouette 계산용 샘플 수 (O(n^2) 이므로 샘플링)
+
+        Output:
+            {"inertia", "silhouette", "davies_bouldin", "fit_seconds"}
+        """
+        centers = self.cluster_centers_
+        labels = self.predict(X) if labels is None else np.asarray(labels)
+
+        # ||x - c||^2 = ||x||^2 - 2 x·c + ||c||^2 (할당된 centroid 기준)
+        if sp.issparse(X):
+            x_sq = np.asarray(X.multiply(X).sum(axis = 1)).ravel()
+        else:
+            x_sq = np.einsum("ij,ij->i", X, X)
+        dots = np.asarray(X @ centers.T)[np.arange(X.shape[0]), labels]
+        c_sq = np.einsum("ij,ij->i", centers, centers)
+        sq_dist = np.maximum(x_sq - 2 * dots + c_sq[labels], 0)
+        inertia = float(sq_dist.sum())
+
+        silhouette = None
+        if 1 < len(np.unique(labels)) < X.shape[0]:
+            silhouette = float(silhouette_score(
+                X, labels,
+                sample_size = min(sample_size, X.shape[0]),
+                random_state = self.random_state,
+            ))
+
+        return {
+            "inertia": inertia,
+            "silhouette": silhouette,
+            "davies_bouldin": self._davies_bouldin(np.sqrt(sq_dist), labels, centers, c_sq),
+            "fit_seconds": self.fit_seconds_,
+        }
+
+    @staticmethod
+    def _davies_bouldin(dist, labels, centers, c_sq):
+        """
+        Davies-Bouldin index (낮을수록 좋음), 샘플-centroid 거리로 한 번에 계산
+
+        s_i = cluster i 의 평균 centroid 거리, M_ij = centroid 간 거리
+        DB = mean_i max_{j != i} (s_i + s_j) / M_ij
+        """
+        counts = np.bincount(labels, minlength = len(centers))
+        used = np.flatnonzero(counts)
+        if len(used) < 2:
+            return None
+
+        spread = np.bincount(labels, weights = dist, minlength = len(centers))[used] / counts[used]
+        gram = centers[used] @ centers[used].T
+        sep = np.sqrt(np.maximum(c_sq[used][:, None] + c_sq[used][None, :] - 2 * gram, 0))
+
+        sep[sep == 0] = np.inf  # 겹친 centroid (대각 포함) 는 ratio 0
+
+        ratio = (spread[:, None] + spread[None, :]) / sep
+        return float(ratio.max(axis = 1).mean())
+
+    # ==============================
+    # k 자동 선택
+    # ==============================
+    @classmethod
+    def select_k(cls, X, k_values, **sweep_kwargs):
+        """
+        k 후보를 병렬로 학습/평가하고 선택된 clusterer 반환 (feature_store.k_sweep 참고)
+
+        Output:
+            (clusterer, labels, report DataFrame)
+        """
+        from feature_store.k_sweep import KSweep
+
+        return KSweep(k_values, **sweep_kwargs).run(X)
+
+    # ==============================
+    # 저장된 centroid 로 추론 (transform-only 경로)
+    # ==============================
+    @classmethod
+    def from_centroids(cls, centroids: np.ndarray, random_state = 42):
+        """저장된 centroid 배열(memory-map 가능)로 predict 전용 clusterer 생성"""
+        clusterer = cls(n_clusters = len(centroids), random_state = random_state)
+        clusterer._centers = centroids
+        return clusterer
+
+    @property
+    def cluster_centers_(self) -> np.ndarray:
+        if self._centers is None:
+            raise ValueError("SessionClusterer is not fitted.")
+        return self._centers
+
+    def predict(self, X):
+        """
+        가장 가까운 centroid 로 할당
+
+        argmin ||x - c||^2 = argmax (x·c - ||c||^2 / 2)
+        → sparse X 와 dense centroid 의 행렬곱 한 번으로 계산
+        """
+        centers = self.cluster_centers_
+        scores = X @ centers.T - 0.5 * np.einsum("ij,ij->i", centers, centers)
+        return np.asarray(scores).argmax(axis = 1).ravel()
@@ -0,0 +1,97 @@
+# feature_store/doc_builder.py
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+def group_starts(df: pd.DataFrame, group_cols) -> np.ndarray:
+    """group_cols 기준으로 정렬된 df에서 각 그룹의 시작 위치"""
+    n = len(df)
+    is_start = np.zeros(n, dtype=bool)
+    if n == 0:
+        return np.flatnonzero(is_start)
+
+    is_start[0] = True
+    for col in group_cols:
+        values = df[col].to_numpy()
+        is_start[1:] |= values[1:] != values[:-1]
+
+    return np.flatnonzero(is_start)
+
+
+def join_sorted_groups(texts, starts: np.ndarray, sep: str = " ") -> pa.LargeStringArray:
+    """
+    연속된 그룹의 텍스트를 sep 으로 이어 붙인 문서 배열 생성
+
+    각 그룹의 마지막 원소를 제외한 원소 뒤에 sep 을 붙이면,
+    그룹 문서는 하나의 연속된 string buffer 안에서 [offsets[start], offsets[end]) 구간이 된다.
+    따라서 그룹별 Python join 없이 offsets 만 골라서 새 Arrow 배열을 만든다.
+    (null 텍스트는 빈 문자열로 처리)
+    """
+    arr = pa.array(texts, from_pandas=True)
+    if pa.types.is_dictionary(arr.type):
+        arr = arr.dictionary_decode()
+    arr = pc.fill_null(arr.cast(pa.large_string()), "")
+
+    n = len(arr)
+    if n == 0:
+        return pa.array([], type=pa.large_string())
+
+    ends = np.append(starts[1:], n)
+
+    is_last = np.zeros(n, dtype=bool)
+    is_last[ends - 1] = True
+    suffix = pc.if_else(pa.array(is_last), "", sep).cast(pa.large_string())
+
+    joined = pc.binary_join_element_wise(arr, suffix, pa.scalar("", pa.large_string()))
+    if isinstance(joined, pa.ChunkedArray):
+        joined = joined.combine_chunks()
+
+    # 이어 붙인 배열의 offsets / data buffer 를 그대로 재사용
+    offsets = np.frombuffer(joined.buffers()[1], dtype=np.int64)
+    offsets = offsets[joined.offset: joined.offset + n + 1]
+    doc_offsets = offsets[np.append(starts, n)]
+
+    return pa.LargeStringArray.from_buffers(
+        len(starts), pa.py_buffer(np.ascontiguousarray(doc_offsets)), joined.buffers()[2]
+    )
+
+
+class SessionDocumentBuilder:
+    """
+    정렬된 이벤트 로그를 그룹(세션) 단위 문서로 만드는 공용 builder
+
+    groupby().apply(lambda x: " ".join(x)) 와 같은 결과를
+    그룹마다 Python 함수를 호출하지 않고 한 번에 생성한다.
+    """
+
+    def __init__(self, sep: str = " "):
+        self.sep = sep
+
+    def build(
+        self,
+        df: pd.DataFrame,
+        group_cols,
+        text_col: str,
+        out_col: str = None,
+    ) -> pd.DataFrame:
+        """
+        Input:
+            df: group_cols 기준으로 정렬된 DataFrame (그룹 내부는 이벤트 순서)
+            group_cols: 세션 key 컬럼 목록 (예: ["user_id", "session_id"])
+            text_col: 이어 붙일 텍스트 컬럼
+
+        Output:
+            DataFrame
+                columns: [*group_cols, out_col]
+        """
+        group_cols = list(group_cols)
+        starts = group_starts(df, group_cols)
+
+        docs = df[group_cols].iloc[starts].reset_index(drop=True)
+        docs[out_col or text_col] = (
+            join_sorted_groups(df[text_col], starts, self.sep).to_pandas()
+        )
+
+        return docs
@@ -0,0 +1,179 @@
+# feature_store/event_store.py
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+
+class EventStore:
+    """
+    원천 이벤트 로그를 한 번만 파싱해 두는 memory-map 컬럼 저장소
+
+    data/store/events/
+        manifest.json              ← 행 수, 컬럼별 종류/dtype, 원본 CSV 정보
+        user_id.bin                ← 고정 폭 int 배열 (raw little-endian)
+        event_time.bin             ← datetime64[ns] (int64)
+        event_text.codes.bin       ← dictionary code (int32)
+        event_text.dictionary.json ← code → 문자열
+
+    - ingest: CSV 를 chunk 단위로 읽어 컬럼별 파일 뒤에 append (전체를 메모리에 올리지 않음)
+    - open: np.memmap 으로 열기만 하므로 파싱 없음, 숫자 컬럼은 복사 없이 DataFrame 에 연결
+    - 문자열 컬럼은 pandas category (codes = memmap, categories = dictionary)
+    """
+
+    MANIFEST = "manifest.json"
+    FORMAT_VERSION = 1
+
+    def __init__(self, root: str = "data/store/events"):
+        self.root = root
+
+    def exists(self) -> bool:
+        return os.path.isfile(os.path.join(self.root, self.MANIFEST))
+
+    def manifest(self) -> dict:
+        with open(os.path.join(self.root, self.MANIFEST), encoding = "utf-8") as f:
+            return json.load(f)
+
+    def is_fresh(self, source_path: str) -> bool:
+        """원본 CSV 가 ingest 이후 바뀌지 않았으면 True"""
+        if not self.exists():
+            return False
+        source = self.manifest()["source"]
+        stat = os.stat(source_path)
+        return source["size"] == stat.st_size and source["mtime_ns"] == stat.st_mtime_ns
+
+    # ==============================
+    # ingest (1회)
+    # ==============================
+    def ingest(
+        self,
+        source_path: str,
+        time_cols = ("event_time",),
+        text_cols = None,
+        int_dtype = "int64",
+        chunksize: int = 1_000_000,
+    ) -> "EventStore":
+        """
+        Input:
+            source_path: 원천 CSV
+            time_cols: datetime64[ns] 로 저장할 컬럼
+            text_cols: dictionary 로 인코딩할 문자열 컬럼 (None 이면 object/str 컬럼 전부)
+            int_dtype: 정수 컬럼 저장 dtype (id 범위가 작으면 "int32")
+        """
+        tmp_root = self.root + ".tmp"
+        shutil.rmtree(tmp_root, ignore_errors = True)
+        os.makedirs(tmp_root)
+
+        columns = None
+        dictionaries = {}
+        n_rows = 0
+        files = {}
+
+        try:
+            for chunk in pd.read_csv(source_path, chunksize = chunksize):
+                if columns is None:
+                    columns = self._plan_columns(chunk, time_cols, text_cols, int_dtype)
+                    for name, spec in columns.items():
+                        files[name] = open(os.path.join(tmp_root, spec["file"]), "wb")
+                        if spec["kind"] == "text":
+                            dictionaries[name] = {}
+
+                for name, spec in columns.items():
+                    values = chunk[name]
+                    if spec["kind"] == "time":
+                        array = pd.to_datetime(values).to_numpy("datetime64[ns]")
+                    elif spec["kind"] == "text":
+                        array = self._encode(values, dictionaries[name])
+                    else:
+                        array = values.to_numpy(spec["dtype"])
+                    files[name].write(np.ascontiguousarray(array, dtype = spec["dtype"]).tobytes())
+
+                n_rows += len(chunk)
+        finally:
+            for f in files.values():
+                f.close()
+
+        for name, mapping in dictionaries.items():
+            with open(os.path.join(tmp_root, columns[name]["dictionary"]), "w", encoding = "utf-8") as f:
+                json.dump(list(mapping), f, ensure_ascii = False)
+
+        stat = os.stat(source_path)
+        manifest = {
+            "format_version": self.FORMAT_VERSION,
+            "n_rows": n_rows,
+            "columns": columns,
+            "source": {
+                "path": os.path.abspath(source_path),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            },
+        }
+        with open(os.path.join(tmp_root, self.MANIFEST), "w", encoding = "utf-8") as f:
+            json.dump(manifest, f, indent = 2)
+
+        shutil.rmtree(self.root, ignore_errors = True)
+        os.makedirs(os.path.dirname(os.path.abspath(self.root)), exist_ok = True)
+        os.replace(tmp_root, self.root)
+        return self
+
+    @staticmethod
+    def _plan_columns(chunk: pd.DataFrame, time_cols, text_cols, int_dtype) -> dict:
+        """첫 chunk 로 컬럼별 저장 방식 결정 (column 순서 유지)"""
+        columns = {}
+        for name in chunk.columns:
+            dtype = chunk[name].dtype
+            if name in time_cols:
+                spec = {"kind": "time", "dtype": "datetime64[ns]"}
+            elif (text_cols is not None and name in text_cols) or (
+                text_cols is None and not pd.api.types.is_numeric_dtype(dtype)
+            ):
+                spec = {"kind": "text", "dtype": "int32", "dictionary": f"{name}.dictionary.json"}
+            elif pd.api.types.is_integer_dtype(dtype):
+                spec = {"kind": "int", "dtype": int_dtype}
+            else:
+                spec = {"kind": "float", "dtype": "float64"}
+            spec["file"] = f"{name}.codes.bin" if spec["kind"] == "text" else f"{name}.bin"
+            columns[name] = spec
+        return columns
+
+    @staticmethod
+    def _encode(values: pd.Series, mapping: dict) -> np.ndarray:
+        """chunk 문자열 → 전역 dictionary code (고유 값 단위로만 dict 조회)"""
+        codes, uniques = pd.factorize(values, use_na_sentinel = True)
+        lookup = np.empty(len(uniques), dtype = np.int32)
+        for i, text in enumerate(uniques):
+            lookup[i] = mapping.setdefault(text, len(mapping))
+        return np.where(codes < 0, -1, lookup[codes]).astype(np.int32)
+
+    # ==============================
+    # open (매 실행)
+    # ==============================
+    def open(self, columns: list = None) -> pd.DataFrame:
+        """
+        Output:
+            DataFrame — 숫자 / 시간 컬럼은 memmap 을 그대로 참조 (read-only),
+                        문자열 컬럼은 category
+        """
+        manifest = self.manifest()
+        n_rows = manifest["n_rows"]
+        specs = manifest["columns"]
+        columns = list(specs) if columns is None else columns
+
+        data = {}
+        for name in columns:
+            spec = specs[name]
+            path = os.path.join(self.root, spec["file"])
+            array = (
+                np.memmap(path, dtype = spec["dtype"], mode = "r", shape = (n_rows,))
+                if n_rows else np.empty(0, dtype = spec["dtype"])
+            )
+            if spec["kind"] == "text":
+                with open(os.path.join(self.root, spec["dictionary"]), encoding = "utf-8") as f:
+                    categories = pd.Index(json.load(f), dtype = "str")
+                data[name] = pd.Categorical.from_codes(np.asarray(array), categories = categories)
+            else:
+                data[name] = np.asarray(array)
+
+        return pd.DataFrame(data, copy = False)
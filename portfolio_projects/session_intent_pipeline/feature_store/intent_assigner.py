@@ -0,0 +1,172 @@
+# feature_store/intent_assigner.py
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.cluster import KMeans
+
+from feature_store.artifact_store import ArtifactStore
+
+
+class IntentAssigner:
+    """
+    저장된 SessionClusterer centroid 로 새 세션에 intent 를 할당하는 서비스 객체
+
+    - 학습 프로세스 / sklearn 모델 없이 ArtifactStore 의 배열만으로 동작
+    - centroid norm 을 미리 계산해 두고 batch 단위 sparse 행렬곱으로 할당
+        argmin ||x - c||^2 = argmax (x·c - ||c||^2 / 2)
+    - k 가 큰 경우 IVF 방식의 근사 인덱스 (n_lists > 0)
+        centroid 들을 다시 n_lists 개의 coarse 그룹으로 묶고,
+        세션마다 가까운 n_probe 개 그룹 안의 centroid 만 비교
+    """
+
+    def __init__(
+        self,
+        vectorizer,
+        centroids: np.ndarray,
+        batch_size = 4096,
+        n_lists = 0,
+        n_probe = 1,
+        random_state = 42,
+    ):
+        self.vectorizer = vectorizer
+        self.batch_size = batch_size
+
+        # float32 / C-contiguous 로 한 번만 변환 (memory-map 된 배열도 여기서 복사)
+        self.centroids = np.ascontiguousarray(centroids, dtype = np.float32)
+        self.centroids_T = np.ascontiguousarray(self.centroids.T)
+        self.half_sq_norms = 0.5 * np.einsum("ij,ij->i", self.centroids, self.centroids)
+
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        if n_lists:
+            self._build_index(n_lists, random_state)
+
+    @classmethod
+    def from_artifacts(cls, root: str = "models/artifacts", version: str = "latest", **kwargs):
+        """ArtifactStore 에 저장된 vectorizer / centroid 로 생성"""
+        vectorizer, clusterer = ArtifactStore(root).load(version)
+        return cls(vectorizer, clusterer.cluster_centers_, **kwargs)
+
+    @property
+    def n_clusters(self) -> int:
+        return self.centroids.shape[0]
+
+    # ==============================
+    # 근사 인덱스 (IVF)
+    # ==============================
+    def _build_index(self, n_lists: int, random_state: int):
+        if not 0 < self.n_probe <= n_lists <= self.n_clusters:
+            raise ValueError(
+                f"need 0 < n_probe({self.n_probe}) <= n_lists({n_lists}) <= k({self.n_clusters})"
+            )
+
+        # 방향 기준(spherical) coarse 클러스터링: norm 이 작은 centroid 들이
+        # 원점 근처 list 하나로 몰리지 않도록 정규화 후 묶는다
+        unit = self.centroids / np.maximum(np.linalg.norm(self.centroids, axis = 1, keepdims = True), 1e-12)
+        coarse = KMeans(n_clusters = n_lists, random_state = random_state, n_init = 1)
+        list_of = coarse.fit_predict(unit)
+
+        coarse_centers = coarse.cluster_centers_
+        coarse_centers /= np.maximum(np.linalg.norm(coarse_centers, axis = 1, keepdims = True), 1e-12)
+        self.coarse_T = np.ascontiguousarray(coarse_centers.T, dtype = np.float32)
+
+        # list 별 centroid id 를 (n_lists, max_list_size) 표로 padding
+        # pad 칸은 dummy centroid (index k: 0 벡터, norm 항 +inf → 절대 선택되지 않음)
+        sizes = np.bincount(list_of, minlength = n_lists)
+        members = np.argsort(list_of, kind = "stable")
+        slot = np.arange(len(members)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+
+        self.list_table = np.full((n_lists, sizes.max()), self.n_clusters, dtype = np.int64)
+        self.list_table[list_of[members], slot] = members
+
+        # gather 용 표: pad 칸은 그 list 의 첫 centroid 를 가리킴 (점수는 norm 항 +inf 로 버려짐)
+        # centroid 는 centroids_T 에서 바로 gather → list 별 padding 복사본을 따로 두지 않음
+        self.gather_table = np.where(self.list_table == self.n_clusters, self.list_table[:, :1], self.list_table)
+        self.padded_half_sq_norms = np.append(self.half_sq_norms, np.inf).astype(np.float32)
+
+    # ==============================
+    # 할당
+    # ==============================
+    def vectorize(self, sessions) -> sp.csr_matrix:
+        """
+        Input:
+            sessions: cleaned_text 컬럼이 있는 session_docs DataFrame,
+                      cleaned text 리스트/Series, 또는 이미 변환된 TF-IDF 행렬
+        """
+        if sp.issparse(sessions) or isinstance(sessions, np.ndarray):
+            return sessions
+        if not isinstance(sessions, pd.DataFrame):
+            sessions = pd.DataFrame({"cleaned_text": list(sessions)})
+        return self.vectorizer.transform(sessions)
+
+    def assign(self, sessions, return_distance = False):
+        """
+        Output:
+            labels: 세션별 intent (cluster id)
+            (return_distance=True 이면 (labels, 할당된 centroid 까지의 제곱거리))
+        """
+        X = self.vectorize(sessions)
+        n = X.shape[0]
+        labels = np.empty(n, dtype = np.int64)
+        best = np.empty(n, dtype = np.float32)
+
+        score_batch = self._score_approx if self.n_lists else self._score_exact
+        for start in range(0, n, self.batch_size):
+            stop = min(start + self.batch_size, n)
+            labels[start:stop], best[start:stop] = score_batch(X[start:stop])
+
+        if not return_distance:
+            return labels
+
+        if sp.issparse(X):
+            x_sq = np.asarray(X.multiply(X).sum(axis = 1)).ravel()
+        else:
+            x_sq = np.einsum("ij,ij->i", X, X)
+        return labels, np.maximum(x_sq - 2 * best, 0)
+
+    def _score_exact(self, X):
+        scores = np.asarray(X @ self.centroids_T) - self.half_sq_norms
+        labels = scores.argmax(axis = 1)
+        return labels, scores[np.arange(len(labels)), labels]
+
+    def _score_approx(self, X):
+        """
+        후보 centroid 만 gather 해서 점수 계산 (Python loop 는 probe 수만큼)
+
+        sparse 행 r 의 non-zero (f, v) 마다 후보 c 에 대해 v * C[c, f] 를 모아
+        행 단위로 합산 → (n, max_list_size) 점수표 (빈 행은 0)
+        """
+        X = sp.csr_matrix(X)
+        n = X.shape[0]
+        coarse = np.asarray(X @ self.coarse_T)
+        if self.n_probe == 1:
+            probes = coarse.argmax(axis = 1)[:, None]
+        else:
+            probes = np.argpartition(-coarse, self.n_probe - 1, axis = 1)[:, :self.n_probe]
+
+        row_of_nnz = np.repeat(np.arange(n), np.diff(X.indptr))
+        # reduceat 은 빈 행의 구간을 처리하지 못하므로 non-empty 행의 시작 offset 만 사용
+        nonempty = X.indptr[:-1] < X.indptr[1:]
+        starts = X.indptr[:-1][nonempty]
+        values = X.data[:, None].astype(np.float32)
+
+        labels = np.zeros(n, dtype = np.int64)
+        best = np.full(n, -np.inf, dtype = np.float32)
+        rows = np.arange(n)
+
+        for p in range(probes.shape[1]):
+            candidates = self.list_table[probes[:, p]]                      # (n, m)
+            dots = np.zeros(candidates.shape, dtype = np.float32)
+            if X.nnz:
+                members = self.gather_table[probes[row_of_nnz, p]]                  # (nnz, m)
+                gathered = self.centroids_T[X.indices[:, None], members]            # (nnz, m)
+                dots[nonempty] = np.add.reduceat(gathered * values, starts, axis = 0)
+            scores = dots - self.padded_half_sq_norms[candidates]
+
+            local = scores.argmax(axis = 1)
+            local_best = scores[rows, local]
+            better = local_best > best
+            labels[better] = candidates[rows[better], local[better]]
+            best[better] = local_best[better]
+
+        return labels, best
@@ -0,0 +1,157 @@
+# feature_store/k_sweep.py
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from feature_store.clusterer import SessionClusterer
+
+
+_CSR_PARTS = ("data", "indices", "indptr")
+
+
+def _write_shared_csr(X: sp.csr_matrix, work_dir: str) -> tuple:
+    """CSR 의 세 배열을 .npy 로 한 번만 기록 (worker 는 memory-map)"""
+    for name in _CSR_PARTS:
+        np.save(os.path.join(work_dir, f"{name}.npy"), getattr(X, name))
+    return X.shape
+
+
+def _load_shared_csr(work_dir: str, shape: tuple) -> sp.csr_matrix:
+    """
+    memory-map 한 배열로 CSR 재구성 (복사 없음)
+
+    mmap_mode="c" (copy-on-write): sklearn Cython 커널이 writeable buffer 를
+    요구하지만 X 를 수정하지는 않으므로 페이지는 모든 worker 가 공유한다.
+    """
+    arrays = [np.load(os.path.join(work_dir, f"{name}.npy"), mmap_mode = "c") for name in _CSR_PARTS]
+    return sp.csr_matrix(tuple(arrays), shape = shape, copy = False)
+
+
+def _fit_k(work_dir, shape, k, backend, batch_size, random_state, sample_size):
+    """
+    worker: 공유 TF-IDF 로 k 하나를 학습/평가하고 centroid 와 지표만 반환
+
+    copy_x=False: KMeans 가 memory-map 된 X 를 worker 마다 복사하지 않도록
+    (sparse 입력은 centering 을 하지 않으므로 X 는 수정되지 않음)
+    """
+    X = _load_shared_csr(work_dir, shape)
+
+    clusterer = SessionClusterer(
+        n_clusters = k,
+        random_state = random_state,
+        backend = backend,
+        batch_size = batch_size,
+        copy_x = False,
+    )
+    labels = clusterer.fit_predict(X)
+    metrics = clusterer.evaluate(X, labels, sample_size = sample_size)
+
+    return {"k": k, **metrics}, clusterer.cluster_centers_
+
+
+class KSweep:
+    """
+    n_clusters 후보를 병렬 process 로 학습해 지표를 비교하고 하나를 선택
+
+    - TF-IDF 행렬은 한 번만 /dev/shm 에 기록, worker 는 memory-map 으로 공유
+      (vectorizer refit 없음, worker 별 행렬 복사 / pickle 없음)
+    - 지표: inertia (elbow), 샘플 silhouette, Davies-Bouldin
+    - criterion:
+        "silhouette"     - silhouette 최대
+        "davies_bouldin" - Davies-Bouldin 최소
+        "elbow"          - 정규화한 (k, inertia) 곡선에서 양 끝 직선과 가장 먼 점
+    """
+
+    CRITERIA = ("silhouette", "davies_bouldin", "elbow")
+
+    def __init__(
+        self,
+        k_values,
+        n_workers: int = None,
+        criterion: str = "silhouette",
+        backend: str = "kmeans",
+        batch_size: int = 1024,
+        sample_size: int = 10_000,
+        random_state: int = 42,
+        tmp_dir: str = None,
+    ):
+        if criterion not in self.CRITERIA:
+            raise ValueError(f"criterion must be one of {self.CRITERIA}, got {criterion!r}")
+
+        self.k_values = sorted(set(int(k) for k in k_values))
+        self.n_workers = n_workers or os.cpu_count()
+        self.criterion = criterion
+        self.backend = backend
+        self.batch_size = batch_size
+        self.sample_size = sample_size
+        self.random_state = random_state
+
+        if tmp_dir is None and os.path.isdir("/dev/shm"):
+            tmp_dir = "/dev/shm"
+        self.tmp_dir = tmp_dir
+
+    def run(self, X):
+        """
+        Input:
+            X: TF-IDF matrix (sparse / dense)
+
+        Output:
+            (clusterer, labels, report)
+                clusterer: 선택된 k 의 centroid 로 만든 SessionClusterer
+                report: k 별 inertia / silhouette / davies_bouldin / fit_seconds
+        """
+        X = sp.csr_matrix(X)
+        # silhouette 는 2 <= k <= n_samples - 1 에서만 정의됨
+        k_values = [k for k in self.k_values if 2 <= k < X.shape[0]]
+        if not k_values:
+            raise ValueError(f"No valid k in {self.k_values} for {X.shape[0]} samples")
+
+        work_dir = tempfile.mkdtemp(prefix = "ksweep_", dir = self.tmp_dir)
+        try:
+            shape = _write_shared_csr(X, work_dir)
+            tasks = [
+                (work_dir, shape, k, self.backend, self.batch_size,
+                 self.random_state, self.sample_size)
+                for k in k_values
+            ]
+
+            if self.n_workers == 1:
+                results = [_fit_k(*task) for task in tasks]
+            else:
+                with ProcessPoolExecutor(max_workers = min(self.n_workers, len(tasks))) as pool:
+                    results = list(pool.map(_fit_k, *zip(*tasks)))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors = True)
+
+        report = pd.DataFrame([metrics for metrics, _ in results])
+        best = self._select(report)
+        report["selected"] = report.index == best
+
+        metrics, centers = results[best]
+        clusterer = SessionClusterer.from_centroids(centers, random_state = self.random_state)
+        clusterer.backend = self.backend
+        clusterer.fit_seconds_ = metrics["fit_seconds"]
+
+        return clusterer, clusterer.predict(X), report
+
+    def _select(self, report: pd.DataFrame) -> int:
+        if self.criterion == "silhouette":
+            return int(report["silhouette"].astype(float).fillna(-np.inf).to_numpy().argmax())
+        if self.criterion == "davies_bouldin":
+            return int(report["davies_bouldin"].astype(float).fillna(np.inf).to_numpy().argmin())
+
+        # elbow (kneedle): k / inertia 를 [0, 1] 로 정규화한 뒤
+        # 첫 점과 끝 점을 잇는 직선 아래로 가장 많이 내려간 지점
+        k = report["k"].to_numpy(dtype = float)
+        inertia = report["inertia"].to_numpy(dtype = float)
+        if len(k) < 3:
+            return 0
+        k_norm = (k - k[0]) / (k[-1] - k[0])
+        span = inertia[0] - inertia[-1]
+        i_norm = (inertia - inertia[-1]) / span if span > 0 else np.zeros_like(inertia)
+        return int(((1 - k_norm) - i_norm).argmax())
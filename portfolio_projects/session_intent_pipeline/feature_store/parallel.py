@@ -0,0 +1,135 @@
+# feature_store/parallel.py
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from feature_store.aggregator import SessionTextAggregator
+from feature_store.sessionizer import Sessionizer
+
+
+# 원래 행 순서를 보존하기 위한 내부 컬럼 (merge 시 tie-breaker)
+_ROW_COL = "__row"
+
+
+def _write_ipc(table: pa.Table, path: str) -> None:
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _read_ipc(path: str) -> pa.Table:
+    """memory_map 으로 연 Arrow IPC 파일은 복사 없이 읽힌다"""
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+def _run_partition(input_path, start, stop, out_dir, part, inactivity_minutes, text_col):
+    """
+    worker: 공유 Arrow 파일에서 [start, stop) 구간만 잘라 세션화 + 텍스트 집계
+
+    결과도 Arrow IPC 파일로 쓰고 경로만 반환한다 (DataFrame pickle 없음).
+    """
+    events = _read_ipc(input_path).slice(start, stop - start).to_pandas()
+
+    sessions = Sessionizer(inactivity_minutes).assign_sessions(events)
+    docs = SessionTextAggregator(text_col=text_col).aggregate(sessions)
+
+    sessions_path = os.path.join(out_dir, f"sessions_{part}.arrow")
+    docs_path = os.path.join(out_dir, f"docs_{part}.arrow")
+    _write_ipc(pa.Table.from_pandas(sessions, preserve_index=False), sessions_path)
+    _write_ipc(pa.Table.from_pandas(docs, preserve_index=False), docs_path)
+
+    return sessions_path, docs_path
+
+
+class PartitionedSessionExecutor:
+    """
+    user_id hash 로 이벤트를 파티션하고, 파티션별로
+    Sessionizer.assign_sessions + SessionTextAggregator.aggregate 를 process pool 에서 실행
+
+    - 세션화/집계는 사용자 간에 독립이므로 파티션 단위로 병렬 처리 가능
+    - 입력은 파티션 순서로 정렬한 Arrow IPC 파일 하나로 공유 (worker 는 memory-map)
+    - 결과는 (user_id, event_time) / (user_id, session_id) 기준으로 다시 정렬하므로
+      worker 수와 상관없이 단일 프로세스 결과와 같다
+    """
+
+    def __init__(
+        self,
+        n_workers: int = None,
+        inactivity_minutes: int = 30,
+        text_col: str = "event_text",
+        tmp_dir: str = None,
+    ):
+        self.n_workers = n_workers or os.cpu_count()
+        self.inactivity_minutes = inactivity_minutes
+        self.text_col = text_col
+
+        # /dev/shm 이 있으면 공유 메모리(tmpfs)에 버퍼를 둔다
+        if tmp_dir is None and os.path.isdir("/dev/shm"):
+            tmp_dir = "/dev/shm"
+        self.tmp_dir = tmp_dir
+
+    def partition(self, user_ids: pd.Series) -> np.ndarray:
+        """user_id → partition 번호 (실행 환경과 무관하게 결정적인 hash)"""
+        hashed = pd.util.hash_array(user_ids.to_numpy())
+        return (hashed % np.uint64(self.n_workers)).astype(np.int64)
+
+    def run(self, df: pd.DataFrame):
+        """
+        Input:
+            df: [user_id, event_time, event_text] 이벤트 로그
+
+        Output:
+            (sessions, session_docs)
+                assign_sessions / aggregate 를 전체 데이터에 실행한 것과 같은 결과
+        """
+        parts = self.partition(df["user_id"])
+        order = np.argsort(parts, kind="stable")
+        bounds = np.searchsorted(parts[order], np.arange(self.n_workers + 1))
+
+        events = df.iloc[order]
+        events = events.assign(**{_ROW_COL: np.arange(len(df))[order]})
+
+        work_dir = tempfile.mkdtemp(prefix="sessions_", dir=self.tmp_dir)
+        try:
+            input_path = os.path.join(work_dir, "events.arrow")
+            _write_ipc(pa.Table.from_pandas(events, preserve_index=False), input_path)
+            del events
+
+            tasks = [
+                (input_path, bounds[p], bounds[p + 1], work_dir, p,
+                 self.inactivity_minutes, self.text_col)
+                for p in range(self.n_workers)
+                if bounds[p + 1] > bounds[p]
+            ]
+
+            if self.n_workers == 1:
+                paths = [_run_partition(*task) for task in tasks]
+            else:
+                with ProcessPoolExecutor(max_workers=self.n_workers) as pool:
+                    paths = list(pool.map(_run_partition, *zip(*tasks)))
+
+            sessions = pd.concat(
+                [_read_ipc(s).to_pandas() for s, _ in paths], ignore_index=True
+            )
+            docs = pd.concat(
+                [_read_ipc(d).to_pandas() for _, d in paths], ignore_index=True
+            )
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        # ==============================
+        # 결정적 merge
+        # - 원래 index 를 복원하고 단일 프로세스와 같은 순서로 정렬
+        # ==============================
+        sessions = sessions.sort_values(["user_id", "event_time", _ROW_COL])
+        sessions.index = df.index[sessions[_ROW_COL].to_numpy()]
+        sessions = sessions.drop(columns=[_ROW_COL])
+
+        docs = docs.sort_values(["user_id", "session_id"]).reset_index(drop=True)
+
+        return sessions, docs
@@ -0,0 +1,53 @@
+# feature_store/session_state.py
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+class SessionStateStore:
+    """
+    사용자별 세션 상태(마지막 event_time, 마지막 session_id)를 Parquet 으로 저장/로드
+
+    증분 실행 시 이전 cutoff 에서 열려 있던 세션을 이어 붙이고,
+    session_id 를 실행 간에 안정적으로 유지하기 위해 사용한다.
+    """
+
+    SCHEMA = pa.schema([
+        ("user_id", pa.int64()),
+        ("last_time", pa.timestamp("us")),
+        ("session_id", pa.int64()),
+    ])
+
+    def __init__(self, path: str = "data/state/session_state.parquet"):
+        self.path = path
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def load(self) -> pd.DataFrame:
+        """
+        Output:
+            DataFrame (index=user_id, columns=[last_time, session_id])
+            저장된 상태가 없으면 None
+        """
+        if not self.exists():
+            return None
+
+        table = pq.read_table(self.path, schema = self.SCHEMA)
+        return table.to_pandas().set_index("user_id")
+
+    def save(self, state: pd.DataFrame) -> None:
+        """상태를 임시 파일에 쓴 뒤 교체 (중간에 실패해도 기존 상태 보존)"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok = True)
+
+        table = pa.Table.from_pandas(
+            state.reset_index(),
+            schema = self.SCHEMA,
+            preserve_index = False,
+        )
+
+        tmp_path = self.path + ".tmp"
+        pq.write_table(table, tmp_path, compression = "zstd")
+        os.replace(tmp_path, self.path)
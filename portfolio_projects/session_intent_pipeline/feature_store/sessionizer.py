@@ -1,11 +1,80 @@
 # feature_store/sessionizer.py
+import numpy as np
 import pandas as pd
 
+
+def session_boundaries(user_ids: np.ndarray, event_times: np.ndarray, gap):
+    """
+    정렬된 (user_id, event_time) 배열에서 세션 시작 위치를 한 번의 diff 로 계산
+
+    Parameters
+    ----------
+    user_ids : np.ndarray
+        user_id 기준으로 정렬된 배열
+    event_times : np.ndarray
+        사용자 내에서 시간순으로 정렬된 int64 / datetime64 배열
+    gap : int | np.timedelta64
+        event_times 와 같은 단위의 inactivity 기준
+
+    Returns
+    -------
+    new_session : np.ndarray[bool]
+        세션의 첫 이벤트이면 True
+    user_start : np.ndarray[int64]
+        각 사용자의 첫 이벤트 위치
+    """
+    n = len(user_ids)
+    new_session = np.ones(n, dtype=bool)
+    new_user = np.ones(n, dtype=bool)
+
+    if n > 1:
+        np.not_equal(user_ids[1:], user_ids[:-1], out=new_user[1:])
+        np.greater(event_times[1:] - event_times[:-1], gap, out=new_session[1:])
+        new_session[1:] |= new_user[1:]
+
+    return new_session, np.flatnonzero(new_user)
+
+
+def session_ids(
+    user_ids: np.ndarray,
+    event_times: np.ndarray,
+    gap,
+    dtype=np.int64,
+) -> np.ndarray:
+    """
+    정렬된 배열만으로 사용자별 session_id (1부터 시작) 계산
+
+    helper 컬럼(prev_time, time_gap, new_session) 없이
+    session_id 배열만 반환한다. dtype=np.int32 로 메모리를 절반으로 줄일 수 있다.
+    """
+    new_session, user_start = session_boundaries(user_ids, event_times, gap)
+    return _number_sessions(new_session, user_start).astype(dtype, copy=False)
+
+
+def _number_sessions(new_session, user_start, offset=None):
+    """전체 cumsum 에서 사용자 시작 시점의 값을 빼서 사용자별 번호로 변환"""
+    counter = np.cumsum(new_session, dtype=np.int64)
+    if len(counter) == 0:
+        return counter
+
+    user_len = np.diff(np.append(user_start, len(counter)))
+    base = counter[user_start] - new_session[user_start]
+    if offset is not None:
+        base = base - offset
+
+    return counter - np.repeat(base, user_len)
+
+
 class Sessionizer:
     def __init__(self, inactivity_minutes=30):
         self.gap = inactivity_minutes * 60
 
-    def assign_sessions(self, df: pd.DataFrame) -> pd.DataFrame:
+    def assign_sessions(
+        self,
+        df: pd.DataFrame,
+        debug_columns: bool = True,
+        compact: bool = False,
+    ) -> pd.DataFrame:
         """
         사용자 이벤트 로그를 세션 단위로 나누어 session_id 부여
 
@@ -13,6 +82,10 @@ class Sessionizer:
         ----------
         df : pd.DataFrame
             user_id, event_time, event_text 컬럼을 포함한 DataFrame
+        debug_columns : bool
+            True 이면 prev_time, time_gap, new_session 컬럼도 함께 추가
+        compact : bool
+            True 이면 session_id 를 int32 로 저장
 
         Returns
         -------
@@ -21,36 +94,210 @@ class Sessionizer:
         """
 
         # ====================
-        #   Fill your code
-        # 1) sort_values
-        # 2) groupby + shift
-        # 3) time_gap 계산
-        # 4) cumsum으로 session_id 생성
+        # 1) 정렬 (이미 정렬된 입력은 건너뜀)
+        # 2) diff 한 번으로 세션 경계 계산
+        # 3) cumsum으로 session_id 생성
         # ====================
 
         # user_id + event_time 기준 정렬
+        if not self._is_sorted(df):
+            df = df.sort_values(['user_id', 'event_time'])
+        else:
+            df = df.copy(deep=False)
+
+        df, _ = self._sessionize(df, debug_columns=debug_columns, compact=compact)
+        return df
+
+    def assign_sessions_stream(self, chunks, sorted_users: bool = True):
+        """
+        chunk 단위로 들어오는 이벤트 로그에 session_id 부여 (out-of-core)
+
+        chunk 사이에는 사용자별 "마지막 event_time / 현재 session_id" 상태만 넘긴다.
+
+        Parameters
+        ----------
+        chunks : Iterable[pd.DataFrame]
+            같은 사용자의 이벤트가 여러 chunk에 걸칠 수 있지만,
+            뒤 chunk의 이벤트가 앞 chunk보다 과거이면 안 된다.
+        sorted_users : bool
+            True 이면 chunk 들이 이어서 user_id 순으로 정렬된 입력 (예: 정렬된 CSV).
+            다음 chunk 로 이어질 수 있는 사용자는 chunk 경계의 마지막 사용자뿐이므로
+            그 한 명의 상태만 넘긴다 → 메모리는 chunk 크기에만 비례.
+            False 이면 user_id 로 파티션된 입력 (chunk 간 사용자 순서 무관).
+            사용자별 상태를 dict 에 제자리 갱신한다 → chunk 당 비용은 chunk 크기에 비례,
+            메모리는 chunk 크기 + 사용자 수.
+
+        Yields
+        ------
+        pd.DataFrame
+            assign_sessions 와 동일한 컬럼을 가진 세션화된 chunk.
+            모든 chunk를 concat 하면 in-memory 결과와 같다.
+        """
+        state = None if sorted_users else {}
+
+        for chunk in chunks:
+            chunk = chunk.sort_values(['user_id', 'event_time'])
+
+            if sorted_users and state is not None and len(chunk) and chunk['user_id'].iloc[0] < state.index[-1]:
+                raise ValueError(
+                    "Chunks must be sorted by user_id across chunk boundaries "
+                    "(use sorted_users=False for partitioned input)."
+                )
+
+            chunk, chunk_state = self._sessionize(chunk, state)
+
+            if not sorted_users:
+                state.update(zip(
+                    chunk_state.index,
+                    zip(chunk_state['last_time'].to_numpy(), chunk_state['session_id'].to_numpy()),
+                ))
+            elif len(chunk_state):
+                state = chunk_state.iloc[-1:]
+
+            yield chunk
+
+    def assign_sessions_incremental(self, df: pd.DataFrame, state: pd.DataFrame = None):
+        """
+        새로 들어온 이벤트(delta)만 세션화하고, 갱신된 사용자별 상태를 반환
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            이전 실행 이후에 추가된 이벤트
+        state : pd.DataFrame
+            SessionStateStore.load() 결과 (첫 실행이면 None)
+
+        Returns
+        -------
+        (pd.DataFrame, pd.DataFrame)
+            세션화된 delta, 다음 실행에 넘길 상태
+
+        이전 cutoff 에서 gap 이내로 이어지는 이벤트는 기존 session_id 를 그대로 사용하므로,
+        전체를 다시 세션화한 결과와 session_id 가 같다.
+        """
         df = df.sort_values(['user_id', 'event_time'])
+        df, new_state = self._sessionize(df, state)
 
-        # 같은 사용자 내에서 이전 이벤트 시간 가져오기
-        df['prev_time'] = df.groupby('user_id')['event_time'].shift(1)
+        # 한 번의 실행마다 한 번만 병합 (delta 에 없던 사용자의 상태는 그대로 유지)
+        if state is not None:
+            new_state = pd.concat(
+                [state.drop(new_state.index, errors = "ignore"), new_state]
+            )
+        return df, new_state
 
-        # 이전 이벤트와의 시간 차이 계산(초)
-        df['time_gap'] = (
-            df['event_time'] - df['prev_time']
-        ).dt.total_seconds()
+    def stream_csv(self, path: str, chunksize: int = 1_000_000, **read_csv_kwargs):
+        """
+        CSV 파일을 chunksize 행씩 읽어 세션화된 chunk를 순서대로 반환
 
-        # 새 세션 조건
-        # - 이전 이벤트가 없거나
-        # - inactivity gap 초과 시
-        df["new_session"] = (
-            (df["prev_time"].isna()) |
-            (df["time_gap"] > self.gap)
+        파일은 user_id(+ event_time) 기준으로 정렬되어 있어야 한다.
+        """
+        reader = pd.read_csv(
+            path,
+            chunksize = chunksize,
+            parse_dates = ["event_time"],
+            **read_csv_kwargs,
         )
 
-        # new_session이 True일 때마다 session_id 증가
-        df['session_id'] = (
-            df.groupby("user_id")["new_session"]\
-            .cumsum()
+        # 빈 줄(전체 NaN 행) 제거
+        chunks = (chunk.dropna(how = "all") for chunk in reader)
+
+        yield from self.assign_sessions_stream(chunks)
+
+    @staticmethod
+    def _is_sorted(df: pd.DataFrame) -> bool:
+        """(user_id, event_time) 사전순 정렬 여부를 O(n) 으로 확인"""
+        user_ids = df['user_id'].to_numpy()
+        event_times = df['event_time'].to_numpy()
+
+        same_user = user_ids[1:] == user_ids[:-1]
+        return bool(
+            np.all(user_ids[1:] >= user_ids[:-1])
+            and np.all(event_times[1:][same_user] >= event_times[:-1][same_user])
+        )
+
+    def _sessionize(
+        self,
+        df: pd.DataFrame,
+        state: pd.DataFrame = None,
+        debug_columns: bool = True,
+        compact: bool = False,
+    ):
+        """
+        정렬된 df에 세션 컬럼을 추가하고, df 에 있는 사용자별 마지막 상태를 반환
+
+        state : 이전까지의 사용자별 상태
+            DataFrame (index=user_id, columns=[last_time, session_id]) 또는
+            {user_id: (last_time, session_id)} dict
+            (이전 상태와의 병합은 호출하는 쪽에서)
+        """
+        user_ids = df['user_id'].to_numpy()
+        event_times = df['event_time'].to_numpy()
+        gap = np.timedelta64(self.gap, 's')
+
+        new_session, user_start = session_boundaries(user_ids, event_times, gap)
+
+        # 이전 chunk에서 이어지는 사용자는 마지막 이벤트 시간을 prev_time으로 사용
+        carried_time = None
+        offset = None
+        if state is not None:
+            carried_time, offset = self._carried_state(state, user_ids[user_start], event_times.dtype)
+            first_time = event_times[user_start]
+
+            if np.any(first_time < carried_time):
+                raise ValueError(
+                    "Chunks must be sorted by user_id and event_time "
+                    "across chunk boundaries."
+                )
+
+            # 이전 세션이 gap 안에서 이어지면 새 세션이 아님
+            continues = ~np.isnat(carried_time) & ~(first_time - carried_time > gap)
+            new_session[user_start[continues]] = False
+
+        session_id = _number_sessions(new_session, user_start, offset)
+
+        # prev_time / time_gap / new_session 은 디버그용 출력
+        if debug_columns:
+            prev_time = np.empty_like(event_times)
+            prev_time[1:] = event_times[:-1]
+            prev_time[user_start] = (
+                np.datetime64('NaT') if carried_time is None else carried_time
+            )
+
+            df['prev_time'] = prev_time
+            df['time_gap'] = (df['event_time'] - df['prev_time']).dt.total_seconds()
+            df['new_session'] = new_session
+
+        df['session_id'] = session_id.astype(np.int32 if compact else np.int64)
+
+        # 사용자별 마지막 이벤트 → 다음 chunk로 넘길 상태
+        user_end = np.append(user_start[1:], len(df)) - 1
+        new_state = pd.DataFrame(
+            {
+                'last_time': event_times[user_end],
+                'session_id': session_id[user_end],
+            },
+            index = pd.Index(user_ids[user_end], name = 'user_id'),
+        )
+
+        return df, new_state
+
+    @staticmethod
+    def _carried_state(state, users: np.ndarray, time_dtype):
+        """
+        users 의 이전 상태 (마지막 event_time, session_id offset)
+
+        처음 보는 사용자는 NaT / 0
+        """
+        if isinstance(state, dict):
+            missing = (np.datetime64('NaT'), 0)
+            rows = [state.get(user, missing) for user in users]
+            carried_time = np.array([row[0] for row in rows], dtype = time_dtype)
+            offset = np.fromiter((row[1] for row in rows), dtype = np.int64, count = len(rows))
+            return carried_time, offset
+
+        carried = state.reindex(users)
+        # 이전 chunk의 session_id에 이어서 번호 부여
+        return (
+            carried['last_time'].to_numpy(),
+            carried['session_id'].fillna(0).to_numpy(dtype = np.int64),
         )
-        
-        return df
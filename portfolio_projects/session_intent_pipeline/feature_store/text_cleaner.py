@@ -1,12 +1,97 @@
 # feature_store/text_cleaner.py
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
 class TextCleaner:
+    """
+    간단한 전처리 (소문자 변환 + 특수문자 제거)
+
+    - 정규식은 생성 시 한 번만 compile
+    - clean_batch: 컬럼(Series) / Arrow 배열 단위 일괄 처리
+    - 반복되는 이벤트 문자열("view kona hybrid" 등)은 unique 값만 정제하고 cache
+    """
+
+    def __init__(self, pattern: str = r"[^a-z0-9\s]", cache_size: int = 100_000):
+        """
+        Args:
+            pattern: 제거할 문자 정규식 (소문자 변환 이후에 적용)
+            cache_size: 정제 결과 LRU cache 크기 (0 이면 cache 사용 안 함)
+        """
+        self.pattern = pattern
+        self._regex = re.compile(pattern)
+
+        if cache_size:
+            self._clean_one = lru_cache(maxsize=cache_size)(self._clean_uncached)
+        else:
+            self._clean_one = self._clean_uncached
+
+    def _clean_uncached(self, text: str) -> str:
+        return self._regex.sub("", text.lower())
+
     def clean(self, text: str) -> str:
         """
-        간단한 전처리 (lower, strip)
+        간단한 전처리 (lower, 특수문자 제거)
+        """
+        return self._clean_one(text)
+
+    def clean_batch(self, texts):
+        """
+        여러 텍스트를 한 번에 정제
+
+        Input:
+            texts: pd.Series / pa.Array / pa.ChunkedArray / list
+
+        Output:
+            입력과 같은 타입 (Series 는 index / name 유지, 결측값은 그대로)
         """
-        # ====================
-        #   Fill your code
-        # 1) 소문자 변환
-        # 2) 특수문자 제거
-        # ====================
-        
\ No newline at end of file
+        if isinstance(texts, (pa.Array, pa.ChunkedArray)):
+            return self._clean_arrow(texts)
+
+        if isinstance(texts, pd.Series):
+            return self._clean_series(texts)
+
+        return self._clean_series(pd.Series(texts, dtype=object)).tolist()
+
+    def _clean_series(self, texts: pd.Series) -> pd.Series:
+        # 범주형은 category 단위로만 정제하고 결과도 범주형으로 유지
+        if isinstance(texts.dtype, pd.CategoricalDtype):
+            cleaned = [self._clean_one(text) for text in texts.cat.categories]
+            remap, categories = pd.factorize(pd.Series(cleaned, dtype=object))
+
+            codes = texts.cat.codes.to_numpy()
+            codes = np.where(codes < 0, -1, remap.take(codes, mode="clip"))
+            return pd.Series(
+                pd.Categorical.from_codes(codes, categories),
+                index=texts.index,
+                name=texts.name,
+            )
+
+        # 일반 문자열 컬럼은 unique 값만 정제한 뒤 codes 로 펼침
+        codes, uniques = pd.factorize(texts)
+        cleaned = np.array([self._clean_one(text) for text in uniques], dtype=object)
+
+        values = cleaned.take(codes, mode="clip")
+        values[codes < 0] = np.nan
+        return pd.Series(values, index=texts.index, name=texts.name, dtype=texts.dtype)
+
+    def _clean_arrow(self, texts):
+        # Arrow dictionary 배열은 dictionary(unique 값)만 정제
+        if isinstance(texts, pa.ChunkedArray):
+            return pa.chunked_array(
+                [self._clean_arrow(chunk) for chunk in texts.chunks],
+                type=None if texts.num_chunks else texts.type,
+            )
+
+        if pa.types.is_dictionary(texts.type):
+            return pa.DictionaryArray.from_arrays(
+                texts.indices, self._clean_arrow(texts.dictionary)
+            )
+
+        lowered = pc.utf8_lower(texts)
+        return pc.replace_substring_regex(lowered, pattern=self.pattern, replacement="")
@@ -0,0 +1,124 @@
+# feature_store/token_docs.py
+import re
+
+import numpy as np
+import pandas as pd
+
+# TfidfVectorizer 기본 token_pattern 과 동일
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+
+def _ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """[starts[i], starts[i] + lengths[i]) 구간들을 이어 붙인 index 배열"""
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(total) - np.repeat(offsets - starts, lengths)
+
+
+class TokenVocabulary:
+    """
+    token 문자열 ↔ int32 token id 공용 vocabulary
+
+    같은 이벤트 텍스트는 unique 값 단위로 한 번만 tokenize 한다.
+    """
+
+    def __init__(self):
+        self.token_to_id = {}
+        self.tokens = []
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def encode(self, text: str) -> list:
+        ids = []
+        for token in TOKEN_PATTERN.findall(text):
+            token_id = self.token_to_id.get(token)
+            if token_id is None:
+                token_id = len(self.tokens)
+                self.token_to_id[token] = token_id
+                self.tokens.append(token)
+            ids.append(token_id)
+        return ids
+
+    def encode_rows(self, texts: pd.Series, preprocess=None):
+        """
+        Input:
+            texts: 이벤트 단위 텍스트
+            preprocess: tokenize 전에 unique 텍스트마다 적용할 정제 함수
+
+        Output:
+            (row_offsets, token_ids)
+                row i 의 token id = token_ids[row_offsets[i]:row_offsets[i + 1]]
+        """
+        # 범주형(dictionary-encoded) 컬럼은 codes / categories 를 그대로 사용
+        if isinstance(texts.dtype, pd.CategoricalDtype):
+            codes = texts.cat.codes.to_numpy()
+            uniques = texts.cat.categories
+            if (codes < 0).any():
+                codes = np.where(codes < 0, len(uniques), codes)
+                uniques = uniques.append(pd.Index([""]))
+        else:
+            codes, uniques = pd.factorize(texts, use_na_sentinel=False)
+
+        # unique 텍스트별 token id 배열
+        encoded = []
+        for text in uniques:
+            text = "" if pd.isna(text) else str(text)
+            encoded.append(self.encode(preprocess(text) if preprocess else text))
+
+        unique_len = np.array([len(ids) for ids in encoded], dtype=np.int64)
+        unique_start = np.cumsum(unique_len) - unique_len
+        unique_ids = np.fromiter(
+            (i for ids in encoded for i in ids), dtype=np.int32, count=int(unique_len.sum())
+        )
+
+        # row → unique 텍스트의 token 구간을 그대로 복사
+        row_len = unique_len[codes]
+        token_ids = unique_ids[_ranges(unique_start[codes], row_len)]
+        row_offsets = np.concatenate([[0], np.cumsum(row_len)])
+
+        return row_offsets, token_ids
+
+
+class TokenDocs:
+    """
+    세션 문서를 token id 배열로 표현 (CSR 과 같은 indptr / ids 구조)
+
+    문서 i 의 token id = ids[indptr[i]:indptr[i + 1]]
+    """
+
+    def __init__(self, indptr: np.ndarray, ids: np.ndarray, vocab: TokenVocabulary):
+        self.indptr = indptr
+        self.ids = ids
+        self.vocab = vocab
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def __getitem__(self, i) -> np.ndarray:
+        return self.ids[self.indptr[i]:self.indptr[i + 1]]
+
+    def to_texts(self) -> list:
+        """디버깅용: token id 문서를 다시 문자열로"""
+        tokens = np.array(self.vocab.tokens, dtype=object)
+        return [" ".join(tokens[self[i]]) for i in range(len(self))]
+
+    def ngrams(self, n: int):
+        """
+        문서 경계를 넘지 않는 연속 n-gram
+
+        Output:
+            (doc_index, grams)
+                grams: (m, n) token id 행렬
+        """
+        lengths = np.diff(self.indptr)
+        n_windows = np.maximum(lengths - n + 1, 0)
+
+        starts = _ranges(self.indptr[:-1], n_windows)
+        doc_index = np.repeat(np.arange(len(self)), n_windows)
+        grams = np.stack([self.ids[starts + j] for j in range(n)], axis=1)
+
+        return doc_index, grams
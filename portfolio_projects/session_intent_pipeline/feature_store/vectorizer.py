@@ -1,25 +1,51 @@
 # featrue_stroe/vectorizer.py
 
-from sklearn.feature_extraction.text import TfidfVectorizer
+from numbers import Integral
+
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfTransformer, TfidfVectorizer
+
+from feature_store.hashing_tfidf import HashingTfidf
+from feature_store.token_docs import TokenDocs
 
 class SessionVectorizer:
     """
     Converts session-level texts into numerical vectors.
     """
 
+    # ==============================
+    # mode
+    #   - "tfidf"  : vocabulary 를 학습하는 TfidfVectorizer (기본)
+    #   - "hashing": vocabulary 없이 n_features 크기로 hashing,
+    #                IDF 는 partial_fit 으로 chunk 단위 누적 (min_df / max_features 미사용)
+    # ==============================
     def __init__(
         self,
         max_features = 1000,
         ngram_range = (1, 2),
         min_df = 1,
+        mode = "tfidf",
+        n_features = 2 ** 18,
     ):
-        self.vectorizer = TfidfVectorizer(
-            max_features = max_features,
-            ngram_range = ngram_range,
-            min_df = min_df,
-        )
-    
+        if mode not in ("tfidf", "hashing"):
+            raise ValueError(f"mode must be 'tfidf' or 'hashing', got {mode!r}")
+
+        self.mode = mode
+
+        if mode == "hashing":
+            self.vectorizer = HashingTfidf(
+                n_features = n_features,
+                ngram_range = ngram_range,
+            )
+        else:
+            self.vectorizer = TfidfVectorizer(
+                max_features = max_features,
+                ngram_range = ngram_range,
+                min_df = min_df,
+            )
+
     # =========================
     # 핵심 메서드: fit_transform
     # =========================
@@ -46,3 +72,133 @@ class SessionVectorizer:
 
         return X, self.vectorizer
 
+    # =========================
+    # hashing 모드: chunk 단위 IDF 누적 / 변환
+    # =========================
+    def partial_fit(self, df: pd.DataFrame):
+        """session 문서 chunk 하나로 IDF 통계를 누적 (hashing 모드 전용)"""
+        if self.mode != "hashing":
+            raise ValueError("partial_fit is only available in hashing mode.")
+
+        self.vectorizer.partial_fit(df["cleaned_text"].tolist())
+        return self
+
+    def transform(self, df: pd.DataFrame):
+        """fit 된 vectorizer 로 새 session 문서 변환"""
+        return self.vectorizer.transform(df["cleaned_text"].tolist())
+
+    # =========================
+    # token id 문서 입력: fit_transform_tokens
+    # =========================
+    def fit_transform_tokens(self, token_docs: TokenDocs):
+        """
+        Input:
+            token_docs: SessionTextAggregator.aggregate_tokens 결과
+
+        Output:
+            X: TF-IDF matrix (fit_transform 과 같은 vocabulary / column 순서)
+            vectorizer: fitted vectorizer (raw text transform 에도 사용 가능)
+
+        문자열을 다시 tokenize 하지 않고, token id 배열에서 바로
+        n-gram count CSR 행렬을 만든 뒤 TfidfTransformer 를 적용한다.
+        """
+        if self.mode != "tfidf":
+            raise ValueError("fit_transform_tokens requires mode='tfidf'.")
+
+        params = self.vectorizer.get_params()
+        min_n, max_n = params["ngram_range"]
+        n_docs = len(token_docs)
+        tokens = np.array(token_docs.vocab.tokens, dtype = object)
+
+        # ========================
+        # n-gram → term id, (doc, term) count 행렬
+        # ========================
+        terms, rows, cols = [], [], []
+        for n in range(min_n, max_n + 1):
+            doc_index, grams = token_docs.ngrams(n)
+            uniq, inverse = self._unique_ngrams(grams, len(tokens))
+
+            rows.append(doc_index)
+            cols.append(inverse + len(terms))
+            terms.extend(" ".join(tokens[g]) for g in uniq)
+
+        counts = sp.csr_matrix(
+            (
+                np.ones(sum(len(r) for r in rows), dtype = np.int64),
+                (np.concatenate(rows), np.concatenate(cols)),
+            ),
+            shape = (n_docs, len(terms)),
+        )
+        counts.sum_duplicates()
+
+        # ========================
+        # CountVectorizer 와 같은 순서로 정렬 → min_df / max_df / max_features
+        # ========================
+        order = np.argsort(np.array(terms, dtype = object), kind = "stable")
+        terms = [terms[i] for i in order]
+        counts = counts[:, order]
+
+        max_df, min_df = params["max_df"], params["min_df"]
+        high = max_df if isinstance(max_df, Integral) else max_df * n_docs
+        low = min_df if isinstance(min_df, Integral) else min_df * n_docs
+
+        dfs = np.bincount(counts.indices, minlength = len(terms))
+        mask = (dfs <= high) & (dfs >= low)
+
+        limit = params["max_features"]
+        if limit is not None and mask.sum() > limit:
+            tfs = np.asarray(counts.sum(axis = 0)).ravel()
+            mask_inds = (-tfs[mask]).argsort()[:limit]
+            new_mask = np.zeros(len(dfs), dtype = bool)
+            new_mask[np.where(mask)[0][mask_inds]] = True
+            mask = new_mask
+
+        kept = np.where(mask)[0]
+        counts = counts[:, kept]
+        vocabulary = {terms[i]: j for j, i in enumerate(kept)}
+
+        # ========================
+        # TF-IDF 가중치 (TfidfVectorizer 와 같은 transformer 설정)
+        # ========================
+        transformer = TfidfTransformer(
+            norm = params["norm"],
+            use_idf = params["use_idf"],
+            smooth_idf = params["smooth_idf"],
+            sublinear_tf = params["sublinear_tf"],
+        )
+        X = transformer.fit_transform(counts).astype(params["dtype"], copy = False)
+
+        # fitted TfidfVectorizer 상태 구성
+        self.vectorizer.vocabulary_ = vocabulary
+        self.vectorizer.fixed_vocabulary_ = False
+        if params["use_idf"]:
+            self.vectorizer.idf_ = transformer.idf_
+
+        return X, self.vectorizer
+
+    @staticmethod
+    def _unique_ngrams(grams: np.ndarray, vocab_size: int):
+        """
+        (m, n) n-gram 행렬의 unique 행과 inverse index
+
+        n-gram 을 vocab_size 진법의 int64 key 하나로 바꿔 1차원 unique 로 처리한다.
+        (key 가 int64 범위를 넘으면 행 단위 unique 로 fallback)
+        """
+        n = grams.shape[1]
+        base = max(vocab_size, 1)
+
+        if base ** n >= np.iinfo(np.int64).max:
+            uniq, inverse = np.unique(grams, axis = 0, return_inverse = True)
+            return uniq, inverse.ravel()
+
+        keys = np.zeros(len(grams), dtype = np.int64)
+        for j in range(n):
+            keys = keys * base + grams[:, j]
+
+        uniq_keys, inverse = np.unique(keys, return_inverse = True)
+
+        uniq = np.empty((len(uniq_keys), n), dtype = np.int64)
+        for j in range(n - 1, -1, -1):
+            uniq_keys, uniq[:, j] = np.divmod(uniq_keys, base)
+
+        return uniq, inverse
@@ -1,29 +1,132 @@
 # pipelines/run_pipeline.py
 
+import argparse
+import os
+
 import pandas as pd
+import pyarrow as pa
 
+from feature_store.artifact_store import ArtifactStore
+from feature_store.event_store import EventStore
+from feature_store.parquet_store import ParquetStore, user_bucket
 from feature_store.sessionizer import Sessionizer
+from feature_store.session_state import SessionStateStore
 from feature_store.aggregator import SessionTextAggregator
 from feature_store.vectorizer import SessionVectorizer
 from feature_store.clusterer import SessionClusterer
 
 
-def main():
+SESSION_DOCS_PATH = "data/processed/session_docs"
+SESSION_DOCS_CSV_PATH = "data/processed/session_docs.csv"
+SESSION_STATE_PATH = "data/state/session_state.parquet"
+ARTIFACT_ROOT = "models/artifacts"
+
+# session_docs Parquet schema (user_id hash bucket 으로 파티션)
+SESSION_DOCS_SCHEMA = pa.schema([
+    ("user_id", pa.int64()),
+    ("session_id", pa.int64()),
+    ("raw_text", pa.string()),
+    ("global_session_id", pa.string()),
+    ("cleaned_text", pa.string()),
+    ("cluster_id", pa.int64()),
+])
+SESSION_DOCS_BUCKETS = 16
+
+
+def session_docs_store(export_csv: bool = False) -> ParquetStore:
+    return ParquetStore(
+        SESSION_DOCS_PATH,
+        schema = SESSION_DOCS_SCHEMA,
+        partitioning = {
+            "user_bucket": lambda df: user_bucket(df["user_id"], SESSION_DOCS_BUCKETS),
+        },
+        export_csv = SESSION_DOCS_CSV_PATH if export_csv else None,
+    )
+
+
+def load_events(input_path: str, event_store: str = None) -> pd.DataFrame:
+    """
+    원천 이벤트 로드
+
+    - input_path 가 EventStore 디렉토리이면 memory-map 으로 바로 연다
+    - event_store 를 주면 CSV 를 처음 한 번만 (또는 CSV 가 바뀌었을 때) ingest 하고
+      이후 실행은 store 를 연다
+    - 둘 다 아니면 CSV 를 직접 파싱
+    """
+    if os.path.isdir(input_path):
+        return EventStore(input_path).open()
+
+    if event_store is not None:
+        store = EventStore(event_store)
+        if not store.is_fresh(input_path):
+            print(f"Ingesting {input_path} -> {event_store}")
+            store.ingest(input_path, time_cols = ["event_time"], text_cols = ["event_text"])
+        return store.open()
+
+    df = pd.read_csv(input_path, dtype = {"event_text": "category"})
+    df["event_time"] = pd.to_datetime(df["event_time"])
+    return df
+
+
+def merge_session_docs(previous: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """
+    증분 실행 결과(delta)를 기존 session_docs 에 반영
+
+    이전 cutoff 에서 이어진 세션은 기존 텍스트 뒤에 새 텍스트를 붙이고,
+    새 세션은 그대로 추가한다.
+    """
+    columns = list(previous.columns)
+    previous = previous.set_index("global_session_id")
+    delta = delta.set_index("global_session_id")
+
+    continued = delta.index.intersection(previous.index)
+    for col in ["raw_text", "cleaned_text"]:
+        previous.loc[continued, col] = (
+            previous.loc[continued, col] + " " + delta.loc[continued, col]
+        )
+
+    new_sessions = delta.drop(continued)[previous.columns.intersection(delta.columns)]
+    merged = pd.concat([previous, new_sessions])
+    return merged.reset_index()[columns]
+
+
+def main(
+    input_path: str = "data/raw/raw_events.csv",
+    incremental: bool = False,
+    mode: str = "fit",
+    model_version: str = "latest",
+    cluster_backend: str = "kmeans",
+    warm_start: bool = False,
+    n_clusters: int = 3,
+    k_range: tuple = None,
+    export_csv: bool = False,
+    event_store: str = None,
+):
     print("INFO: Session Intent Pipeline started")
 
     # ====================
     # Load raw data
+    # - incremental 모드에서는 이전 실행 이후 추가된 이벤트 파일만 입력
+    # - event_text 는 소수의 템플릿 문자열이 반복되므로 category(dictionary) 로 유지
+    #   → 정제 / tokenize 는 고유 문자열 단위로만 수행됨
+    # - --event-store: CSV 는 한 번만 파싱, 이후 실행은 memory-map open
     # ====================
-    df = pd.read_csv("data/raw/raw_events.csv")
-    df["event_time"] = pd.to_datetime(df["event_time"])
+    df = load_events(input_path, event_store)
 
-    print(f"Loaded raw events: {len(df)} rows")
+    print(f"Loaded raw events: {len(df)} rows "
+          f"({df['event_text'].cat.categories.size} unique event texts)")
 
     # ======================
     # Sessionization (Day 1)
+    # - 사용자별 마지막 event_time / session_id 상태를 Parquet 으로 유지
+    # - 갱신된 상태는 session_docs 저장까지 끝난 뒤에 저장
+    #   (중간 단계가 실패하면 다음 실행은 이전 상태에서 같은 입력을 다시 처리)
     # ======================
+    state_store = SessionStateStore(SESSION_STATE_PATH)
+    state = state_store.load() if incremental else None
+
     sessionizer = Sessionizer(inactivity_minutes=30)
-    df_sessions = sessionizer.assign_sessions(df)
+    df_sessions, state = sessionizer.assign_sessions_incremental(df, state)
 
     print("Sessionization completed")
     print(df_sessions[["user_id", "event_time", "session_id"]].head())
@@ -36,36 +139,147 @@ def main():
     # ======================================
     aggregator = SessionTextAggregator(text_col="event_text")
     session_docs = aggregator.aggregate(df_sessions)
+    touched = session_docs["global_session_id"]
+
+    docs_store = session_docs_store(export_csv)
+    if incremental and docs_store.exists():
+        previous = docs_store.read().sort_values(["user_id", "session_id"], ignore_index = True)
+        session_docs = merge_session_docs(previous, session_docs)
 
     print("Session-level aggregation completed")
     print(session_docs.head())
     print("Number of session documents: ", len(session_docs))
 
-    # =====================
-    # Vectorization (Day 3)
-    # =====================
-    vectorizer = SessionVectorizer(
-        max_features = 500,
-        ngram_range = (1, 2),
-    )
+    artifact_store = ArtifactStore(ARTIFACT_ROOT)
+
+    if mode == "transform":
+        # =====================
+        # Transform-only: 저장된 vectorizer / clusterer 로 이번 입력에서
+        # 새로 생기거나 이어진 세션만 라벨링 (나머지는 기존 cluster_id 유지)
+        # =====================
+        vectorizer, clusterer = artifact_store.load(model_version)
+
+        scored = session_docs["global_session_id"].isin(touched)
+        X = vectorizer.transform(session_docs[scored])
+
+        labels = session_docs.get("cluster_id", pd.Series(-1, index = session_docs.index))
+        labels = labels.fillna(-1).astype("int64")
+        labels.loc[scored] = clusterer.predict(X)
 
-    X, tfidf_model = vectorizer.fit_transform(session_docs)
+        print("Scored with frozen model: ",
+              artifact_store.load_manifest(model_version)["version"],
+              f"({int(scored.sum())} sessions)")
+    else:
+        # =====================
+        # Vectorization (Day 3)
+        # =====================
+        vectorizer = SessionVectorizer(
+            max_features = 500,
+            ngram_range = (1, 2),
+        )
 
-    print("Vectorization completed")
-    print("TF-IDF shape: ", X.shape)
+        X, tfidf_model = vectorizer.fit_transform(session_docs)
 
-    # =====================
-    # Clustering (Day 3_1)
-    # =====================
-    clusterer = SessionClusterer(n_clusters = 3)
-    labels = clusterer.fit_predict(X)
+        print("Vectorization completed")
+        print("TF-IDF shape: ", X.shape)
+
+        # =====================
+        # Clustering (Day 3_1)
+        # =====================
+        if k_range is not None:
+            # n_clusters 후보를 병렬 process 로 학습해 silhouette 기준으로 선택
+            clusterer, labels, k_report = SessionClusterer.select_k(
+                X,
+                range(k_range[0], k_range[1] + 1),
+                backend = cluster_backend,
+            )
+            print("k sweep:")
+            print(k_report)
+        else:
+            init_centroids = None
+            if warm_start and artifact_store.versions():
+                # 이전 버전 centroid 에서 출발 (vocabulary 변화는 term 기준으로 정렬)
+                init_centroids = artifact_store.load_centroids(
+                    tfidf_model.get_feature_names_out(), model_version
+                )
+
+            clusterer = SessionClusterer(
+                n_clusters = n_clusters,
+                backend = cluster_backend,
+                init_centroids = init_centroids,
+            )
+            labels = clusterer.fit_predict(X)
+
+        print("Cluster quality: ", clusterer.evaluate(X, labels))
+
+        version = artifact_store.save(vectorizer, clusterer)
+        print("Saved model artifacts: ", version)
 
     session_docs["cluster_id"] = labels
 
-    session_docs.to_csv("data/processed/session_docs.csv", index = False)
+    docs_store.write(session_docs)
+    state_store.save(state)
 
     print("Clustering completed")
     print(session_docs[["global_session_id", "cluster_id"]])
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description = "Session Intent Pipeline")
+    parser.add_argument("--input", default = "data/raw/raw_events.csv")
+    parser.add_argument(
+        "--incremental",
+        action = "store_true",
+        help = "process only new events using the persisted session state",
+    )
+    parser.add_argument(
+        "--mode",
+        choices = ["fit", "transform"],
+        default = "fit",
+        help = "fit: refit and save artifacts / transform: label with saved artifacts",
+    )
+    parser.add_argument("--model-version", default = "latest")
+    parser.add_argument(
+        "--cluster-backend",
+        choices = list(SessionClusterer.BACKENDS),
+        default = "kmeans",
+    )
+    parser.add_argument(
+        "--warm-start",
+        action = "store_true",
+        help = "initialise centroids from --model-version (fit mode only)",
+    )
+    parser.add_argument("--n-clusters", type = int, default = 3)
+    parser.add_argument(
+        "--k-sweep",
+        metavar = "MIN:MAX",
+        help = "select n_clusters from MIN..MAX by parallel sweep (overrides --n-clusters)",
+    )
+    parser.add_argument(
+        "--export-csv",
+        action = "store_true",
+        help = f"also write {SESSION_DOCS_CSV_PATH}",
+    )
+    parser.add_argument(
+        "--event-store",
+        help = "ingest --input once into this memory-mapped store and reuse it on later runs",
+    )
+    args = parser.parse_args()
+
+    k_range = None
+    if args.k_sweep:
+        k_range = tuple(int(k) for k in args.k_sweep.split(":"))
+        if args.warm_start:
+            parser.error("--warm-start cannot be combined with --k-sweep")
+
+    main(
+        input_path = args.input,
+        incremental = args.incremental,
+        mode = args.mode,
+        model_version = args.model_version,
+        cluster_backend = args.cluster_backend,
+        warm_start = args.warm_start,
+        n_clusters = args.n_clusters,
+        k_range = k_range,
+        export_csv = args.export_csv,
+        event_store = args.event_store,
+    )
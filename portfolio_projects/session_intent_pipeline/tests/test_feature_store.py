@@ -1,5 +1,244 @@
-# Template not found for tests/test_feature_store.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from feature_store.aggregator import SessionTextAggregator
+from feature_store.event_store import EventStore
+from feature_store.parallel import PartitionedSessionExecutor
+from feature_store.parquet_store import ParquetStore, user_bucket
+from feature_store.session_state import SessionStateStore
+from feature_store.sessionizer import Sessionizer, session_ids
+from feature_store.text_cleaner import TextCleaner
+
+
+def _sample_events():
+    df = pd.read_csv("data/raw/raw_events.csv", skip_blank_lines=True)
+    df["event_time"] = pd.to_datetime(df["event_time"])
+    return df
+
+
+def test_assign_sessions():
+    s = Sessionizer(inactivity_minutes=30)
+    out = s.assign_sessions(_sample_events())
+
+    # user 1: 09:03 → 10:10 gap 으로 세션 2개
+    assert out[out["user_id"] == 1]["session_id"].tolist() == [1, 1, 1, 2, 2, 2]
+    assert out.groupby(["user_id", "session_id"]).ngroups == 5
+
+
+def test_kernel_matches_groupby_reference():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "user_id": rng.integers(0, 50, 2_000),
+        "event_time": pd.Timestamp("2025-01-01")
+        + pd.to_timedelta(rng.integers(0, 86_400, 2_000), unit="s"),
+    })
+
+    # 기존 groupby + shift + cumsum 구현
+    ref = df.sort_values(["user_id", "event_time"])
+    ref["prev_time"] = ref.groupby("user_id")["event_time"].shift(1)
+    ref["time_gap"] = (ref["event_time"] - ref["prev_time"]).dt.total_seconds()
+    ref["new_session"] = (ref["time_gap"] > 1800) | (ref["prev_time"].isna())
+    ref["session_id"] = ref.groupby("user_id")["new_session"].cumsum()
+
+    out = Sessionizer(inactivity_minutes=30).assign_sessions(df)
+    pd.testing.assert_frame_equal(out, ref)
+
+    ids = session_ids(
+        ref["user_id"].to_numpy(), ref["event_time"].to_numpy(),
+        np.timedelta64(1800, "s"), dtype=np.int32,
+    )
+    assert ids.dtype == np.int32
+    np.testing.assert_array_equal(ids, ref["session_id"].to_numpy())
+
+
+def test_assign_sessions_without_debug_columns():
+    out = Sessionizer().assign_sessions(
+        _sample_events(), debug_columns=False, compact=True
+    )
+
+    assert list(out.columns) == ["user_id", "event_time", "event_text", "session_id"]
+    assert out["session_id"].dtype == np.int32
+
+
+@pytest.mark.parametrize("chunksize", [1, 4, 7, 100])
+def test_stream_matches_in_memory(chunksize):
+    s = Sessionizer(inactivity_minutes=30)
+    expected = s.assign_sessions(_sample_events())
+
+    streamed = pd.concat(
+        s.stream_csv("data/raw/raw_events.csv", chunksize=chunksize)
+    )
+
+    pd.testing.assert_frame_equal(streamed, expected)
+
+
+def test_stream_rejects_unsorted_chunks():
+    df = _sample_events()
+    s = Sessionizer(inactivity_minutes=30)
+
+    chunks = [df.iloc[3:6], df.iloc[0:3]]
+    with pytest.raises(ValueError):
+        list(s.assign_sessions_stream(chunks))
+
+
+def test_stream_partitioned_chunks_match_in_memory():
+    df = _sample_events()
+    s = Sessionizer(inactivity_minutes=30)
+    expected = s.assign_sessions(df)
+
+    # 사용자가 떨어진 chunk 에 다시 나타나는 입력 (사용자 내 시간 순서만 유지)
+    chunks = [
+        df.iloc[np.r_[0:3, 12:15]],
+        df.iloc[np.r_[6:9, 3:6]],
+        df.iloc[np.r_[15:17, 9:12, 17:21]],
+    ]
+    streamed = pd.concat(s.assign_sessions_stream(chunks, sorted_users=False))
+    pd.testing.assert_frame_equal(streamed.sort_index(), expected.sort_index())
+
+    # 기본 (정렬 입력) 모드는 경계 사용자 상태만 넘기므로 이런 입력을 거부
+    with pytest.raises(ValueError):
+        list(s.assign_sessions_stream(chunks))
+
+
+def test_incremental_sessions_stable_across_runs(tmp_path):
+    df = _sample_events()
+    s = Sessionizer(inactivity_minutes=30)
+    expected = s.assign_sessions(df)
+
+    # 11:05 cutoff: user 2 의 세션이 cutoff 를 넘어 이어진다
+    cutoff = pd.Timestamp("2025-12-01 11:05:00")
+    store = SessionStateStore(str(tmp_path / "state.parquet"))
+
+    first, state = s.assign_sessions_incremental(df[df["event_time"] <= cutoff])
+    store.save(state)
+    second, _ = s.assign_sessions_incremental(
+        df[df["event_time"] > cutoff], store.load()
+    )
+
+    out = pd.concat([first, second]).sort_values(["user_id", "event_time"])
+    pd.testing.assert_series_equal(out["session_id"], expected["session_id"])
+
+
+def test_partitioned_executor_matches_single_process():
+    df = _sample_events()
+    sessions = Sessionizer().assign_sessions(df)
+    docs = SessionTextAggregator(text_col="event_text").aggregate(sessions)
+
+    out_sessions, out_docs = PartitionedSessionExecutor(n_workers=2).run(df)
+
+    pd.testing.assert_frame_equal(out_sessions, sessions)
+    pd.testing.assert_frame_equal(out_docs, docs)
+
+
+def test_aggregate_matches_lambda_join():
+    sessions = Sessionizer().assign_sessions(_sample_events())
+    docs = SessionTextAggregator(text_col="event_text").aggregate(sessions)
+
+    expected = (
+        sessions.groupby(["user_id", "session_id"])["event_text"]
+        .apply(lambda x: " ".join(x))
+        .tolist()
+    )
+    assert docs["raw_text"].tolist() == expected
+    assert docs["global_session_id"].tolist()[:2] == ["1_1", "1_2"]
+
+
+def test_text_cleaner_batch():
+    import pyarrow as pa
+
+    cleaner = TextCleaner()
+    texts = pd.Series(["View KONA hybrid 2024!", None, "view kona hybrid 2024"], index=[3, 4, 5])
+
+    out = cleaner.clean_batch(texts)
+    assert out.index.tolist() == [3, 4, 5]
+    assert out[3] == out[5] == "view kona hybrid 2024"
+    assert pd.isna(out[4])
+
+    assert cleaner.clean("Add-to Cart") == "addto cart"
+    assert cleaner.clean_batch(pa.array(["Add-to Cart"])).to_pylist() == ["addto cart"]
+    assert cleaner.clean_batch(texts.astype("category")).cat.categories.tolist() == [
+        "view kona hybrid 2024"
+    ]
+
+
+def test_categorical_event_text_matches_str():
+    df = _sample_events()
+    categorical = df.astype({"event_text": "category"})
+    aggregator = SessionTextAggregator(text_col="event_text")
+
+    expected = aggregator.aggregate(Sessionizer().assign_sessions(df))
+    out = aggregator.aggregate(Sessionizer().assign_sessions(categorical))
+    pd.testing.assert_frame_equal(out, expected)
+
+    _, token_docs = aggregator.aggregate_tokens(Sessionizer().assign_sessions(categorical))
+    assert token_docs.to_texts()[0] == "search hybrid suv deals view kona hybrid 2024 click car detail page"
+
+
+def test_parquet_store_partitioned_roundtrip(tmp_path):
+    import pyarrow as pa
+
+    sessions = Sessionizer(inactivity_minutes=30).assign_sessions(_sample_events())
+    docs = SessionTextAggregator(text_col="event_text").aggregate(sessions)
+
+    schema = pa.schema([
+        ("user_id", pa.int64()),
+        ("session_id", pa.int64()),
+        ("global_session_id", pa.string()),
+        ("cleaned_text", pa.string()),
+    ])
+    store = ParquetStore(
+        str(tmp_path / "session_docs"),
+        schema=schema,
+        partitioning={"user_bucket": lambda df: user_bucket(df["user_id"], 4)},
+        export_csv=str(tmp_path / "session_docs.csv"),
+    )
+    store.write(docs)
+    store.write(docs)  # 덮어쓰기
+
+    loaded = store.read().sort_values(["user_id", "session_id"], ignore_index=True)
+    pd.testing.assert_frame_equal(
+        loaded, docs[schema.names].reset_index(drop=True), check_dtype=False
+    )
+    assert loaded["user_id"].dtype == np.int64
+    assert (tmp_path / "session_docs.csv").exists()
+
+    # projection + 파티션 column 조건
+    bucket = int(user_bucket(docs["user_id"].iloc[:1], 4)[0])
+    subset = store.read(columns=["global_session_id"], filters=[("user_bucket", "=", bucket)])
+    expected = docs.loc[user_bucket(docs["user_id"], 4) == bucket, "global_session_id"]
+    assert list(subset.columns) == ["global_session_id"]
+    assert sorted(subset["global_session_id"]) == sorted(expected)
+
+
+def test_event_store_roundtrip(tmp_path):
+    csv_path = tmp_path / "events.csv"
+    _sample_events().to_csv(csv_path, index=False)
+
+    # chunk 경계를 넘는 dictionary 인코딩
+    store = EventStore(str(tmp_path / "store")).ingest(
+        str(csv_path), time_cols=["event_time"], chunksize=4
+    )
+    assert store.is_fresh(str(csv_path))
+
+    expected = pd.read_csv(csv_path)
+    expected["event_time"] = pd.to_datetime(expected["event_time"])
+    loaded = store.open()
+
+    assert list(loaded.columns) == list(expected.columns)
+    assert loaded["event_text"].dtype == "category"
+    assert not loaded["user_id"].to_numpy().flags.writeable  # memmap 참조
+    pd.testing.assert_frame_equal(
+        loaded.astype({"event_text": "str"}), expected, check_dtype=False
+    )
+    assert list(store.open(columns=["user_id"]).columns) == ["user_id"]
+
+    # 세션화 결과도 CSV 경로와 같음
+    pd.testing.assert_frame_equal(
+        Sessionizer(inactivity_minutes=30).assign_sessions(loaded)[["user_id", "session_id"]],
+        Sessionizer(inactivity_minutes=30).assign_sessions(expected)[["user_id", "session_id"]],
+    )
+
+    expected.iloc[:3].to_csv(csv_path, index=False)
+    assert not store.is_fresh(str(csv_path))
 
-# ====================
-#   Fill your code
-# ====================
@@ -1,5 +1,273 @@
-# Template not found for tests/test_model_pipeline.py
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse as sp
+import sklearn.cluster._kmeans as sk_kmeans
+from sklearn.metrics import davies_bouldin_score
 
-# ====================
-#   Fill your code
-# ====================
+from feature_store import k_sweep
+from feature_store.aggregator import SessionTextAggregator
+from feature_store.artifact_store import ArtifactStore
+from feature_store.clusterer import SessionClusterer
+from feature_store.intent_assigner import IntentAssigner
+from feature_store.k_sweep import KSweep
+from feature_store.session_state import SessionStateStore
+from feature_store.sessionizer import Sessionizer
+from feature_store.vectorizer import SessionVectorizer
+from pipelines import run_pipeline
+
+
+@pytest.fixture
+def sessions():
+    df = pd.read_csv("data/raw/raw_events.csv")
+    df["event_time"] = pd.to_datetime(df["event_time"])
+    return Sessionizer(inactivity_minutes=30).assign_sessions(df)
+
+
+@pytest.fixture
+def session_docs(sessions):
+    return SessionTextAggregator(text_col="event_text").aggregate(sessions)
+
+
+@pytest.mark.parametrize("max_features, ngram_range", [(500, (1, 2)), (20, (1, 2)), (None, (1, 3))])
+def test_token_docs_match_text_tfidf(sessions, session_docs, max_features, ngram_range):
+    session_keys, token_docs = SessionTextAggregator(text_col="event_text").aggregate_tokens(sessions)
+
+    assert session_keys["global_session_id"].tolist() == session_docs["global_session_id"].tolist()
+    assert token_docs.ids.dtype == np.int32
+
+    X_text, tfidf_text = SessionVectorizer(max_features, ngram_range).fit_transform(session_docs)
+    X_tok, tfidf_tok = SessionVectorizer(max_features, ngram_range).fit_transform_tokens(token_docs)
+
+    assert list(tfidf_tok.get_feature_names_out()) == list(tfidf_text.get_feature_names_out())
+    np.testing.assert_allclose(X_tok.toarray(), X_text.toarray())
+
+    # token 경로로 fit 한 vectorizer 도 raw text transform 가능
+    X_new = tfidf_tok.transform(session_docs["cleaned_text"])
+    np.testing.assert_allclose(X_new.toarray(), X_text.toarray())
+
+
+def test_hashing_mode_streams_idf(session_docs):
+    full = SessionVectorizer(mode="hashing", n_features=2 ** 12)
+    X_full, _ = full.fit_transform(session_docs)
+
+    # chunk 별 partial_fit 후 chunk 별 독립 변환 → 전체 fit 과 같은 결과
+    streamed = SessionVectorizer(mode="hashing", n_features=2 ** 12)
+    for start in range(0, len(session_docs), 2):
+        streamed.partial_fit(session_docs.iloc[start:start + 2])
+    chunks = [session_docs.iloc[:3]["cleaned_text"], session_docs.iloc[3:]["cleaned_text"]]
+    X_chunks = streamed.vectorizer.transform_chunks(chunks)
+
+    assert X_full.shape == (len(session_docs), 2 ** 12)
+    np.testing.assert_allclose(
+        np.vstack([X.toarray() for X in X_chunks]), X_full.toarray()
+    )
+
+    # fit_transform / fit 을 다시 호출하면 document frequency 를 누적하지 않고 새로 학습
+    idf = full.vectorizer.idf_
+    X_refit, _ = full.fit_transform(session_docs)
+    np.testing.assert_allclose(full.vectorizer.idf_, idf)
+    np.testing.assert_allclose(X_refit.toarray(), X_full.toarray())
+    full.vectorizer.fit(session_docs["cleaned_text"])
+    assert full.vectorizer.n_docs_ == len(session_docs)
+    np.testing.assert_allclose(full.vectorizer.idf_, idf)
+
+    # fit 은 sklearn 처럼 문서 목록, fit_chunks 는 chunk 들의 iterable
+    assert full.vectorizer.fit(["a b c", "d e f"]).n_docs_ == 2
+    text_chunks = (session_docs["cleaned_text"].iloc[i:i + 2] for i in range(0, len(session_docs), 2))
+    np.testing.assert_allclose(full.vectorizer.fit_chunks(text_chunks).idf_, idf)
+
+    labels = SessionClusterer(n_clusters=2).fit_predict(X_full)
+    assert len(labels) == len(session_docs)
+
+
+@pytest.mark.parametrize("mode", ["tfidf", "hashing"])
+def test_artifact_store_roundtrip(session_docs, tmp_path, mode):
+    vectorizer = SessionVectorizer(mode=mode, n_features=2 ** 12)
+    X, _ = vectorizer.fit_transform(session_docs)
+    clusterer = SessionClusterer(n_clusters=2)
+    labels = clusterer.fit_predict(X)
+
+    store = ArtifactStore(tmp_path / "artifacts")
+    version = store.save(vectorizer, clusterer)
+    assert store.latest() == version
+    assert store.load_manifest()["vectorizer"]["mode"] == mode
+
+    loaded_vectorizer, loaded_clusterer = store.load()
+    X_loaded = loaded_vectorizer.transform(session_docs)
+
+    np.testing.assert_allclose(X_loaded.toarray(), X.toarray())
+    assert loaded_clusterer.predict(X_loaded).tolist() == list(labels)
+
+    # 연달아 저장해도 (같은 초 안) 버전이 겹치지 않고 생성 순서대로 정렬
+    again = store.save(vectorizer, clusterer)
+    assert again != version
+    assert store.versions() == [version, again]
+    assert store.latest() == again
+
+    with pytest.raises(FileExistsError):
+        store.save(vectorizer, clusterer, version=again)
+
+
+def test_minibatch_backend_streams_and_warm_starts(session_docs, tmp_path):
+    vectorizer = SessionVectorizer(mode="hashing", n_features=2 ** 12)
+    X, _ = vectorizer.fit_transform(session_docs)
+
+    full = SessionClusterer(n_clusters=2)
+    labels = full.fit_predict(X)
+    report = full.evaluate(X, labels)
+    assert report["inertia"] == pytest.approx(full.model.inertia_)
+    assert report["fit_seconds"] > 0
+
+    store = ArtifactStore(tmp_path / "artifacts")
+    store.save(vectorizer, full)
+    init = store.load_centroids(vectorizer.vectorizer.get_feature_names_out())
+    np.testing.assert_allclose(init, full.cluster_centers_)
+
+    streamed = SessionClusterer(n_clusters=2, backend="minibatch", batch_size=2, init_centroids=init)
+    streamed.fit_stream(X[i:i + 2] for i in range(0, X.shape[0], 2))
+    assert streamed.cluster_centers_.shape == full.cluster_centers_.shape
+    assert streamed.evaluate(X)["inertia"] >= 0
+
+    with pytest.raises(ValueError):
+        full.partial_fit(X)
+
+
+def test_warm_start_centroids_follow_vocabulary(session_docs, tmp_path):
+    vectorizer = SessionVectorizer(max_features=500, ngram_range=(1, 1))
+    X, tfidf = vectorizer.fit_transform(session_docs)
+    clusterer = SessionClusterer(n_clusters=2)
+    clusterer.fit_predict(X)
+
+    store = ArtifactStore(tmp_path / "artifacts")
+    store.save(vectorizer, clusterer)
+
+    # 새 vocabulary: 기존 term 순서를 뒤집고 처음 보는 term 하나 추가
+    old_terms = list(tfidf.get_feature_names_out())
+    new_terms = ["zzz_new_term"] + old_terms[::-1]
+    aligned = store.load_centroids(new_terms)
+
+    np.testing.assert_array_equal(aligned[:, 0], 0)
+    np.testing.assert_allclose(aligned[:, 1:], clusterer.cluster_centers_[:, ::-1])
+
+
+def test_intent_assigner_matches_clusterer(session_docs, tmp_path):
+    vectorizer = SessionVectorizer(mode="hashing", n_features=2 ** 12)
+    X, _ = vectorizer.fit_transform(session_docs)
+    clusterer = SessionClusterer(n_clusters=3)
+    labels = clusterer.fit_predict(X)
+
+    store = ArtifactStore(tmp_path / "artifacts")
+    store.save(vectorizer, clusterer)
+
+    exact = IntentAssigner.from_artifacts(str(tmp_path / "artifacts"), batch_size=2)
+    assigned, dist = exact.assign(session_docs, return_distance=True)
+    assert assigned.tolist() == list(labels)
+    assert dist.sum() == pytest.approx(clusterer.evaluate(X, labels)["inertia"], rel=1e-4)
+    assert exact.assign(session_docs["cleaned_text"]).tolist() == list(labels)
+
+    # 모든 list 를 probe 하면 근사 인덱스도 exact 와 같은 결과
+    approx = IntentAssigner(vectorizer, clusterer.cluster_centers_, n_lists=2, n_probe=2)
+    assert approx.assign(X).tolist() == list(labels)
+
+    with pytest.raises(ValueError):
+        IntentAssigner(vectorizer, clusterer.cluster_centers_, n_lists=4)
+
+
+def test_intent_assigner_approx_handles_empty_rows():
+    rng = np.random.default_rng(0)
+    centroids = rng.random((12, 50))
+    # 빈 행이 batch 중간과 끝에 있어도 모든 list 를 probe 하면 exact 와 같아야 함
+    X = sp.random(30, 50, density=0.2, format="csr", random_state=0)
+    X = sp.vstack([X[:10], sp.csr_matrix((2, 50)), X[10:], sp.csr_matrix((3, 50))], format="csr")
+
+    exact = IntentAssigner(None, centroids)
+    approx = IntentAssigner(None, centroids, n_lists=4, n_probe=4)
+
+    exact_labels, exact_dist = exact.assign(X, return_distance=True)
+    approx_labels, approx_dist = approx.assign(X, return_distance=True)
+    assert approx_labels.tolist() == exact_labels.tolist()
+    np.testing.assert_allclose(approx_dist, exact_dist, rtol=1e-5, atol=1e-5)
+
+
+def test_k_sweep_shares_matrix_across_workers(session_docs):
+    X, _ = SessionVectorizer(mode="hashing", n_features=2 ** 12).fit_transform(session_docs)
+
+    clusterer = SessionClusterer(n_clusters=2)
+    labels = clusterer.fit_predict(X)
+    assert clusterer.evaluate(X, labels)["davies_bouldin"] == pytest.approx(
+        davies_bouldin_score(X.toarray(), labels), rel=1e-6
+    )
+
+    serial = KSweep(range(1, 10), n_workers=1).run(X)
+    best, best_labels, report = SessionClusterer.select_k(X, range(1, 10), n_workers=2)
+
+    # k=1 과 k >= n_samples 는 제외
+    assert report["k"].tolist() == list(range(2, len(session_docs)))
+    assert report["selected"].sum() == 1
+    pd.testing.assert_frame_equal(
+        report.drop(columns="fit_seconds"), serial[2].drop(columns="fit_seconds")
+    )
+
+    chosen = report.loc[report["selected"]].iloc[0]
+    assert chosen["silhouette"] == report["silhouette"].max()
+    assert best.n_clusters == chosen["k"]
+    assert len(best_labels) == len(session_docs)
+
+    elbow = KSweep(range(2, 5), n_workers=1, criterion="elbow").run(X)[2]
+    assert elbow["selected"].sum() == 1
+
+
+def test_pipeline_saves_state_only_after_session_docs(session_docs, tmp_path, monkeypatch):
+    for name in ["SESSION_DOCS_PATH", "SESSION_DOCS_CSV_PATH", "SESSION_STATE_PATH", "ARTIFACT_ROOT"]:
+        monkeypatch.setattr(run_pipeline, name, str(tmp_path / name.lower()))
+
+    raw = pd.read_csv("data/raw/raw_events.csv")
+    cutoff = raw["event_time"] <= "2025-12-01 11:05:00"
+    raw[cutoff].to_csv(tmp_path / "first.csv", index=False)
+    raw[~cutoff].to_csv(tmp_path / "second.csv", index=False)
+
+    run_pipeline.main(str(tmp_path / "first.csv"), n_clusters=2)
+    state_store = SessionStateStore(run_pipeline.SESSION_STATE_PATH)
+    saved = state_store.load()
+
+    # 세션화 이후 단계 (clustering) 가 실패하면 상태는 이전 실행 그대로
+    with pytest.raises(ValueError):
+        run_pipeline.main(str(tmp_path / "second.csv"), incremental=True, n_clusters=50)
+    pd.testing.assert_frame_equal(state_store.load(), saved)
+
+    # 같은 입력으로 다시 실행하면 한 번에 처리한 결과와 같은 session_docs
+    run_pipeline.main(str(tmp_path / "second.csv"), incremental=True, n_clusters=2)
+    docs = run_pipeline.session_docs_store().read().sort_values("global_session_id", ignore_index=True)
+    full = session_docs.sort_values("global_session_id", ignore_index=True)
+    assert docs["global_session_id"].tolist() == full["global_session_id"].tolist()
+    assert docs["raw_text"].tolist() == full["raw_text"].tolist()
+
+
+def test_k_sweep_workers_fit_without_copying_matrix(session_docs, monkeypatch):
+    X, _ = SessionVectorizer(mode="hashing", n_features=2 ** 12).fit_transform(session_docs)
+
+    loaded, fitted = [], []
+    load_shared_csr = k_sweep._load_shared_csr
+    lloyd = sk_kmeans._kmeans_single_lloyd
+
+    def record_load(*args):
+        loaded.append(load_shared_csr(*args))
+        return loaded[-1]
+
+    def record_fit(X_fit, *args, **kwargs):
+        fitted.append(X_fit)
+        return lloyd(X_fit, *args, **kwargs)
+
+    monkeypatch.setattr(k_sweep, "_load_shared_csr", record_load)
+    monkeypatch.setattr(sk_kmeans, "_kmeans_single_lloyd", record_fit)
+
+    KSweep([2, 3], n_workers=1).run(X)
+
+    # KMeans 가 받은 행렬이 worker 가 memory-map 한 배열 그 자체 (복사 없음)
+    assert len(loaded) == 2 and fitted
+    for X_fit in fitted:
+        assert any(
+            np.shares_memory(X_fit.data, X_map.data) and np.shares_memory(X_fit.indices, X_map.indices)
+            for X_map in loaded
+        )